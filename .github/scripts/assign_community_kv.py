@@ -3,19 +3,27 @@
 Assign Community Known Values to the Registry
 
 This script processes validated request files and adds entries to the community registry.
-It assumes validation has already passed (code points are valid and available).
+It assumes validation has already passed (code points are valid and available). If a
+code point was assigned since validation, for instance by a concurrent merge, the script
+exits with an error and leaves the registry unchanged.
 
 Usage:
     python assign_community_kv.py --registry <json_path> --markdown <md_path> --files <file1> [file2 ...] --pr <number>
 """
 
 import argparse
+import bisect
 import json
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+# The shared Known Value index lives with the assigner
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "known-values-assigner"))
+
+from known_value_index import BinaryRegistry, KnownValue, KnownValueIndex  # noqa: E402
+
 
 def load_registry(registry_path: Path) -> dict[str, Any]:
     """Load the community registry JSON file."""
@@ -46,12 +54,21 @@ def load_request_file(file_path: Path) -> dict[str, Any] | None:
         return None
 
 
+def find_assigned_codepoints(request_data: dict[str, Any], assigned: dict[int, KnownValue]) -> list[str]:
+    """Describe each requested code point that is already assigned, for instance by a concurrent request."""
+    return [
+        f"codepoint {entry['codepoint']} for '{entry['name']}' is already assigned to '{assigned[entry['codepoint']].name}'"
+        for entry in request_data.get("entries", [])
+        if entry["codepoint"] in assigned
+    ]
+
+
 def add_entries_to_registry(
     registry: dict[str, Any],
     request_data: dict[str, Any],
     pr_number: int | None,
 ) -> int:
-    """Add entries from a request to the registry. Returns count of entries added."""
+    """Add entries from a request to the registry, keeping it sorted by code point. Returns count of entries added."""
     request_info = request_data.get("request", {})
     entries = request_data.get("entries", [])
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
@@ -79,17 +96,12 @@ def add_entries_to_registry(
         if request_info.get("url"):
             registry_entry["source"]["url"] = request_info["url"]
 
-        registry["entries"].append(registry_entry)
+        bisect.insort(registry["entries"], registry_entry, key=lambda e: e["codepoint"])
         added += 1
 
     return added
 
 
-def sort_entries(registry: dict[str, Any]):
-    """Sort registry entries by code point."""
-    registry["entries"].sort(key=lambda e: e["codepoint"])
-
-
 def update_metadata(registry: dict[str, Any]):
     """Update registry metadata (timestamp)."""
     registry["generated"]["last_updated"] = datetime.now(timezone.utc).isoformat()
@@ -230,11 +242,16 @@ def main():
         print("No files to process.")
         sys.exit(0)
 
-    # Load registry
+    # Load registry, and index it with every other registry beside it
     registry = load_registry(args.registry)
+    others = KnownValueIndex.registry_files(args.registry.parent)
+    others.pop(args.registry.stem, None)
+    index = KnownValueIndex.from_files(others.values())
+    index.add_registry(args.registry.stem, registry)
 
     # Process each request file
     total_added = 0
+    conflicts = []
     for file_str in files:
         file_path = Path(file_str)
         if not file_path.exists():
@@ -245,17 +262,28 @@ def main():
         if request_data is None:
             continue
 
+        assigned = {value.codepoint: value for value in index.values(args.registry.stem)}
+        taken = find_assigned_codepoints(request_data, assigned)
+        if taken:
+            conflicts.extend(f"{file_path}: {message}" for message in taken)
+            continue
+
         added = add_entries_to_registry(registry, request_data, args.pr)
+        index.add_registry(args.registry.stem, registry)
         total_added += added
         print(f"Added {added} entries from {file_path}")
 
+    # Apply requests completely or not at all
+    if conflicts:
+        for conflict in conflicts:
+            print(f"Error: {conflict}", file=sys.stderr)
+        print("The registry was not updated.", file=sys.stderr)
+        sys.exit(1)
+
     if total_added == 0:
         print("No entries were added.")
         sys.exit(0)
 
-    # Sort entries
-    sort_entries(registry)
-
     # Update metadata
     update_metadata(registry)
 
@@ -267,6 +295,11 @@ def main():
     generate_markdown(registry, args.markdown)
     print(f"Generated Markdown at {args.markdown}")
 
+    # Export every registry, the updated community one included, for binary lookups
+    binary_path = args.registry.parent.parent / "binary" / BinaryRegistry.FILENAME
+    index.save_binary(binary_path)
+    print(f"Saved binary registry to {binary_path}")
+
     print(f"Successfully added {total_added} entries to the community registry.")
 
 
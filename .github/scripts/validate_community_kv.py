@@ -18,6 +18,11 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
+# The shared Known Value index lives with the assigner
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "known-values-assigner"))
+
+from known_value_index import KnownValue, KnownValueIndex  # noqa: E402
+
 # JSON Schema for request files (embedded)
 REQUEST_SCHEMA = {
     "$schema": "http://json-schema.org/draft-07/schema#",
@@ -91,27 +96,19 @@ class ValidationResult:
         return len(self.errors) == 0
 
 
-def load_registry(registry_path: Path) -> dict[str, Any]:
-    """Load the community registry JSON file."""
-    if not registry_path.exists():
-        return {"entries": []}
-    with open(registry_path) as f:
-        return json.load(f)
-
-
-def get_assigned_codepoints(registry: dict[str, Any]) -> set[int]:
-    """Extract all assigned code points from the registry."""
-    return {entry["codepoint"] for entry in registry.get("entries", [])}
-
+def load_index(registry_path: Path) -> KnownValueIndex:
+    """Index the community registry for the availability checks.
 
-def get_assigned_names(registry: dict[str, Any]) -> set[str]:
-    """Extract all assigned canonical names from the registry."""
-    return {entry["name"] for entry in registry.get("entries", [])}
+    Only the community registry file is read: code points, names and URIs must not
+    already be assigned in the community registry. A registry that does not exist
+    yet has no values.
+    """
+    return KnownValueIndex.from_files([registry_path] if registry_path.exists() else [])
 
 
-def get_assigned_uris(registry: dict[str, Any]) -> set[str]:
-    """Extract all assigned URIs from the registry."""
-    return {entry["uri"] for entry in registry.get("entries", []) if entry.get("uri")}
+def describe_owner(value: KnownValue) -> str:
+    """Name the registry entry that already holds a code point, name or URI."""
+    return f"{value.registry} as {value.codepoint} '{value.name}'"
 
 
 def validate_json_syntax(file_path: Path, result: ValidationResult) -> dict[str, Any] | None:
@@ -254,17 +251,18 @@ def validate_codepoint_minimum(
 def validate_codepoint_availability(
     entries: list[dict[str, Any]],
     file_path: str,
-    assigned_codepoints: set[int],
+    index: KnownValueIndex,
     result: ValidationResult,
 ):
     """V-102: Each codepoint must not already be assigned."""
     for i, entry in enumerate(entries):
         codepoint = entry.get("codepoint")
-        if codepoint is not None and codepoint in assigned_codepoints:
+        owner = index.by_codepoint.get(codepoint) if isinstance(codepoint, int) else None
+        if owner is not None:
             result.add_error(
                 "V-102",
                 file_path,
-                f"Codepoint {codepoint} is already assigned in the registry",
+                f"Codepoint {codepoint} is already assigned in {describe_owner(owner)}",
                 entry_index=i,
                 field="codepoint",
             )
@@ -294,17 +292,18 @@ def validate_codepoint_uniqueness_within_request(
 def validate_name_availability(
     entries: list[dict[str, Any]],
     file_path: str,
-    assigned_names: set[str],
+    index: KnownValueIndex,
     result: ValidationResult,
 ):
     """V-200: name must not already exist in the registry."""
     for i, entry in enumerate(entries):
         name = entry.get("name", "")
-        if name in assigned_names:
+        owner = index.by_name.get(name) if isinstance(name, str) else None
+        if owner is not None:
             result.add_error(
                 "V-200",
                 file_path,
-                f"Canonical name '{name}' is already assigned in the registry",
+                f"Canonical name '{name}' is already assigned in {describe_owner(owner)}",
                 entry_index=i,
                 field="name",
             )
@@ -313,17 +312,18 @@ def validate_name_availability(
 def validate_uri_availability(
     entries: list[dict[str, Any]],
     file_path: str,
-    assigned_uris: set[str],
+    index: KnownValueIndex,
     result: ValidationResult,
 ):
     """V-201: uri (if provided) must not already exist in the registry."""
     for i, entry in enumerate(entries):
         uri = entry.get("uri")
-        if uri and uri in assigned_uris:
+        owner = index.by_uri.get(uri) if uri and isinstance(uri, str) else None
+        if owner is not None:
             result.add_error(
                 "V-201",
                 file_path,
-                f"URI '{uri}' is already assigned in the registry",
+                f"URI '{uri}' is already assigned in {describe_owner(owner)}",
                 entry_index=i,
                 field="uri",
             )
@@ -392,9 +392,7 @@ def validate_filename_date(file_path: Path, result: ValidationResult) -> bool:
 
 def validate_request_file(
     file_path: Path,
-    assigned_codepoints: set[int],
-    assigned_names: set[str],
-    assigned_uris: set[str],
+    index: KnownValueIndex,
     result: ValidationResult,
 ):
     """Validate a single request file against all rules."""
@@ -430,16 +428,16 @@ def validate_request_file(
     validate_codepoint_minimum(entries, file_str, result)
 
     # V-102: codepoint availability
-    validate_codepoint_availability(entries, file_str, assigned_codepoints, result)
+    validate_codepoint_availability(entries, file_str, index, result)
 
     # V-103: codepoint uniqueness within request
     validate_codepoint_uniqueness_within_request(entries, file_str, result)
 
     # V-200: name availability
-    validate_name_availability(entries, file_str, assigned_names, result)
+    validate_name_availability(entries, file_str, index, result)
 
     # V-201: uri availability
-    validate_uri_availability(entries, file_str, assigned_uris, result)
+    validate_uri_availability(entries, file_str, index, result)
 
     # V-202: name uniqueness within request
     validate_name_uniqueness_within_request(entries, file_str, result)
@@ -497,11 +495,8 @@ def main():
         print("No files to validate.")
         sys.exit(0)
 
-    # Load registry
-    registry = load_registry(args.registry)
-    assigned_codepoints = get_assigned_codepoints(registry)
-    assigned_names = get_assigned_names(registry)
-    assigned_uris = get_assigned_uris(registry)
+    # Index the community registry
+    index = load_index(args.registry)
 
     # Validate each file
     result = ValidationResult()
@@ -510,7 +505,7 @@ def main():
         if not file_path.exists():
             result.add_error("V-001", file_str, f"File does not exist: {file_str}")
             continue
-        validate_request_file(file_path, assigned_codepoints, assigned_names, assigned_uris, result)
+        validate_request_file(file_path, index, result)
 
     # Generate report
     report = generate_report(result, files)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark codepoint lookups in the binary registry against the JSON registries.
+
+Times opening the full registry set and looking up every assigned codepoint,
+once by loading each *_registry.json file with json.load into a dict and once
+by memory-mapping the binary registry exported from the same files. Also
+reports the peak traced memory of each path. Pass --json-dir to use another
+registry directory.
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from known_value_index import BinaryRegistry, KnownValueIndex  # noqa: E402
+
+
+def open_json(json_dir: Path) -> dict:
+    """Load every registry the way consumers without the binary registry do."""
+    by_codepoint = {}
+    for path in sorted(json_dir.glob("*_registry.json")):
+        with open(path, "r", encoding="utf-8") as f:
+            for entry in json.load(f).get("entries", []):
+                by_codepoint.setdefault(entry["codepoint"], entry)
+    return by_codepoint
+
+
+def measure(func, repeat: int) -> tuple[float, int]:
+    """Return the fastest of ``repeat`` timed calls and the peak traced memory of one call."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return min(times), peak
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--json-dir", type=Path,
+                        default=Path(__file__).parent.parent.parent / "known-value-assignments" / "json",
+                        help="Directory of *_registry.json files (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per path (default: 5)")
+    args = parser.parse_args()
+
+    index = KnownValueIndex.from_directory(args.json_dir)
+    codepoints = sorted(index.by_codepoint)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / BinaryRegistry.FILENAME
+        index.save_binary(path)
+
+        with BinaryRegistry(path) as binary:
+            registry = open_json(args.json_dir)
+            if any(binary.name(c) != registry[c].get("name", "") for c in codepoints):
+                print("MISMATCH: binary and JSON registries name codepoints differently", file=sys.stderr)
+                return 1
+
+            def open_binary():
+                BinaryRegistry(path).close()
+
+            def find_all():
+                find = binary.find
+                for c in codepoints:
+                    find(c)
+
+            def get_all():
+                for c in codepoints:
+                    registry.get(c)
+
+            json_open = measure(lambda: open_json(args.json_dir), args.repeat)
+            binary_open = measure(open_binary, args.repeat)
+            json_lookup = measure(get_all, args.repeat)
+            binary_lookup = measure(find_all, args.repeat)
+        size = path.stat().st_size
+
+    print(f"Registries: {args.json_dir} ({len(codepoints)} codepoints, binary {size / 1e6:.2f} MB)")
+    for label, (seconds, peak) in (("open, json.load", json_open), ("open, mmap", binary_open)):
+        print(f"  {label:<22} {seconds * 1000:9.3f} ms  peak {peak / 1e6:8.3f} MB")
+    for label, (seconds, peak) in (("lookup, dict", json_lookup), ("lookup, binary search", binary_lookup)):
+        print(f"  {label:<22} {seconds / len(codepoints) * 1e9:9.1f} ns  peak {peak / 1e6:8.3f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
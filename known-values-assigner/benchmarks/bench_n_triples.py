@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark parallel N-Triples ingestion against a single reader.
+
+Times the extraction of a large N-Triples dump with one reader and with the dump
+split into line ranges across worker processes, after checking that every
+worker count yields the same concepts. By default a synthetic dump shaped like
+gs1Voc.ttl is written to a temporary file; pass --source to benchmark a real
+N-Triples or N-Quads file, and --scale to grow the synthetic dump.
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from known_value_assigner import (  # noqa: E402
+    DataFormat,
+    OntologyConfig,
+    OntologyFetcher,
+    ProcessingStrategy,
+    SourceDocument,
+    StandardRDFParser,
+)
+
+GS1 = "https://gs1.org/voc/"
+RDF_TYPE = "<http://www.w3.org/1999/02/22-rdf-syntax-ns#type>"
+RDFS = "http://www.w3.org/2000/01/rdf-schema#"
+OWL = "http://www.w3.org/2002/07/owl#"
+
+
+def synthetic_dump(path: Path, scale: int = 10) -> None:
+    """Write an N-Triples dump with the statement shapes found in gs1Voc.ttl."""
+    classes = 600 * scale
+    with open(path, "w", encoding="utf-8") as out:
+        for i in range(classes):
+            out.write(f"<{GS1}Class{i}> {RDF_TYPE} <{OWL}Class> .\n"
+                      f"<{GS1}Class{i}> <{RDFS}label> \"Class {i}\"@en .\n"
+                      f"<{GS1}Class{i}> <{RDFS}comment> \"A description of class {i}.\"@en .\n"
+                      f"<{GS1}Class{i}> <{RDFS}subClassOf> <{GS1}Class{i // 2}> .\n")
+        for i in range(1500 * scale):
+            out.write(f"<{GS1}property{i}> {RDF_TYPE} <http://www.w3.org/1999/02/22-rdf-syntax-ns#Property> .\n"
+                      f"<{GS1}property{i}> <{RDFS}label> \"property {i}\"@en .\n"
+                      f"<{GS1}property{i}> <{RDFS}comment> \"Property {i}.\\nSpans two lines.\"@en .\n"
+                      f"<{GS1}property{i}> <http://schema.org/domainIncludes> <{GS1}Class{i % classes}> .\n")
+        for i in range(3000 * scale):
+            out.write(f"<{GS1}Code{i}> {RDF_TYPE} <{GS1}Code> .\n"
+                      f"<{GS1}Code{i}> <{RDFS}label> \"Code {i}\"@en .\n")
+
+
+def best_of(func, repeat: int) -> float:
+    """Return the fastest of ``repeat`` timed calls."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", type=Path, help="N-Triples or N-Quads file to parse (default: synthetic)")
+    parser.add_argument("--quads", action="store_true", help="Read --source as N-Quads")
+    parser.add_argument("--scale", type=int, default=10, help="Synthetic dump size multiplier (default: 10)")
+    parser.add_argument("--workers", type=int, action="append",
+                        help="Worker count to time (repeatable; default: 1, 2, 4, ... up to the CPU count)")
+    parser.add_argument("--range-size", type=int, default=4 << 20,
+                        help="Bytes per line range (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per worker count (default: 3)")
+    args = parser.parse_args()
+
+    cpus = os.cpu_count() or 1
+    workers = args.workers or sorted({1, *(2 ** i for i in range(1, cpus.bit_length())), cpus})
+    config = OntologyConfig(
+        name="benchmark",
+        source_url=GS1,
+        start_code_point=0,
+        data_format=DataFormat.N_QUADS if args.quads else DataFormat.N_TRIPLES,
+        strategy=ProcessingStrategy.STANDARD_RDF,
+    )
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = args.source
+        if path is None:
+            path = Path(tmpdir) / "synthetic.nt"
+            synthetic_dump(path, args.scale)
+        data = path.read_bytes()
+        source = SourceDocument(url=GS1, sha256=hashlib.sha256(data).hexdigest(), size=len(data), path=path)
+        del data
+
+        fetcher = OntologyFetcher(Path(tmpdir), use_cache=False)
+        expected = None
+        results = []
+        for count in workers:
+            rdf_parser = StandardRDFParser(fetcher, max_workers=count)
+            rdf_parser.LINE_RANGE_SIZE = args.range_size
+            concepts = rdf_parser.extract(source, config)
+            if expected is None:
+                expected = concepts
+            elif concepts != expected:
+                print(f"MISMATCH with {count} workers: concepts differ from a single reader", file=sys.stderr)
+                return 1
+            results.append((count, best_of(lambda: rdf_parser.extract(source, config), args.repeat)))
+
+    print(f"Source: {args.source or f'synthetic x{args.scale}'} ({source.size / 1e6:.1f} MB, "
+          f"{len(expected)} concepts, {cpus} CPUs)")
+    baseline = results[0][1]
+    for count, elapsed in results:
+        print(f"  {count:3d} workers: {elapsed * 1000:9.1f} ms  {baseline / elapsed:5.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
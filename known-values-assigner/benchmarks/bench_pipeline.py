@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Benchmark each stage of the ingest pipeline on synthetic ontologies.
+
+`run` generates ontologies of each requested size in RDF/XML, Turtle, Schema.org
+JSON-LD (@graph) and JSON-LD context form, then times StandardRDFParser,
+SchemaOrgParser, ContextMapParser, _assign_known_values and write_registry
+separately. Each case reports its fastest wall-clock time, the peak traced memory
+of one further call and concepts per second, and the results can be saved as a
+JSON baseline. `compare` checks a later result file against a baseline and exits
+non-zero if any case got slower, or used more memory, beyond a threshold.
+
+Everything is generated locally, so the suite runs without network access:
+
+    bench_pipeline.py run --output baseline.json
+    bench_pipeline.py run --output current.json
+    bench_pipeline.py compare baseline.json current.json --threshold 0.1
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from known_value_assigner import (  # noqa: E402
+    TOOL_VERSION,
+    ContextMapParser,
+    DataFormat,
+    KnownValueAssigner,
+    OntologyConfig,
+    OntologyFetcher,
+    ProcessingStrategy,
+    SchemaOrgParser,
+    SourceDocument,
+    StandardRDFParser,
+    get_ontology_by_id,
+)
+from bench_schema_org import synthetic_dump  # noqa: E402
+
+EX = "http://example.org/bench#"
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+RDF_XML_HEADER = f"""<?xml version="1.0" encoding="utf-8"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+         xmlns:rdfs="http://www.w3.org/2000/01/rdf-schema#"
+         xmlns:owl="http://www.w3.org/2002/07/owl#"
+         xml:base="{EX[:-1]}">
+"""
+
+TURTLE_HEADER = f"""@prefix ex: <{EX}> .
+@prefix owl: <http://www.w3.org/2002/07/owl#> .
+@prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+
+"""
+
+
+def rdf_xml_chunks(concepts: int):
+    """Yield an RDF/XML ontology of ``concepts`` classes and properties."""
+    yield RDF_XML_HEADER
+    classes = concepts // 2
+    for i in range(classes):
+        yield f"""  <owl:Class rdf:about="{EX}Class{i}">
+    <rdfs:label xml:lang="en">Class {i}</rdfs:label>
+    <rdfs:comment>Description of class {i}.</rdfs:comment>
+    <rdfs:subClassOf rdf:resource="{EX}Class{i // 2}"/>
+  </owl:Class>
+"""
+    for i in range(concepts - classes):
+        yield f"""  <owl:ObjectProperty rdf:about="{EX}property{i}">
+    <rdfs:label>property {i}</rdfs:label>
+    <rdfs:domain rdf:resource="{EX}Class{i % max(classes, 1)}"/>
+  </owl:ObjectProperty>
+"""
+    yield "</rdf:RDF>\n"
+
+
+def turtle_chunks(concepts: int):
+    """Yield a Turtle vocabulary of ``concepts`` classes and properties."""
+    yield TURTLE_HEADER
+    classes = concepts // 2
+    for i in range(classes):
+        yield (f'ex:Class{i} a owl:Class ;\n    rdfs:label "Class {i}"@en ;\n'
+               f'    rdfs:comment "Description of class {i}." ;\n    rdfs:subClassOf ex:Class{i // 2} .\n\n')
+    for i in range(concepts - classes):
+        yield (f'ex:property{i} a rdf:Property ;\n    rdfs:label "property {i}" ;\n'
+               f'    rdfs:domain ex:Class{i % max(classes, 1)} .\n\n')
+
+
+def json_ld_graph_chunks(concepts: int):
+    """Yield a Schema.org-shaped JSON-LD ``@graph`` dump of ``concepts`` nodes."""
+    classes = concepts // 2
+    yield synthetic_dump(classes, concepts - classes - 1)
+
+
+def json_ld_context_chunks(concepts: int):
+    """Yield a JSON-LD context defining ``concepts`` terms."""
+    context = {"@version": 1.1, "@protected": True, "ex": EX}
+    for i in range(concepts - 1):
+        context[f"term{i}"] = {"@id": f"ex:term{i}", "@type": "@id"} if i % 2 else f"ex:term{i}"
+    yield json.dumps({"@context": context}, indent=2)
+
+
+# format -> (file suffix, generator, data format)
+GENERATORS = {
+    "rdf-xml": (".rdf", rdf_xml_chunks, DataFormat.RDF_XML),
+    "turtle": (".ttl", turtle_chunks, DataFormat.TURTLE),
+    "json-ld-graph": (".jsonld", json_ld_graph_chunks, DataFormat.JSON_LD),
+    "json-ld-context": (".jsonld", json_ld_context_chunks, DataFormat.JSON_LD),
+}
+
+
+def write_source(directory: Path, fmt: str, concepts: int) -> SourceDocument:
+    """Generate a synthetic ontology to a file and return it as a source."""
+    suffix, chunks, _ = GENERATORS[fmt]
+    path = directory / f"{fmt}-{concepts}{suffix}"
+    digest = hashlib.sha256()
+    with open(path, "wb") as out:
+        for chunk in chunks(concepts):
+            data = chunk.encode("utf-8")
+            digest.update(data)
+            out.write(data)
+    return SourceDocument(url=f"{EX}{fmt}", sha256=digest.hexdigest(), size=path.stat().st_size, path=path)
+
+
+def measure(func, repeat: int) -> tuple[float, int]:
+    """Return the fastest of ``repeat`` timed calls and the peak traced memory of one call."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return min(times), peak
+
+
+def bench_config(name: str, fmt: str, strategy: ProcessingStrategy) -> OntologyConfig:
+    return OntologyConfig(
+        name=name,
+        source_url=f"{EX}{fmt}",
+        start_code_point=100000,
+        data_format=GENERATORS[fmt][2],
+        strategy=strategy,
+    )
+
+
+def run_size(tmpdir: Path, concepts: int, repeat: int, selected) -> dict[str, dict]:
+    """Time every selected case at one size; returns results keyed by case name."""
+    fetcher = OntologyFetcher(tmpdir / "cache", use_cache=False)
+    rdf_config = bench_config("bench", "rdf-xml", ProcessingStrategy.STANDARD_RDF)
+    parsed = {}
+    cases = [
+        ("StandardRDFParser/rdf-xml", "rdf-xml", StandardRDFParser(fetcher), rdf_config),
+        ("StandardRDFParser/turtle", "turtle", StandardRDFParser(fetcher),
+         bench_config("bench", "turtle", ProcessingStrategy.STANDARD_RDF)),
+        ("SchemaOrgParser/json-ld-graph", "json-ld-graph", SchemaOrgParser(fetcher), get_ontology_by_id("schema")),
+        ("ContextMapParser/json-ld-context", "json-ld-context", ContextMapParser(fetcher),
+         bench_config("bench", "json-ld-context", ProcessingStrategy.CONTEXT_MAP)),
+    ]
+
+    results = {}
+    for name, fmt, parser, config in cases:
+        if not selected(name) and not (fmt == "rdf-xml" and (selected("assign") or selected("write_registry"))):
+            continue
+        source = write_source(tmpdir, fmt, concepts)
+        concepts_found = parser.extract(source, config)
+        parsed[fmt] = concepts_found
+        if selected(name):
+            seconds, peak = measure(lambda: parser.extract(source, config), repeat)
+            results[f"{name}/{concepts}"] = result(seconds, peak, len(concepts_found), source.size)
+        source.path.unlink()
+
+    if "rdf-xml" in parsed:
+        assigner = KnownValueAssigner(output_dir=tmpdir / "out", cache_dir=tmpdir / "cache", use_cache=False)
+        concepts_found = parsed["rdf-xml"]
+        entries = assigner._assign_known_values(concepts_found, rdf_config)
+        if selected("assign"):
+            seconds, peak = measure(lambda: assigner._assign_known_values(concepts_found, rdf_config), repeat)
+            results[f"assign/{concepts}"] = result(seconds, peak, len(entries))
+        if selected("write_registry"):
+            seconds, peak = measure(lambda: assigner.write_registry(rdf_config, entries), repeat)
+            written = sum(path.stat().st_size for path in assigner._registry_paths(rdf_config))
+            results[f"write_registry/{concepts}"] = result(seconds, peak, len(entries), written)
+    return results
+
+
+def result(seconds: float, peak: int, concepts: int, data_bytes: int = 0) -> dict:
+    return {
+        "seconds": seconds,
+        "peak_bytes": peak,
+        "concepts": concepts,
+        "concepts_per_second": concepts / seconds if seconds else 0.0,
+        "bytes": data_bytes,
+    }
+
+
+def environment() -> dict:
+    """Describe the machine and versions results were recorded with."""
+    try:
+        from importlib.metadata import version
+        rdflib_version = version("rdflib")
+    except Exception:
+        rdflib_version = None
+    return {
+        "tool_version": TOOL_VERSION,
+        "python": platform.python_version(),
+        "rdflib": rdflib_version,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def run(args: argparse.Namespace) -> int:
+    logging.getLogger().setLevel(logging.ERROR)
+    selected = (lambda name: any(pattern in name for pattern in args.only)) if args.only else (lambda name: True)
+    results = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for concepts in args.sizes:
+            size_results = run_size(Path(tmpdir), concepts, args.repeat, selected)
+            for name, values in size_results.items():
+                print(f"{name:42s} {values['seconds'] * 1000:10.1f} ms  peak {values['peak_bytes'] / 1e6:8.1f} MB"
+                      f"  {values['concepts_per_second']:12,.0f} concepts/s", flush=True)
+            results.update(size_results)
+
+    if args.output:
+        report = {"environment": environment(), "repeat": args.repeat, "results": results}
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"Wrote {len(results)} results to {args.output}")
+    return 0
+
+
+def compare(args: argparse.Namespace) -> int:
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    current = json.loads(args.current.read_text(encoding="utf-8"))
+    if baseline["environment"] != current["environment"]:
+        print("Note: results were recorded in different environments:", file=sys.stderr)
+        for key in sorted(set(baseline["environment"]) | set(current["environment"])):
+            old, new = baseline["environment"].get(key), current["environment"].get(key)
+            if old != new:
+                print(f"  {key}: {old} -> {new}", file=sys.stderr)
+
+    regressions = 0
+    print(f"{'case':42s} {'baseline':>10s} {'current':>10s} {'time':>8s} {'memory':>8s}")
+    for name, old in baseline["results"].items():
+        new = current["results"].get(name)
+        if new is None:
+            regressions += not args.allow_missing
+            print(f"{name:42s} missing from {args.current}")
+            continue
+        time_change = new["seconds"] / old["seconds"] - 1 if old["seconds"] else 0.0
+        memory_change = new["peak_bytes"] / old["peak_bytes"] - 1 if old["peak_bytes"] else 0.0
+        flags = []
+        if time_change > args.threshold:
+            flags.append("SLOWER")
+        if memory_change > args.memory_threshold:
+            flags.append("MORE MEMORY")
+        if new["concepts"] != old["concepts"]:
+            flags.append(f"CONCEPTS {old['concepts']} -> {new['concepts']}")
+        regressions += bool(flags)
+        print(f"{name:42s} {old['seconds'] * 1000:8.1f}ms {new['seconds'] * 1000:8.1f}ms "
+              f"{time_change:+8.1%} {memory_change:+8.1%}  {' '.join(flags)}")
+
+    if regressions:
+        print(f"{regressions} case(s) regressed beyond the threshold or are missing", file=sys.stderr)
+        return 1
+    print("No regressions")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Time every case and optionally save the results")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=SIZES,
+                            help="Concept counts to generate (default: 1000 10000 100000 1000000)")
+    run_parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case (default: 3)")
+    run_parser.add_argument("--only", action="append",
+                            help="Only run cases whose name contains this text (repeatable)")
+    run_parser.add_argument("-o", "--output", type=Path, help="Write the results as JSON to this file")
+    run_parser.set_defaults(func=run)
+
+    compare_parser = commands.add_parser("compare", help="Flag regressions against a baseline")
+    compare_parser.add_argument("baseline", type=Path, help="Baseline results JSON")
+    compare_parser.add_argument("current", type=Path, help="Results JSON to check")
+    compare_parser.add_argument("--threshold", type=float, default=0.10,
+                                help="Allowed relative slowdown per case (default: 0.10)")
+    compare_parser.add_argument("--memory-threshold", type=float, default=0.10,
+                                help="Allowed relative growth of peak memory per case (default: 0.10)")
+    compare_parser.add_argument("--allow-missing", action="store_true",
+                                help="Do not fail on baseline cases missing from the current results")
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
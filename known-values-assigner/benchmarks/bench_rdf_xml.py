@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark the streaming RDF/XML reader against rdflib graph parsing.
+
+Reports the fastest wall-clock time and the peak traced memory of each path. By
+default the bundled FOAF ontology and a synthetic OWL ontology are used; pass
+--source to benchmark other RDF/XML files.
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from known_value_assigner import (  # noqa: E402
+    DataFormat,
+    OntologyConfig,
+    OntologyFetcher,
+    ProcessingStrategy,
+    SourceDocument,
+    StandardRDFParser,
+)
+
+HEADER = """<?xml version="1.0" encoding="utf-8"?>
+<!DOCTYPE rdf:RDF [<!ENTITY ex "http://example.org/onto#">]>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+         xmlns:rdfs="http://www.w3.org/2000/01/rdf-schema#"
+         xmlns:owl="http://www.w3.org/2002/07/owl#"
+         xmlns:skos="http://www.w3.org/2004/02/skos/core#"
+         xml:base="http://example.org/onto">
+"""
+
+
+def synthetic_owl(classes: int = 4000, properties: int = 4000) -> str:
+    """Build an OWL ontology with the element shapes common in large vocabularies."""
+    parts = [HEADER]
+    for i in range(classes):
+        parts.append(f"""  <owl:Class rdf:about="&ex;Class{i}">
+    <rdfs:label xml:lang="en">Class {i}</rdfs:label>
+    <rdfs:label xml:lang="de">Klasse {i}</rdfs:label>
+    <skos:definition xml:lang="en">Definition of class {i}.</skos:definition>
+    <rdfs:subClassOf rdf:resource="&ex;Class{i // 2}"/>
+    <rdfs:subClassOf>
+      <owl:Restriction>
+        <owl:onProperty rdf:resource="&ex;prop{i}"/>
+        <owl:someValuesFrom rdf:resource="&ex;Class{i // 3}"/>
+      </owl:Restriction>
+    </rdfs:subClassOf>
+  </owl:Class>
+""")
+    for i in range(properties):
+        parts.append(f"""  <owl:ObjectProperty rdf:ID="prop{i}">
+    <rdfs:label>prop {i}</rdfs:label>
+    <rdfs:comment>Comment on property {i}.</rdfs:comment>
+    <rdfs:domain rdf:resource="&ex;Class{i}"/>
+    <rdfs:range rdf:resource="&ex;Class{i // 2}"/>
+  </owl:ObjectProperty>
+""")
+    parts.append("</rdf:RDF>\n")
+    return "".join(parts)
+
+
+def measure(func, repeat: int) -> tuple[float, int]:
+    """Return the fastest of ``repeat`` timed calls and the peak traced memory of one call."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return min(times), peak
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", type=Path, action="append", help="RDF/XML file to parse (repeatable)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per parser (default: 3)")
+    args = parser.parse_args()
+
+    if args.source:
+        inputs = [(str(path), path.read_bytes()) for path in args.source]
+    else:
+        inputs = [
+            ("bundled/foaf.rdf", (Path(__file__).parent.parent / "bundled" / "foaf.rdf").read_bytes()),
+            ("synthetic OWL", synthetic_owl().encode("utf-8")),
+        ]
+
+    config = OntologyConfig(
+        name="benchmark",
+        source_url="http://example.org/onto",
+        start_code_point=0,
+        data_format=DataFormat.RDF_XML,
+        strategy=ProcessingStrategy.STANDARD_RDF,
+    )
+    with tempfile.TemporaryDirectory() as tmpdir:
+        rdf_parser = StandardRDFParser(OntologyFetcher(Path(tmpdir), use_cache=False))
+        for name, data in inputs:
+            source = SourceDocument.from_bytes(config.source_url, data)
+            streamed = rdf_parser.extract(source, config)
+            if streamed != rdf_parser._extract_rdflib(source, config):
+                print(f"MISMATCH on {name}: streaming reader and rdflib produced different concepts",
+                      file=sys.stderr)
+                return 1
+
+            fast_time, fast_peak = measure(lambda: rdf_parser.extract(source, config), args.repeat)
+            slow_time, slow_peak = measure(lambda: rdf_parser._extract_rdflib(source, config), args.repeat)
+
+            print(f"Source: {name} ({len(data) / 1e6:.1f} MB, {len(streamed)} concepts)")
+            print(f"  rdflib graph:     {slow_time * 1000:8.1f} ms  peak {slow_peak / 1e6:7.1f} MB")
+            print(f"  streaming reader: {fast_time * 1000:8.1f} ms  peak {fast_peak / 1e6:7.1f} MB")
+            print(f"  Speedup:          {slow_time / fast_time:8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
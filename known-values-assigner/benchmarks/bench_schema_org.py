@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark the Schema.org JSON fast path against rdflib JSON-LD parsing.
+
+By default a synthetic dump shaped like schemaorg-current-https.jsonld is used;
+pass --source to benchmark a real dump instead.
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from known_value_assigner import (  # noqa: E402
+    OntologyFetcher,
+    SchemaOrgParser,
+    SourceDocument,
+    get_ontology_by_id,
+)
+
+SCHEMA_ORG_CONTEXT = {
+    "brick": "https://brickschema.org/schema/Brick#",
+    "csvw": "http://www.w3.org/ns/csvw#",
+    "dc": "http://purl.org/dc/elements/1.1/",
+    "dcterms": "http://purl.org/dc/terms/",
+    "foaf": "http://xmlns.com/foaf/0.1/",
+    "owl": "http://www.w3.org/2002/07/owl#",
+    "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
+    "rdfs": "http://www.w3.org/2000/01/rdf-schema#",
+    "schema": "https://schema.org/",
+    "skos": "http://www.w3.org/2004/02/skos/core#",
+    "xsd": "http://www.w3.org/2001/XMLSchema#",
+}
+
+
+def synthetic_dump(classes: int = 900, properties: int = 1500) -> str:
+    """Build a dump with the node shapes found in the real schema.org release."""
+    graph = []
+    for i in range(classes):
+        node = {
+            "@id": f"schema:Class{i}",
+            "@type": "rdfs:Class",
+            "rdfs:comment": f"Description of class {i}, with <a href=\"#\">markup</a> and detail. " * 3,
+            "rdfs:label": f"Class{i}",
+            "rdfs:subClassOf": {"@id": f"schema:Class{i // 2}"},
+        }
+        if i % 7 == 0:
+            node["schema:isPartOf"] = {"@id": "https://pending.schema.org"}
+            node["schema:source"] = [{"@id": "https://github.com/schemaorg/schemaorg/issues/1"}]
+        graph.append(node)
+    for i in range(properties):
+        graph.append({
+            "@id": f"schema:property{i}",
+            "@type": "rdf:Property",
+            "rdfs:comment": f"Description of property {i}.",
+            "rdfs:label": {"@language": "en", "@value": f"property{i}"},
+            "schema:domainIncludes": [{"@id": f"schema:Class{i % classes}"}, {"@id": "schema:Thing"}],
+            "schema:rangeIncludes": {"@id": "schema:Text"},
+        })
+    graph.append({"@id": "schema:Text", "@type": ["schema:DataType", "rdfs:Class"], "rdfs:label": "Text"})
+    return json.dumps({"@context": SCHEMA_ORG_CONTEXT, "@graph": graph}, indent=2)
+
+
+def best_of(func, repeat: int) -> float:
+    """Return the fastest of ``repeat`` timed calls."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", type=Path, help="Schema.org JSON-LD dump to parse (default: synthetic)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per parser (default: 3)")
+    args = parser.parse_args()
+
+    text = args.source.read_text(encoding="utf-8") if args.source else synthetic_dump()
+    config = get_ontology_by_id("schema")
+    source = SourceDocument.from_text(config.source_url, text)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        schema_parser = SchemaOrgParser(OntologyFetcher(Path(tmpdir), use_cache=False))
+        fast = schema_parser.extract(source, config)
+        slow = schema_parser._extract_rdflib(source, config)
+        if fast != slow:
+            print("MISMATCH: fast path and rdflib produced different concepts", file=sys.stderr)
+            return 1
+
+        fast_time = best_of(lambda: schema_parser.extract(source, config), args.repeat)
+        slow_time = best_of(lambda: schema_parser._extract_rdflib(source, config), args.repeat)
+
+    print(f"Source: {args.source or 'synthetic'} ({len(text) / 1e6:.1f} MB, {len(fast)} concepts)")
+    print(f"rdflib JSON-LD: {slow_time * 1000:8.1f} ms")
+    print(f"JSON fast path: {fast_time * 1000:8.1f} ms")
+    print(f"Speedup:        {slow_time / fast_time:8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
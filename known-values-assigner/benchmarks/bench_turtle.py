@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Benchmark the streaming Turtle reader against rdflib graph parsing.
+
+Reports the fastest wall-clock time and the peak traced memory of each path on a
+synthetic vocabulary shaped like gs1Voc.ttl; pass --source to benchmark real
+Turtle or N-Triples files, and --scale to grow the synthetic vocabulary.
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from known_value_assigner import (  # noqa: E402
+    DataFormat,
+    OntologyConfig,
+    OntologyFetcher,
+    ProcessingStrategy,
+    SourceDocument,
+    StandardRDFParser,
+)
+
+PREFIXES = """@prefix gs1: <https://gs1.org/voc/> .
+@prefix owl: <http://www.w3.org/2002/07/owl#> .
+@prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+@prefix schema: <http://schema.org/> .
+@prefix sh: <http://www.w3.org/ns/shacl#> .
+@prefix skos: <http://www.w3.org/2004/02/skos/core#> .
+@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+
+"""
+
+
+def synthetic_vocabulary(scale: int = 1) -> str:
+    """Build a vocabulary with the statement shapes found in gs1Voc.ttl."""
+    parts = [PREFIXES]
+    for i in range(600 * scale):
+        parts.append(f"""gs1:Class{i} a owl:Class, rdfs:Class ;
+    rdfs:label "Class {i}"@en ;
+    rdfs:comment "A description of class {i}, as found in industry vocabularies."@en ;
+    rdfs:subClassOf gs1:Class{i // 2} ;
+    skos:note "Editorial note {i}"@en .
+
+""")
+    for i in range(1500 * scale):
+        parts.append(f"""gs1:property{i} a rdf:Property, owl:ObjectProperty ;
+    rdfs:label "property {i}"@en ;
+    rdfs:comment \"\"\"Property {i}.
+Spans several lines.\"\"\"@en ;
+    schema:domainIncludes gs1:Class{i % (600 * scale)} ;
+    schema:rangeIncludes gs1:Class{(i * 7) % (600 * scale)} ;
+    sh:maxCount 1 .
+
+""")
+    for i in range(3000 * scale):
+        parts.append(f"""gs1:Code{i} a gs1:Code ;
+    rdfs:label "Code {i}"@en ;
+    skos:notation "{i:05d}" .
+
+""")
+    return "".join(parts)
+
+
+def measure(func, repeat: int) -> tuple[float, int]:
+    """Return the fastest of ``repeat`` timed calls and the peak traced memory of one call."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return min(times), peak
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", type=Path, action="append", help="Turtle file to parse (repeatable)")
+    parser.add_argument("--scale", type=int, default=1, help="Synthetic vocabulary size multiplier (default: 1)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per parser (default: 3)")
+    args = parser.parse_args()
+
+    if args.source:
+        inputs = [(str(path), path.read_bytes()) for path in args.source]
+    else:
+        inputs = [(f"synthetic gs1 x{args.scale}", synthetic_vocabulary(args.scale).encode("utf-8"))]
+
+    config = OntologyConfig(
+        name="benchmark",
+        source_url="https://gs1.org/voc/",
+        start_code_point=0,
+        data_format=DataFormat.TURTLE,
+        strategy=ProcessingStrategy.STANDARD_RDF,
+        uri_filter="https://gs1.org/voc/",
+    )
+    with tempfile.TemporaryDirectory() as tmpdir:
+        rdf_parser = StandardRDFParser(OntologyFetcher(Path(tmpdir), use_cache=False))
+        for name, data in inputs:
+            source = SourceDocument.from_bytes(config.source_url, data)
+            streamed = rdf_parser.extract(source, config)
+            if streamed != rdf_parser._extract_rdflib(source, config):
+                print(f"MISMATCH on {name}: streaming reader and rdflib produced different concepts",
+                      file=sys.stderr)
+                return 1
+
+            fast_time, fast_peak = measure(lambda: rdf_parser.extract(source, config), args.repeat)
+            slow_time, slow_peak = measure(lambda: rdf_parser._extract_rdflib(source, config), args.repeat)
+
+            print(f"Source: {name} ({len(data) / 1e6:.1f} MB, {len(streamed)} concepts)")
+            print(f"  rdflib graph:     {slow_time * 1000:8.1f} ms  peak {slow_peak / 1e6:7.1f} MB")
+            print(f"  streaming reader: {fast_time * 1000:8.1f} ms  peak {fast_peak / 1e6:7.1f} MB")
+            print(f"  Speedup:          {slow_time / fast_time:8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,22 +11,30 @@ Blockchain Commons Gordian Envelopes.
 Based on BCR-2023-002: Known Values specification.
 """
 
+import abc
 import argparse
+import codecs
+import collections
+import functools
 import hashlib
+import io
 import json
 import logging
+import mmap
 import os
 import re
 import sys
-from dataclasses import dataclass, asdict
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict, field
 from enum import Enum
 from pathlib import Path
-from typing import Optional
-from urllib.parse import urlparse
+from typing import Optional, Union
+from urllib.parse import urldefrag, urljoin, urlparse
+
+from known_value_index import BLOCKCHAIN_COMMONS_REGISTRY, BinaryRegistry, KnownValueIndex
 
-import requests
-from rdflib import Graph, Namespace, URIRef, Literal
-from rdflib.namespace import RDF, RDFS, OWL, SKOS, DCTERMS, DC
 
 # Configure logging
 logging.basicConfig(
@@ -35,8 +43,31 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Namespace definitions
-SCHEMA = Namespace("https://schema.org/")
+# Vocabulary namespaces. IRIs are plain strings; rdflib, like requests, is only
+# imported on the code paths that need it, which keeps --list and lookups fast
+RDF_NS = "http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+RDFS_NS = "http://www.w3.org/2000/01/rdf-schema#"
+OWL_NS = "http://www.w3.org/2002/07/owl#"
+SKOS_NS = "http://www.w3.org/2004/02/skos/core#"
+DCTERMS_NS = "http://purl.org/dc/terms/"
+
+# rdflib-backed names, provided by __getattr__ on first use
+_LAZY_STORE_NAMES = ("TripleFilter", "FilteringStore", "SQLiteStore")
+
+
+def __getattr__(name: str):
+    """Provide the rdflib-backed module attributes, importing rdflib on first use."""
+    if name in _LAZY_STORE_NAMES:
+        import known_value_stores
+        return getattr(known_value_stores, name)
+    if name == "SCHEMA":
+        from rdflib import Namespace
+        return Namespace("https://schema.org/")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Version recorded in generated registries; part of every cache key derived from
+# extraction, so bump it whenever extraction or assignment output changes
+TOOL_VERSION = "1.1.0"
 
 # Core Known Values that may have semantic equivalents in ontologies
 CORE_KNOWN_VALUES = {
@@ -57,6 +88,15 @@ class DataFormat(Enum):
     RDF_XML = "application/rdf+xml"
     JSON_LD = "application/ld+json"
     TURTLE = "text/turtle"
+    N_TRIPLES = "application/n-triples"
+    N_QUADS = "application/n-quads"
+
+
+class GraphStore(Enum):
+    """rdflib stores a source parsed into a graph can be held in."""
+    MEMORY = "memory"
+    # Temporary SQLite database, for sources too large to hold in RAM
+    SQLITE = "sqlite"
 
 
 @dataclass
@@ -66,11 +106,29 @@ class OntologyConfig:
     source_url: str
     start_code_point: int
     data_format: DataFormat
-    strategy: ProcessingStrategy
+    # A built-in strategy, or the name of one added with register_strategy()
+    strategy: Union[ProcessingStrategy, str]
     # Local bundled file path (fallback if URL fails)
     bundled_file: Optional[str] = None
     # Optional URI prefix filter - only include URIs starting with this
     uri_filter: Optional[str] = None
+    # Seconds a cached source is trusted before it is revalidated (None = forever)
+    cache_ttl: Optional[float] = None
+    # rdflib store for sources parsed into a graph
+    graph_store: GraphStore = GraphStore.MEMORY
+    # Further documents of the ontology (modules, extensions, code lists), parsed
+    # alongside source_url and merged with it
+    sources: list[str] = field(default_factory=list)
+
+    @property
+    def source_urls(self) -> list[str]:
+        """All documents of the ontology, ``source_url`` first."""
+        return [self.source_url, *self.sources]
+
+    @property
+    def strategy_name(self) -> str:
+        """The name the strategy's parser is registered under."""
+        return self.strategy.value if isinstance(self.strategy, ProcessingStrategy) else self.strategy
 
 
 @dataclass
@@ -217,18 +275,530 @@ def list_ontologies() -> None:
     print("-" * 40)
 
 
+def _update_json_file(path: Path, mutate, wrap_key: str, version: int = 1) -> dict:
+    """Apply ``mutate`` to a JSON document on disk under an exclusive lock.
+
+    The document is re-read inside the lock so that changes written concurrently
+    by other processes are preserved, then replaced atomically. The document has
+    the shape ``{"version": ..., wrap_key: {...}}``; ``mutate`` receives and edits
+    the inner mapping, which is also returned.
+    """
+    lock_file = open(path.with_name(path.name + ".lock"), "a")
+    try:
+        try:
+            import fcntl
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        except ImportError:
+            pass
+        data = _read_json_file(path, wrap_key)
+        mutate(data)
+        tmp_file = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump({"version": version, wrap_key: data}, f, indent=2, sort_keys=True)
+        os.replace(tmp_file, path)
+        return data
+    finally:
+        lock_file.close()
+
+
+def _read_json_file(path: Path, wrap_key: str) -> dict:
+    """Read the inner mapping of a document written by ``_update_json_file``."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f).get(wrap_key, {})
+    except FileNotFoundError:
+        return {}
+    except (OSError, json.JSONDecodeError, AttributeError) as e:
+        logger.warning(f"Ignoring unreadable file {path}: {e}")
+        return {}
+
+
+def _default_compression() -> str:
+    """Return the best compression codec available: zstd if installed, else gzip."""
+    try:
+        import zstandard  # noqa: F401
+        return "zstd"
+    except ImportError:
+        return "gzip"
+
+
+# Chunk size for streaming downloads, compression and hashing
+CHUNK_SIZE = 1 << 16
+
+
+def _hash_stream(stream) -> tuple[str, int]:
+    """Return the SHA-256 and length of everything remaining in a binary stream."""
+    hasher = hashlib.sha256()
+    size = 0
+    for chunk in iter(lambda: stream.read(CHUNK_SIZE), b""):
+        hasher.update(chunk)
+        size += len(chunk)
+    return hasher.hexdigest(), size
+
+
+class _AnonymousReader(io.RawIOBase):
+    """Raw reader over another binary stream that hides its file name.
+
+    rdflib resolves relative URIs against the name of a file it is given; hiding
+    the cache blob's name keeps parsing identical to parsing the content directly.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._stream.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+
+@dataclass
+class SourceDocument:
+    """A fetched ontology source, opened on demand rather than held as one string.
+
+    The content lives either in a file (a cache blob, possibly compressed, or a
+    bundled file) or, when caching is disabled, in memory. ``open()`` yields a
+    binary stream: a memory map for uncompressed files, a streaming decompressor
+    for compressed ones, so parsers never need a decoded copy of the source.
+    """
+    url: str
+    sha256: str
+    size: int
+    path: Optional[Path] = None
+    compression: str = "none"
+    data: Optional[bytes] = None
+    # Media type the server declared for the content, without parameters
+    content_type: Optional[str] = None
+
+    @classmethod
+    def from_bytes(cls, url: str, data: bytes, content_type: Optional[str] = None) -> "SourceDocument":
+        """Wrap in-memory content."""
+        return cls(url=url, sha256=hashlib.sha256(data).hexdigest(), size=len(data), data=data,
+                   content_type=content_type)
+
+    @classmethod
+    def from_text(cls, url: str, text: str) -> "SourceDocument":
+        """Wrap in-memory text content, encoded as UTF-8."""
+        return cls.from_bytes(url, text.encode("utf-8"))
+
+    @contextmanager
+    def open(self):
+        """Open the content as a binary stream."""
+        if self.data is not None:
+            yield io.BytesIO(self.data)
+            return
+        with open(self.path, "rb") as raw:
+            if self.compression == "none":
+                if self.size == 0:
+                    yield io.BytesIO(b"")
+                    return
+                with mmap.mmap(raw.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    yield mapped
+            elif self.compression == "gzip":
+                import gzip
+                with gzip.GzipFile(fileobj=raw, mode="rb") as stream:
+                    yield io.BufferedReader(_AnonymousReader(stream), CHUNK_SIZE)
+            elif self.compression == "zstd":
+                import zstandard
+                with zstandard.ZstdDecompressor().stream_reader(raw) as stream:
+                    yield io.BufferedReader(_AnonymousReader(stream), CHUNK_SIZE)
+            else:
+                raise ValueError(f"Unsupported compression: {self.compression}")
+
+    def head(self, size: int = 4096) -> bytes:
+        """Read the first ``size`` bytes of the content."""
+        if self.data is not None:
+            return self.data[:size]
+        with self.open() as stream:
+            return stream.read(size)
+
+    def read_bytes(self) -> bytes:
+        """Read the whole content into memory."""
+        if self.data is not None:
+            return self.data
+        with self.open() as stream:
+            return stream.read()
+
+    def read_text(self) -> str:
+        """Read the whole content as UTF-8 text."""
+        return self.read_bytes().decode("utf-8", errors="replace")
+
+    def verify(self) -> bool:
+        """Stream the content through SHA-256 and compare it with the recorded hash."""
+        with self.open() as stream:
+            return _hash_stream(stream) == (self.sha256, self.size)
+
+
+# Media types servers use for each format
+CONTENT_TYPE_FORMATS = {
+    "application/rdf+xml": DataFormat.RDF_XML,
+    "application/xml": DataFormat.RDF_XML,
+    "text/xml": DataFormat.RDF_XML,
+    "text/turtle": DataFormat.TURTLE,
+    "application/x-turtle": DataFormat.TURTLE,
+    "application/n-triples": DataFormat.N_TRIPLES,
+    "application/n-quads": DataFormat.N_QUADS,
+    "application/ld+json": DataFormat.JSON_LD,
+    "application/json": DataFormat.JSON_LD,
+}
+
+# Formats with one statement per line, which can be read from any line boundary
+LINE_FORMATS = (DataFormat.N_TRIPLES, DataFormat.N_QUADS)
+
+_XML_START = re.compile(rb"<(?:\?xml|!DOCTYPE|!--|[A-Za-z_][\w.-]*(?::[A-Za-z_][\w.-]*)?[\s/])")
+_TURTLE_START = re.compile(rb"(?:@prefix|@base|PREFIX\s|BASE\s|_:|<[^\s<>\"{}|^`\\]*:[^\s<>\"{}|^`\\]*>)",
+                           re.IGNORECASE)
+
+
+def _signature_format(head: bytes) -> Optional[DataFormat]:
+    """Identify a format from the first bytes of a document, or None if they are ambiguous."""
+    text = head.removeprefix(b"\xef\xbb\xbf").lstrip()
+    commented = False
+    while text.startswith(b"#"):
+        # Only Turtle has '#' comments
+        commented = True
+        text = text.partition(b"\n")[2].lstrip()
+    if commented:
+        return DataFormat.TURTLE
+    if _XML_START.match(text):
+        return DataFormat.RDF_XML
+    if _TURTLE_START.match(text):
+        return DataFormat.TURTLE
+    if text.startswith(b"{") or text.lstrip(b"[ \t\r\n").startswith(b"{"):
+        return DataFormat.JSON_LD
+    return None
+
+
+def sniff_format(source: SourceDocument, declared: DataFormat) -> DataFormat:
+    """Decide the format of a source before parsing it.
+
+    The byte signature of the content wins, since servers and configurations can
+    be wrong about it; the declared Content-Type is used when the signature is
+    ambiguous, and the configured format when neither settles it.
+    """
+    start = time.perf_counter()
+    data_format = _signature_format(source.head())
+    reason = "byte signature"
+    if data_format is DataFormat.TURTLE:
+        # N-Triples and N-Quads documents look like Turtle; only a declaration tells them apart
+        content_type_format = CONTENT_TYPE_FORMATS.get(source.content_type or "")
+        if content_type_format in LINE_FORMATS:
+            data_format, reason = content_type_format, f"Content-Type {source.content_type}"
+        elif declared in LINE_FORMATS:
+            data_format, reason = declared, "configuration"
+    if data_format is None:
+        data_format = CONTENT_TYPE_FORMATS.get(source.content_type or "")
+        reason = f"Content-Type {source.content_type}"
+    if data_format is None:
+        data_format, reason = declared, "configuration"
+    elapsed = (time.perf_counter() - start) * 1000
+    mismatch = f", configured as {declared.name}" if data_format != declared else ""
+    logger.info(f"Detected {data_format.name} for {source.url} from {reason}{mismatch} in {elapsed:.2f} ms")
+    return data_format
+
+
+class OntologyCache:
+    """Content-addressed store for downloaded ontology sources.
+
+    Blobs are keyed by the SHA-256 of their uncompressed content and stored
+    compressed under ``blobs/``. ``index.json`` maps each source URL to its blob,
+    together with the HTTP validators used for revalidation. Identical content
+    fetched from different URLs shares one blob, and every read is checked against
+    its hash so that a truncated or corrupted entry is discarded rather than parsed.
+    Interrupted downloads are kept under ``partial/`` so they can be resumed.
+    """
+
+    INDEX_FILE = "index.json"
+    COMPRESSION_SUFFIXES = {"zstd": ".zst", "gzip": ".gz", "none": ""}
+
+    def __init__(self, cache_dir: Path, compression: Optional[str] = None):
+        if compression is not None and compression not in self.COMPRESSION_SUFFIXES:
+            raise ValueError(f"Unsupported cache compression: {compression}")
+        self.cache_dir = cache_dir
+        self.blob_dir = cache_dir / "blobs"
+        self.partial_dir = cache_dir / "partial"
+        self.index_file = cache_dir / self.INDEX_FILE
+        self.compression = compression or _default_compression()
+        self._lock = threading.Lock()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._index: dict[str, dict] = _read_json_file(self.index_file, "entries")
+
+    def _update_index(self, mutate) -> None:
+        """Apply ``mutate`` to the shared on-disk index and refresh the local copy."""
+        with self._lock:
+            self._index = _update_json_file(self.index_file, mutate, "entries")
+
+    def _blob_path(self, sha256: str, compression: str) -> Path:
+        """Return the path of a blob for a content hash and codec."""
+        return self.blob_dir / sha256[:2] / f"{sha256}{self.COMPRESSION_SUFFIXES[compression]}"
+
+    def partial_path(self, url: str) -> Path:
+        """Return the path an in-progress download of a URL is written to."""
+        return self.partial_dir / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()[:32]}.part"
+
+    @staticmethod
+    def _compress_file(src: Path, dst: Path, compression: str) -> None:
+        """Compress a file into another, streaming."""
+        import shutil
+
+        with open(src, "rb") as fin, open(dst, "wb") as fout:
+            if compression == "zstd":
+                import zstandard
+                zstandard.ZstdCompressor(level=10).copy_stream(fin, fout)
+            elif compression == "gzip":
+                import gzip
+                with gzip.GzipFile(filename="", mode="wb", fileobj=fout, compresslevel=6, mtime=0) as gz:
+                    shutil.copyfileobj(fin, gz, CHUNK_SIZE)
+            else:
+                shutil.copyfileobj(fin, fout, CHUNK_SIZE)
+
+    def lookup(self, url: str) -> Optional[dict]:
+        """Return the index entry for a URL, or None if it is not cached."""
+        entry = self._index.get(url)
+        return dict(entry) if entry else None
+
+    def open_source(self, url: str, verify: bool = True) -> Optional[SourceDocument]:
+        """Return the cached source for a URL, verified against its recorded hash.
+
+        Returns None, after dropping the entry, if the blob is missing, cannot be
+        decompressed or does not match its hash.
+        """
+        entry = self._index.get(url)
+        if not entry:
+            return None
+        source = SourceDocument(
+            url=url,
+            sha256=entry["sha256"],
+            size=entry["size"],
+            path=self._blob_path(entry["sha256"], entry["compression"]),
+            compression=entry["compression"],
+            content_type=entry.get("content_type"),
+        )
+        if not verify:
+            return source
+        try:
+            valid = source.verify()
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache blob {source.path} for {url}: {e}")
+            self.remove(url)
+            return None
+        if not valid:
+            logger.warning(f"Discarding corrupted cache blob {source.path} for {url}: checksum mismatch")
+            self.remove(url)
+            return None
+        return source
+
+    def read(self, url: str) -> Optional[bytes]:
+        """Read and verify the cached content for a URL."""
+        source = self.open_source(url)
+        return source.read_bytes() if source is not None else None
+
+    def store(self, url: str, data: bytes, etag: Optional[str] = None,
+              last_modified: Optional[str] = None, fetched_at: Optional[float] = None,
+              content_type: Optional[str] = None) -> dict:
+        """Store in-memory content for a URL; see ``store_file``."""
+        self.partial_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.partial_dir / f"store.{os.getpid()}.{threading.get_ident()}.tmp"
+        tmp_file.write_bytes(data)
+        return self.store_file(
+            url, tmp_file, hashlib.sha256(data).hexdigest(), len(data),
+            etag=etag, last_modified=last_modified, fetched_at=fetched_at, content_type=content_type,
+        )
+
+    def store_file(self, url: str, path: Path, sha256: str, size: int, etag: Optional[str] = None,
+                   last_modified: Optional[str] = None, fetched_at: Optional[float] = None,
+                   move: bool = True, content_type: Optional[str] = None) -> dict:
+        """Store the content of a file for a URL, sharing the blob with any identical content.
+
+        With ``move`` the file is consumed: renamed into place when no compression
+        is used, otherwise compressed into the store and deleted.
+        """
+        compression = self.compression
+        for codec in self.COMPRESSION_SUFFIXES:
+            if self._blob_path(sha256, codec).exists():
+                compression = codec
+                if move:
+                    path.unlink()
+                break
+        else:
+            blob_path = self._blob_path(sha256, compression)
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            if move and compression == "none":
+                os.replace(path, blob_path)
+            else:
+                tmp_file = blob_path.with_name(f"{blob_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+                self._compress_file(path, tmp_file, compression)
+                os.replace(tmp_file, blob_path)
+                if move:
+                    path.unlink()
+
+        entry = {
+            "sha256": sha256,
+            "size": size,
+            "compression": compression,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": fetched_at if fetched_at is not None else time.time(),
+            "content_type": content_type,
+        }
+        self._update_index(lambda index: index.__setitem__(url, entry))
+        return dict(entry)
+
+    def touch(self, url: str, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """Record a successful revalidation of a URL's cached content."""
+        def mutate(index: dict) -> None:
+            entry = index.get(url)
+            if entry:
+                entry["fetched_at"] = time.time()
+                entry["etag"] = etag or entry.get("etag")
+                entry["last_modified"] = last_modified or entry.get("last_modified")
+        self._update_index(mutate)
+
+    def remove(self, url: str) -> None:
+        """Drop a URL from the index, deleting its blob if no other URL shares it."""
+        removed: list[dict] = []
+
+        def mutate(index: dict) -> None:
+            entry = index.pop(url, None)
+            if entry and not any(e["sha256"] == entry["sha256"] for e in index.values()):
+                removed.append(entry)
+        self._update_index(mutate)
+
+        for entry in removed:
+            self._blob_path(entry["sha256"], entry["compression"]).unlink(missing_ok=True)
+
+
+class StageTimer:
+    """Records how long each stage of processing an ontology takes.
+
+    Each ``stage`` span is timed and tagged with its ontology and with counts of
+    what it handled (bytes, triples, concepts, entries). Spans may nest, as rdflib
+    parsing does within extraction, and may come from other threads or, through
+    ``extend``, from worker processes. ``summary`` totals them for the run report
+    and ``chrome_trace`` lays them out as a timeline for chrome://tracing or Perfetto.
+    """
+
+    STAGES = ("fetch", "parse", "extract", "assign", "collision-check", "write")
+
+    def __init__(self):
+        self.spans: list[dict] = []
+
+    @contextmanager
+    def stage(self, ontology: str, name: str, **counts):
+        """Time a stage, yielding its span so that counts can be added as they become known."""
+        span = {"ontology": ontology, "stage": name, "pid": os.getpid(), "tid": threading.get_native_id(),
+                "start": time.perf_counter(), **counts}
+        try:
+            yield span
+        finally:
+            span["seconds"] = time.perf_counter() - span["start"]
+            self.spans.append(span)
+
+    def extend(self, spans: list[dict]) -> None:
+        """Add spans recorded by another timer, such as a worker process's."""
+        self.spans.extend(spans)
+
+    def summary(self, ontology: Optional[str] = None) -> dict[str, dict]:
+        """Total time, calls and counts per stage, for one ontology or the whole run."""
+        totals: dict[str, dict] = {}
+        for span in self.spans:
+            if ontology is not None and span["ontology"] != ontology:
+                continue
+            total = totals.setdefault(span["stage"], {"seconds": 0.0, "calls": 0})
+            total["calls"] += 1
+            for key, value in span.items():
+                if key in ("seconds", "bytes", "triples", "kept_triples", "concepts", "entries", "sources"):
+                    total[key] = total.get(key, 0) + value
+        order = {name: i for i, name in enumerate(self.STAGES)}
+        return {name: totals[name] for name in sorted(totals, key=lambda name: order.get(name, len(order)))}
+
+    def ontologies(self) -> list[str]:
+        """Names of the ontologies spans were recorded for, in first-seen order."""
+        return list(dict.fromkeys(span["ontology"] for span in self.spans))
+
+    def chrome_trace(self, ontology: Optional[str] = None) -> dict:
+        """Return the spans in Chrome trace event format, timed from the earliest span."""
+        spans = [span for span in self.spans if ontology is None or span["ontology"] == ontology]
+        origin = min((span["start"] for span in spans), default=0.0)
+        events = []
+        for span in sorted(spans, key=lambda span: span["start"]):
+            args = {key: value for key, value in span.items()
+                    if key not in ("stage", "pid", "tid", "start", "seconds")}
+            events.append({
+                "name": span["stage"],
+                "cat": "known-values",
+                "ph": "X",
+                "ts": round((span["start"] - origin) * 1e6, 3),
+                "dur": round(span["seconds"] * 1e6, 3),
+                "pid": span["pid"],
+                "tid": span["tid"],
+                "args": args,
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
 class OntologyFetcher:
-    """Handles HTTP retrieval and caching of ontology files."""
+    """Handles HTTP retrieval and caching of ontology files.
+
+    All requests go through one pooled ``requests.Session`` so that connections to
+    the same host are kept alive and reused across ontologies. Downloads are
+    streamed to disk in chunks and kept in an ``OntologyCache`` under ``cache_dir``;
+    an interrupted download is resumed with an HTTP Range request.
+    """
 
-    def __init__(self, cache_dir: Path, use_cache: bool = True, script_dir: Optional[Path] = None):
+    USER_AGENT = "KnownValueAssigner/1.0 (Blockchain Commons)"
+    TIMEOUT = 60
+
+    def __init__(self, cache_dir: Path, use_cache: bool = True, script_dir: Optional[Path] = None,
+                 max_connections_per_host: int = 4, revalidate: bool = False,
+                 compression: Optional[str] = None, stages: Optional[StageTimer] = None):
         self.cache_dir = cache_dir
         self.use_cache = use_cache
+        # Revalidate every cached source with a conditional GET, regardless of TTL
+        self.revalidate = revalidate
         self.script_dir = script_dir or Path(__file__).parent
-        if use_cache:
-            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_connections_per_host = max_connections_per_host
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
+        # Sources downloaded by prefetch() when caching is disabled, consumed by fetch_source()
+        self._prefetched: dict[str, SourceDocument] = {}
+        # Failures seen by prefetch(), re-raised by fetch_source() instead of retrying
+        self._prefetch_errors: dict[str, Exception] = {}
+        # URLs downloaded or revalidated during this run
+        self._validated: set[str] = set()
+        self.cache = OntologyCache(cache_dir, compression) if use_cache else None
+        # Timings of fetches, and of the parsing and extraction done by parsers using this fetcher
+        self.stages = stages or StageTimer()
+
+    @property
+    def session(self) -> "requests.Session":
+        """The shared HTTP session, created on first use."""
+        import requests
+
+        with self._session_lock:
+            if self._session is None:
+                session = requests.Session()
+                session.headers["User-Agent"] = self.USER_AGENT
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_connections=16,
+                    pool_maxsize=self.max_connections_per_host,
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._session = session
+            return self._session
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
 
     def _get_cache_filename(self, url: str, ontology_name: str) -> Path:
-        """Generate a cache filename from URL and ontology name."""
+        """Return the legacy (pre content-store) cache filename for a URL."""
         # Use hash of URL to handle special characters
         url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
         if "json" in url.lower():
@@ -239,165 +809,1330 @@ class OntologyFetcher:
             extension = ".rdf"
         return self.cache_dir / f"{ontology_name}_{url_hash}{extension}"
 
+    def _cache_entry(self, url: str, ontology_name: str) -> Optional[dict]:
+        """Look up a URL in the cache, importing a legacy cache file if one exists."""
+        if self.cache is None:
+            return None
+        entry = self.cache.lookup(url)
+        if entry is not None:
+            return entry
+
+        legacy_file = self._get_cache_filename(url, ontology_name)
+        if not legacy_file.exists():
+            return None
+        logger.info(f"Migrating legacy cache file {legacy_file} into the content store")
+        legacy_meta = legacy_file.with_name(legacy_file.name + ".meta.json")
+        metadata = {}
+        if legacy_meta.exists():
+            try:
+                metadata = json.loads(legacy_meta.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                pass
+        with open(legacy_file, "rb") as f:
+            sha256, size = _hash_stream(f)
+        entry = self.cache.store_file(
+            url,
+            legacy_file,
+            sha256,
+            size,
+            etag=metadata.get("etag"),
+            last_modified=metadata.get("last_modified"),
+            fetched_at=metadata.get("fetched_at", legacy_file.stat().st_mtime),
+        )
+        legacy_meta.unlink(missing_ok=True)
+        return entry
+
+    def _is_fresh(self, url: str, entry: dict, ttl: Optional[float]) -> bool:
+        """Return True if a cached entry can be used without revalidation."""
+        if url in self._validated:
+            return True
+        if self.revalidate:
+            return False
+        if ttl is None:
+            return True
+        return time.time() - entry.get("fetched_at", 0) < ttl
+
+    def is_cached(self, url: str, ontology_name: str, ttl: Optional[float] = None) -> bool:
+        """Return True if fresh content for the URL is available without a request."""
+        if url in self._prefetched:
+            return True
+        entry = self._cache_entry(url, ontology_name)
+        return entry is not None and self._is_fresh(url, entry, ttl)
+
+    def cached_sha256(self, url: str, ontology_name: str, ttl: Optional[float] = None) -> Optional[str]:
+        """Return the content hash of a fresh cached source without reading it."""
+        if self.cache is None or not self.is_cached(url, ontology_name, ttl):
+            return None
+        entry = self.cache.lookup(url)
+        return entry["sha256"] if entry else None
+
     def fetch(self, url: str, data_format: DataFormat, ontology_name: str,
-              bundled_file: Optional[str] = None) -> str:
-        """Fetch ontology content from URL, cache, or bundled file."""
-        cache_file = self._get_cache_filename(url, ontology_name)
+              bundled_file: Optional[str] = None, ttl: Optional[float] = None) -> str:
+        """Fetch ontology content as text; see ``fetch_source``."""
+        return self.fetch_source(url, data_format, ontology_name, bundled_file=bundled_file, ttl=ttl).read_text()
+
+    def fetch_bytes(self, url: str, data_format: DataFormat, ontology_name: str,
+                    bundled_file: Optional[str] = None, ttl: Optional[float] = None) -> bytes:
+        """Fetch ontology content as raw bytes; see ``fetch_source``."""
+        return self.fetch_source(url, data_format, ontology_name, bundled_file=bundled_file, ttl=ttl).read_bytes()
+
+    def fetch_source(self, url: str, data_format: DataFormat, ontology_name: str,
+                     bundled_file: Optional[str] = None, ttl: Optional[float] = None) -> SourceDocument:
+        """Fetch an ontology source from URL, cache, or bundled file.
+
+        A cached copy is used as-is while it is younger than ``ttl`` seconds (forever
+        when ``ttl`` is None). Older copies are revalidated with a conditional GET
+        using the stored ETag and Last-Modified validators; a 304 response refreshes
+        the fetch time without downloading the body.
+        """
+        with self.stages.stage(ontology_name, "fetch", url=url) as span:
+            source = self._fetch_source(url, data_format, ontology_name, bundled_file, ttl)
+            span["bytes"] = source.size
+            return source
+
+    def _fetch_source(self, url: str, data_format: DataFormat, ontology_name: str,
+                      bundled_file: Optional[str], ttl: Optional[float]) -> SourceDocument:
+        if url in self._prefetched:
+            return self._prefetched.pop(url)
+        if url in self._prefetch_errors:
+            raise self._prefetch_errors.pop(url)
+
+        entry = self._cache_entry(url, ontology_name)
 
         # Check cache first
-        if self.use_cache and cache_file.exists():
-            logger.info(f"Using cached content for {ontology_name} from {cache_file}")
-            return cache_file.read_text(encoding="utf-8")
+        if entry is not None and self._is_fresh(url, entry, ttl):
+            source = self.cache.open_source(url)
+            if source is not None:
+                logger.info(f"Using cached content for {ontology_name} (sha256 {entry['sha256'][:12]})")
+                return source
+            entry = None
 
         # Try to fetch from network
-        logger.info(f"Fetching {ontology_name} from {url}")
-        headers = {
-            "Accept": data_format.value,
-            "User-Agent": "KnownValueAssigner/1.0 (Blockchain Commons)"
-        }
-
-        try:
-            response = requests.get(url, headers=headers, timeout=60, allow_redirects=True)
-            response.raise_for_status()
-            content = response.text
+        if entry is not None:
+            logger.info(f"Revalidating cached {ontology_name} against {url}")
+        else:
+            logger.info(f"Fetching {ontology_name} from {url}")
 
-            # Cache the response
-            if self.use_cache:
-                cache_file.write_text(content, encoding="utf-8")
-                logger.info(f"Cached content to {cache_file}")
+        import requests
 
-            return content
+        try:
+            source = self._download(url, data_format, ontology_name, entry)
+            self._validated.add(url)
+            return source
 
         except requests.RequestException as e:
             logger.warning(f"Failed to fetch {url}: {e}")
 
+            # A stale cached copy is better than none
+            if entry is not None:
+                source = self.cache.open_source(url)
+                if source is not None:
+                    logger.warning(f"Using stale cached content for {ontology_name}")
+                    return source
+
             # Try bundled file as fallback
             if bundled_file:
                 bundled_path = self.script_dir / bundled_file
                 if bundled_path.exists():
                     logger.info(f"Using bundled file: {bundled_path}")
-                    content = bundled_path.read_text(encoding="utf-8")
+                    with open(bundled_path, "rb") as f:
+                        sha256, size = _hash_stream(f)
                     # Cache the bundled content for future use
-                    if self.use_cache:
-                        cache_file.write_text(content, encoding="utf-8")
-                    return content
+                    if self.cache is not None:
+                        self.cache.store_file(url, bundled_path, sha256, size, move=False)
+                        return self.cache.open_source(url, verify=False)
+                    return SourceDocument(url=url, sha256=sha256, size=size, path=bundled_path)
                 else:
                     logger.warning(f"Bundled file not found: {bundled_path}")
 
             raise
 
+    def _download(self, url: str, data_format: DataFormat, ontology_name: str,
+                  entry: Optional[dict]) -> SourceDocument:
+        """Download a URL, revalidating ``entry`` if given, and return its source.
 
-class StandardRDFParser:
-    """Parser for standard RDF/XML ontologies (RDF, RDFS, OWL, FOAF, SKOS, DC)."""
+        With caching enabled the body is streamed in chunks to a partial file, then
+        moved or compressed into the cache. If a partial file from an interrupted
+        download exists, only the missing range is requested.
+        """
+        headers = {"Accept": data_format.value}
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        partial = self.cache.partial_path(url) if self.cache is not None else None
+        partial_meta = partial.with_name(partial.name + ".json") if partial is not None else None
+        resume_from = 0
+        if partial is not None and partial.exists():
+            resume_validator = None
+            try:
+                meta = json.loads(partial_meta.read_text(encoding="utf-8"))
+                resume_validator = meta.get("etag") or meta.get("last_modified")
+            except (OSError, json.JSONDecodeError):
+                pass
+            if resume_validator:
+                resume_from = partial.stat().st_size
+                headers["Range"] = f"bytes={resume_from}-"
+                headers["If-Range"] = resume_validator
+
+        response = self.session.get(url, headers=headers, timeout=self.TIMEOUT, allow_redirects=True, stream=True)
+        try:
+            if entry is not None and response.status_code == 304:
+                source = self.cache.open_source(url)
+                if source is not None:
+                    self.cache.touch(
+                        url,
+                        etag=response.headers.get("ETag"),
+                        last_modified=response.headers.get("Last-Modified"),
+                    )
+                    logger.info(f"Cached content for {ontology_name} is unchanged (304 Not Modified)")
+                    return source
+                response.close()
+                response = self.session.get(
+                    url, headers={"Accept": data_format.value}, timeout=self.TIMEOUT,
+                    allow_redirects=True, stream=True,
+                )
+            response.raise_for_status()
 
-    # Types we're interested in extracting
-    CONCEPT_TYPES = {
-        RDFS.Class: "Class",
-        OWL.Class: "Class",
-        RDF.Property: "Property",
-        RDFS.Datatype: "Datatype",
-        OWL.ObjectProperty: "Property",
-        OWL.DatatypeProperty: "Property",
-        OWL.AnnotationProperty: "Property",
-    }
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            content_type = response.headers.get("Content-Type", "").split(";")[0].strip().lower() or None
+
+            if partial is None:
+                data = b"".join(response.iter_content(chunk_size=CHUNK_SIZE))
+                self._check_length(response, len(data), url)
+                return SourceDocument.from_bytes(url, data, content_type=content_type)
+
+            append = resume_from > 0 and response.status_code == 206 and \
+                response.headers.get("Content-Range", "").startswith(f"bytes {resume_from}-")
+            if append:
+                logger.info(f"Resuming download of {ontology_name} at byte {resume_from}")
+            partial.parent.mkdir(parents=True, exist_ok=True)
+            partial_meta.write_text(json.dumps({"url": url, "etag": etag, "last_modified": last_modified}),
+                                    encoding="utf-8")
+
+            hasher = hashlib.sha256()
+            size = 0
+            if append:
+                with open(partial, "rb") as f:
+                    for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                        hasher.update(chunk)
+                        size += len(chunk)
+            with open(partial, "ab" if append else "wb") as f:
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    if chunk:
+                        f.write(chunk)
+                        hasher.update(chunk)
+                        size += len(chunk)
+            self._check_length(response, size - (resume_from if append else 0), url)
+        finally:
+            response.close()
+
+        stored = self.cache.store_file(url, partial, hasher.hexdigest(), size, etag=etag,
+                                       last_modified=last_modified, content_type=content_type)
+        partial_meta.unlink(missing_ok=True)
+        logger.info(f"Cached content for {ontology_name} (sha256 {stored['sha256'][:12]}, {size} bytes)")
+        return self.cache.open_source(url, verify=False)
+
+    @staticmethod
+    def _check_length(response, received: int, url: str) -> None:
+        """Raise if fewer bytes arrived than the response announced."""
+        import requests
+
+        expected = response.headers.get("Content-Length")
+        if expected is not None and str(expected).isdigit() and int(expected) != received \
+                and not response.headers.get("Content-Encoding"):
+            raise requests.exceptions.ChunkedEncodingError(
+                f"Incomplete download of {url}: received {received} of {expected} bytes"
+            )
+
+    def prefetch(self, configs: list[OntologyConfig], max_workers: int = 8,
+                 per_host_limit: Optional[int] = None) -> dict[str, bool]:
+        """Download all uncached sources concurrently before any parsing starts.
+
+        At most ``per_host_limit`` downloads (default: ``max_connections_per_host``)
+        run against any one host at a time. Returns a mapping of ontology name to
+        whether its source is now available. Failures are logged and re-raised by
+        the next ``fetch`` of the same URL rather than retried.
+        """
+        from concurrent.futures import ThreadPoolExecutor
 
-    def __init__(self, fetcher: OntologyFetcher):
+        per_host_limit = per_host_limit or self.max_connections_per_host
+        pending = [
+            (config, url) for config in configs for url in config.source_urls
+            if not self.is_cached(url, config.name, config.cache_ttl)
+        ]
+        results = {c.name: True for c in configs}
+        if not pending:
+            return results
+
+        host_limits: dict[str, threading.BoundedSemaphore] = {}
+        for _, url in pending:
+            host_limits.setdefault(urlparse(url).netloc, threading.BoundedSemaphore(per_host_limit))
+
+        def download(job: tuple[OntologyConfig, str]) -> bool:
+            config, url = job
+            with host_limits[urlparse(url).netloc]:
+                try:
+                    source = self.fetch_source(
+                        url,
+                        config.data_format,
+                        config.name,
+                        bundled_file=config.bundled_file if url == config.source_url else None,
+                        ttl=config.cache_ttl,
+                    )
+                except Exception as e:
+                    self._prefetch_errors[url] = e
+                    return False
+            if not self.use_cache:
+                self._prefetched[url] = source
+            return True
+
+        logger.info(f"Prefetching {len(pending)} ontology sources from {len(host_limits)} hosts")
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+            for (config, _), ok in zip(pending, executor.map(download, pending)):
+                results[config.name] = results[config.name] and ok
+        return results
+
+
+class ConceptCache:
+    """Cache of concepts extracted from a source, so unchanged sources skip parsing.
+
+    Entries are keyed by the SHA-256 of the source content, the parser that
+    extracted them, the config's ``uri_filter`` and ``TOOL_VERSION``. Each entry is
+    a gzip-compressed JSON array of ``[uri, label, description, type]`` rows.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+
+    @staticmethod
+    def make_key(source_sha256: str, parser_name: str, strategy: str, uri_filter: Optional[str]) -> str:
+        """Derive the cache key for a source and extraction setup."""
+        fields = [source_sha256, parser_name, strategy, uri_filter, TOOL_VERSION]
+        return hashlib.sha256(json.dumps(fields).encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json.gz"
+
+    def load(self, key: str) -> Optional[list[Concept]]:
+        """Return the cached concepts for a key, or None on a miss."""
+        import gzip
+
+        path = self._path(key)
+        try:
+            with gzip.open(path, "rb") as f:
+                rows = json.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError) as e:
+            logger.warning(f"Discarding unreadable concept cache entry {path}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+        return [Concept(uri=r[0], label=r[1], description=r[2], concept_type=r[3]) for r in rows]
+
+    def save(self, key: str, concepts: list[Concept]) -> None:
+        """Persist extracted concepts under a key."""
+        import gzip
+
+        rows = [[c.uri, c.label, c.description, c.concept_type] for c in concepts]
+        data = gzip.compress(json.dumps(rows, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+                             compresslevel=6, mtime=0)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp_file = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_file.write_bytes(data)
+        os.replace(tmp_file, path)
+
+
+class OntologyParser(abc.ABC):
+    """Base class for parsers: fetches an ontology's source and extracts its concepts.
+
+    Subclasses must implement ``extract``; one that does not cannot be instantiated.
+    When the fetcher caches sources, extracted concepts are cached too, keyed by the
+    source content hash, so a source that has not changed since the last run is not
+    parsed again.
+    """
+
+    def __init__(self, fetcher: OntologyFetcher, max_workers: Optional[int] = None):
         self.fetcher = fetcher
+        self.concept_cache = ConceptCache(fetcher.cache_dir / "concepts") if fetcher.use_cache else None
+        # Worker processes for extracting the sources of a multi-source ontology
+        self.max_workers = max_workers or os.cpu_count() or 1
 
     def parse(self, config: OntologyConfig) -> list[Concept]:
-        """Parse an ontology and extract concepts."""
-        graph = Graph()
-
-        # Fetch and parse main URL
-        content = self.fetcher.fetch(
-            config.source_url,
-            config.data_format,
-            config.name,
-            bundled_file=config.bundled_file
-        )
+        """Fetch an ontology's sources and extract their concepts, merged by URI."""
+        sources = [
+            self.fetcher.fetch_source(
+                url,
+                config.data_format,
+                config.name,
+                bundled_file=config.bundled_file if url == config.source_url else None,
+                ttl=config.cache_ttl,
+            )
+            for url in config.source_urls
+        ]
+
+        results: list[Optional[list[Concept]]] = [None] * len(sources)
+        keys: list[Optional[str]] = [None] * len(sources)
+        for i, source in enumerate(sources):
+            if self.concept_cache is not None:
+                keys[i] = ConceptCache.make_key(
+                    source.sha256, type(self).__name__, config.strategy_name, config.uri_filter
+                )
+                results[i] = self.concept_cache.load(keys[i])
+                if results[i] is not None:
+                    logger.info(f"Loaded {len(results[i])} cached concepts for {self._describe(config, source)}")
+
+        pending = [i for i, concepts in enumerate(results) if concepts is None]
+        with self.fetcher.stages.stage(config.name, "extract", sources=len(pending),
+                                       bytes=sum(sources[i].size for i in pending)) as span:
+            extracted = self._extract_sources([sources[i] for i in pending], config)
+            span["concepts"] = sum(len(concepts) for concepts in extracted)
+        for i, concepts in zip(pending, extracted):
+            results[i] = concepts
+            logger.info(f"Extracted {len(concepts)} concepts from {self._describe(config, sources[i])}")
+            if keys[i] is not None:
+                self.concept_cache.save(keys[i], concepts)
+
+        if len(results) == 1:
+            return results[0]
+        concepts = merge_concepts(results)
+        logger.info(f"Merged {len(concepts)} concepts from {len(results)} sources of {config.name}")
+        return concepts
+
+    @staticmethod
+    def _describe(config: OntologyConfig, source: SourceDocument) -> str:
+        return f"{config.name} ({source.url})" if config.sources else config.name
+
+    def _extract_sources(self, sources: list[SourceDocument], config: OntologyConfig) -> list[list[Concept]]:
+        """Extract several sources, in parallel worker processes when there is more than one."""
+        workers = min(self.max_workers, len(sources))
+        if workers < 2:
+            return [self.extract(source, config) for source in sources]
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        logger.info(f"Extracting {len(sources)} sources of {config.name} with {workers} worker processes")
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_extract_source_job, type(self), self.fetcher.cache_dir, source, config)
+                for source in sources
+            ]
+            return [future.result() for future in futures]
+
+    @abc.abstractmethod
+    def extract(self, source: SourceDocument, config: OntologyConfig) -> list[Concept]:
+        """Extract concepts from a fetched source."""
+
+    def imported_sources(self, config: OntologyConfig) -> list[str]:
+        """Return the URLs of documents besides its sources that parsing an ontology read."""
+        return []
+
+    @contextmanager
+    def _parse_graph(self, source: SourceDocument, rdflib_format: str, config: OntologyConfig,
+                     types, predicates):
+        """Parse a source with rdflib into the configured store, keeping only the triples
+        extraction reads, and yield the graph."""
+        import tempfile
+
+        from rdflib import Dataset, Graph
+
+        from known_value_stores import FilteringStore, SQLiteStore, TripleFilter
+
+        triple_filter = TripleFilter(types, predicates, config.uri_filter)
+        if config.graph_store == GraphStore.SQLITE:
+            graph_dir = self.fetcher.cache_dir / "graphs"
+            graph_dir.mkdir(parents=True, exist_ok=True)
+            fd, path = tempfile.mkstemp(prefix=f"{config.name}.", suffix=".sqlite", dir=graph_dir)
+            os.close(fd)
+            store = SQLiteStore(Path(path), triple_filter)
+        else:
+            store = FilteringStore(triple_filter)
+
         try:
-            graph.parse(data=content, format="xml")
-        except Exception as e:
-            logger.warning(f"Failed to parse {config.source_url} as XML, trying auto-detection: {e}")
-            graph.parse(data=content)
+            graph = Graph(store=store)
+            with self.fetcher.stages.stage(config.name, "parse", bytes=source.size) as span, source.open() as stream:
+                graph.parse(source=stream, format=rdflib_format)
+                span["triples"] = triple_filter.kept + triple_filter.dropped
+                span["kept_triples"] = triple_filter.kept
+            if rdflib_format == "nquads":
+                # Quads are stored in their named graphs; concepts are read from all of them
+                graph = Dataset(store=store, default_union=True)
+            logger.debug(f"Kept {triple_filter.kept} of {triple_filter.kept + triple_filter.dropped} "
+                         f"triples from {config.name} in the {config.graph_store.value} store")
+            yield graph
+        finally:
+            store.close()
+            if isinstance(store, SQLiteStore):
+                store.path.unlink(missing_ok=True)
+
+
+def _extract_source_job(parser_class, cache_dir: Path, source: SourceDocument,
+                        config: OntologyConfig) -> list[Concept]:
+    """Extract the concepts of one source in a worker process.
+
+    The sources already use every worker, so the parser must not start a pool of its own.
+    """
+    return parser_class(OntologyFetcher(cache_dir, use_cache=False), max_workers=1).extract(source, config)
+
+
+def merge_concepts(per_source: list[list[Concept]]) -> list[Concept]:
+    """Merge the concepts of an ontology's sources by URI.
+
+    Sources are taken in configuration order and concepts keep the order in which
+    they first appear. A concept found in several sources takes its label and type
+    from the first source that has it, and its description from the first source
+    that gives a non-empty one; conflicting types are logged.
+    """
+    merged: dict[str, Concept] = {}
+    for concepts in per_source:
+        for concept in concepts:
+            existing = merged.get(concept.uri)
+            if existing is None:
+                merged[concept.uri] = concept
+                continue
+            if existing.concept_type != concept.concept_type:
+                logger.warning(f"{concept.uri} is a {existing.concept_type} in one source and a "
+                               f"{concept.concept_type} in another; keeping {existing.concept_type}")
+            if not existing.description and concept.description:
+                merged[concept.uri] = Concept(
+                    uri=existing.uri,
+                    label=existing.label,
+                    description=concept.description,
+                    concept_type=existing.concept_type,
+                )
+    return list(merged.values())
 
-        # Extract concepts
-        concepts = []
-        seen_uris = set()
 
-        for rdf_type, concept_type in self.CONCEPT_TYPES.items():
-            for subject in graph.subjects(RDF.type, rdf_type):
-                if not isinstance(subject, URIRef):
-                    continue
+class UnsupportedSyntaxError(ValueError):
+    """Raised by a streaming extractor for input it cannot reproduce rdflib's result for."""
 
-                uri = str(subject)
 
+class ConceptCollector:
+    """Keeps only the triples ``StandardRDFParser`` needs to build its concepts.
+
+    Extractors feed triples to ``add``. Objects are URIs as ``str``, literals as
+    ``(text, language, datatype)`` tuples and blank nodes as ``BLANK``; a blank
+    subject is passed as None. Rather than a graph, the collector records the
+    subjects of each concept type in order, and per subject the first candidate for
+    each label and description rule, so ``concepts()`` selects with index lookups.
+
+    A label is the first English or untagged ``rdfs:label``, else ``skos:prefLabel``,
+    else any ``rdfs:label``. A description is the first English or untagged
+    ``rdfs:comment``, else a ``dcterms:description`` literal, else an English or
+    untagged ``skos:definition``, else any ``rdfs:comment``.
+    """
+
+    BLANK = object()
+    XSD_STRING = "http://www.w3.org/2001/XMLSchema#string"
+    RDF_TYPE = RDF_NS + "type"
+
+    # Candidate slots, in the order the label and description rules try them
+    LABEL_EN, PREF_LABEL_EN, LABEL_ANY, COMMENT_EN, DESCRIPTION, DEFINITION_EN, COMMENT_ANY = range(7)
+    LABEL_SLOTS = (LABEL_EN, PREF_LABEL_EN, LABEL_ANY)
+    DESCRIPTION_SLOTS = (COMMENT_EN, DESCRIPTION, DEFINITION_EN, COMMENT_ANY)
+
+    # predicate -> [(slot, literals only, English or untagged only)]
+    RULES = {
+        RDFS_NS + "label": [(LABEL_EN, True, True), (LABEL_ANY, False, False)],
+        SKOS_NS + "prefLabel": [(PREF_LABEL_EN, True, True)],
+        RDFS_NS + "comment": [(COMMENT_EN, True, True), (COMMENT_ANY, False, False)],
+        DCTERMS_NS + "description": [(DESCRIPTION, True, False)],
+        SKOS_NS + "definition": [(DEFINITION_EN, True, True)],
+    }
+
+    def __init__(self, concept_types: list[str], uri_filter: Optional[str] = None):
+        self.typed: dict[str, dict[str, None]] = {t: {} for t in concept_types}
+        self.candidates: dict[str, list[Optional[str]]] = {}
+        # Subjects outside the filter can never become concepts, so nothing is kept for them
+        self.uri_filter = uri_filter
+
+    def add(self, subject: Optional[str], predicate: str, obj) -> None:
+        """Record one triple."""
+        if subject is None or (self.uri_filter and not subject.startswith(self.uri_filter)):
+            return
+        if predicate == self.RDF_TYPE:
+            subjects = self.typed.get(obj) if isinstance(obj, str) else None
+            if subjects is not None:
+                subjects.setdefault(subject, None)
+            return
+
+        rules = self.RULES.get(predicate)
+        if rules is None:
+            return
+        if obj is self.BLANK:
+            raise UnsupportedSyntaxError(f"blank node object for <{predicate}>")
+        is_literal = isinstance(obj, tuple)
+        if is_literal and obj[2] is not None and obj[2] != self.XSD_STRING:
+            raise UnsupportedSyntaxError(f"literal of datatype <{obj[2]}> for <{predicate}>")
+
+        candidates = self.candidates.get(subject)
+        if candidates is None:
+            candidates = self.candidates[subject] = [None] * 7
+        for slot, literal_only, english_only in rules:
+            if candidates[slot] is not None or (literal_only and not is_literal):
+                continue
+            if english_only and is_literal and obj[1] not in ("en", None):
+                continue
+            candidates[slot] = obj[0] if is_literal else obj
+
+    def merge(self, other: "ConceptCollector") -> None:
+        """Fold in a collector fed the triples that follow the ones this one was fed.
+
+        Typed subjects keep their first-seen order and each candidate slot keeps its
+        first value, so the result is what one collector fed all the triples holds.
+        """
+        for type_iri, subjects in other.typed.items():
+            ours = self.typed[type_iri]
+            for subject in subjects:
+                ours.setdefault(subject, None)
+        for subject, candidates in other.candidates.items():
+            ours = self.candidates.get(subject)
+            if ours is None:
+                self.candidates[subject] = candidates
+                continue
+            for slot, value in enumerate(candidates):
+                if ours[slot] is None:
+                    ours[slot] = value
+
+    def concepts(self, concept_types: list[tuple[str, str]], uri_filter: Optional[str],
+                 local_name) -> list[Concept]:
+        """Build the concepts for ``(type IRI, concept type)`` pairs, in that order."""
+        concepts = []
+        seen_uris = set()
+        no_candidates = [None] * 7
+
+        for type_iri, concept_type in concept_types:
+            for uri in self.typed[type_iri]:
                 # Apply URI filter if specified in config
-                if config.uri_filter and not uri.startswith(config.uri_filter):
+                if uri_filter and not uri.startswith(uri_filter):
                     continue
 
                 if uri in seen_uris:
                     continue
                 seen_uris.add(uri)
 
-                label = self._get_label(graph, subject)
-                description = self._get_description(graph, subject)
-
+                candidates = self.candidates.get(uri, no_candidates)
+                label = next((candidates[i] for i in self.LABEL_SLOTS if candidates[i] is not None), None)
+                description = next(
+                    (candidates[i] for i in self.DESCRIPTION_SLOTS if candidates[i] is not None), ""
+                )
                 concepts.append(Concept(
                     uri=uri,
-                    label=label,
+                    label=label if label is not None else local_name(uri),
                     description=description,
                     concept_type=concept_type,
                 ))
 
-        logger.info(f"Extracted {len(concepts)} concepts from {config.name}")
         return concepts
 
-    def _get_label(self, graph: Graph, subject: URIRef) -> str:
-        """Extract the best label for a concept."""
-        # Try rdfs:label first, preferring English
-        for label in graph.objects(subject, RDFS.label):
-            if isinstance(label, Literal):
-                if label.language == "en" or label.language is None:
-                    return str(label)
-
-        # Try skos:prefLabel
-        for label in graph.objects(subject, SKOS.prefLabel):
-            if isinstance(label, Literal):
-                if label.language == "en" or label.language is None:
-                    return str(label)
-
-        # Fall back to any label
-        for label in graph.objects(subject, RDFS.label):
-            return str(label)
 
-        # Extract local name from URI
-        return self._extract_local_name(str(subject))
-
-    def _get_description(self, graph: Graph, subject: URIRef) -> str:
-        """Extract the best description for a concept."""
-        # Try rdfs:comment
-        for desc in graph.objects(subject, RDFS.comment):
-            if isinstance(desc, Literal):
-                if desc.language == "en" or desc.language is None:
-                    return str(desc)
-
-        # Try dcterms:description
-        for desc in graph.objects(subject, DCTERMS.description):
-            if isinstance(desc, Literal):
-                return str(desc)
-
-        # Try skos:definition
-        for desc in graph.objects(subject, SKOS.definition):
-            if isinstance(desc, Literal):
-                if desc.language == "en" or desc.language is None:
-                    return str(desc)
-
-        # Fall back to any comment
-        for desc in graph.objects(subject, RDFS.comment):
-            return str(desc)
+class RDFXMLStreamReader:
+    """Incremental RDF/XML reader that feeds triples to a ``ConceptCollector``.
+
+    The document is read with ``ElementTree.iterparse``; each top-level node element
+    is interpreted once it is complete and then discarded, so memory use is bounded
+    by the largest single description rather than by the whole ontology. IRIs are
+    resolved and literals built the way rdflib's RDF/XML parser does it. Syntax that
+    would need more than the collector keeps (XML literals, unqualified attributes,
+    a root other than ``rdf:RDF``) raises ``UnsupportedSyntaxError``.
+    """
+
+    XML_NS = "{http://www.w3.org/XML/1998/namespace}"
+    RDF_ROOT = f"{{{RDF_NS}}}RDF"
+    RDF_DESCRIPTION = RDF_NS + "Description"
+    RDF_LI_TAG = f"{{{RDF_NS}}}li"
+    RDF_TYPE = RDF_NS + "type"
+    ABOUT, ID, NODE_ID, RESOURCE = RDF_NS + "about", RDF_NS + "ID", RDF_NS + "nodeID", RDF_NS + "resource"
+    PARSE_TYPE, DATATYPE = RDF_NS + "parseType", RDF_NS + "datatype"
+    NODE_ATTRIBUTES = {ABOUT, ID, NODE_ID}
+    PROPERTY_ATTRIBUTES = {ID, RESOURCE, NODE_ID}
+    UNQUALIFIED = {"about", "ID", "type", "resource", "parseType"}
+
+    def __init__(self, collector: ConceptCollector):
+        self.collector = collector
+
+    def read(self, stream) -> None:
+        """Read an RDF/XML document from a binary stream."""
+        depth = 0
+        root = None
+        base = lang = None
+        from xml.etree import ElementTree
+
+        for event, elem in ElementTree.iterparse(stream, events=("start", "end")):
+            if event == "start":
+                depth += 1
+                if depth == 1:
+                    if elem.tag != self.RDF_ROOT:
+                        raise UnsupportedSyntaxError(f"document element {elem.tag} is not rdf:RDF")
+                    root = elem
+                    base, lang = self._scope(elem, None, None)
+                continue
+            depth -= 1
+            if depth == 1:
+                self._node(elem, base, lang)
+                root.remove(elem)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _absolutize(base: Optional[str], uri: str) -> str:
+        """Resolve a URI reference against a base, keeping a trailing '#' as rdflib does."""
+        result = urljoin(base, uri, allow_fragments=True)
+        if uri and uri[-1] == "#" and result[-1] != "#":
+            result += "#"
+        return result
 
-        return ""
+    def _scope(self, elem, base: Optional[str], lang: Optional[str]) -> tuple[Optional[str], Optional[str]]:
+        """Apply an element's xml:base and xml:lang to the inherited ones."""
+        xml_base = elem.get(self.XML_NS + "base")
+        if xml_base is not None:
+            xml_base = urldefrag(xml_base)[0]
+            base = urljoin(base, xml_base) if base else xml_base
+        xml_lang = elem.get(self.XML_NS + "lang")
+        if xml_lang is not None:
+            lang = xml_lang
+        return base, lang
+
+    def _name(self, tag: str) -> str:
+        if tag[0] != "{":
+            raise UnsupportedSyntaxError(f"element {tag} has no namespace")
+        return tag[1:].replace("}", "", 1)
+
+    def _attributes(self, elem) -> dict[str, str]:
+        """Return the non-xml: attributes of an element keyed by full IRI."""
+        attributes = {}
+        for key, value in elem.attrib.items():
+            if key[0] == "{":
+                if not key.startswith(self.XML_NS):
+                    attributes[key[1:].replace("}", "", 1)] = value
+            elif key[:3].lower() == "xml":
+                continue
+            elif key in self.UNQUALIFIED:
+                attributes[RDF_NS + key] = value
+            else:
+                raise UnsupportedSyntaxError(f"unqualified attribute {key}")
+        return attributes
+
+    def _node(self, elem, base: Optional[str], lang: Optional[str]) -> Optional[str]:
+        """Interpret a node element; return its subject (None for a blank node)."""
+        base, lang = self._scope(elem, base, lang)
+        name = self._name(elem.tag)
+        attributes = self._attributes(elem)
+        add = self.collector.add
+
+        if self.ID in attributes:
+            subject = self._absolutize(base, "#" + attributes[self.ID])
+        elif self.NODE_ID in attributes:
+            subject = None
+        elif self.ABOUT in attributes:
+            subject = self._absolutize(base, attributes[self.ABOUT])
+        else:
+            subject = None
+
+        if name != self.RDF_DESCRIPTION:
+            add(subject, self.RDF_TYPE, self._absolutize(base, name))
+
+        literal_lang = lang or None
+        for attribute, value in attributes.items():
+            if attribute == self.RDF_TYPE:
+                add(subject, self.RDF_TYPE, self._absolutize(base, value))
+            elif attribute not in self.NODE_ATTRIBUTES:
+                add(subject, self._absolutize(base, attribute), (value, literal_lang, None))
+
+        self._properties(elem, subject, base, lang)
+        return subject
+
+    def _properties(self, elem, subject: Optional[str], base: Optional[str], lang: Optional[str]) -> None:
+        """Interpret the property elements of a node, numbering rdf:li as rdf:_1, rdf:_2, ..."""
+        li = 0
+        for child in elem:
+            if child.tag == self.RDF_LI_TAG:
+                li += 1
+                self._property(child, subject, base, lang, f"{RDF_NS}_{li}")
+            else:
+                self._property(child, subject, base, lang)
+
+    def _property(self, elem, subject: Optional[str], base: Optional[str], lang: Optional[str],
+                  predicate: Optional[str] = None) -> None:
+        """Interpret a property element of ``subject``."""
+        base, lang = self._scope(elem, base, lang)
+        predicate = predicate or self._absolutize(base, self._name(elem.tag))
+        attributes = self._attributes(elem)
+        add = self.collector.add
+        blank = ConceptCollector.BLANK
+
+        parse_type = attributes.get(self.PARSE_TYPE)
+        if self.RESOURCE in attributes:
+            obj = self._absolutize(base, attributes[self.RESOURCE])
+        elif self.NODE_ID in attributes:
+            obj = blank
+        elif parse_type == "Resource":
+            self._properties(elem, None, base, lang)
+            add(subject, predicate, blank)
+            return
+        elif parse_type == "Collection":
+            for child in elem:
+                self._node(child, base, lang)
+            add(subject, predicate, blank if len(elem) else RDF_NS + "nil")
+            return
+        elif parse_type is not None:
+            if predicate in ConceptCollector.RULES:
+                raise UnsupportedSyntaxError(f"XML literal for <{predicate}>")
+            return
+        else:
+            obj = None
+
+        datatype = attributes.get(self.DATATYPE)
+        if datatype is not None:
+            datatype = self._absolutize(base, datatype)
+        else:
+            for attribute, value in attributes.items():
+                if attribute in self.PROPERTY_ATTRIBUTES:
+                    continue
+                if obj is None:
+                    obj = blank
+                node = None if obj is blank else obj
+                if attribute == self.RDF_TYPE:
+                    add(node, self.RDF_TYPE, value)
+                else:
+                    add(node, self._absolutize(base, attribute), (value, lang or None, None))
+
+        for child in elem:
+            nested = self._node(child, base, lang)
+            obj = blank if nested is None else nested
+
+        if obj is None:
+            obj = (elem.text or "", None if datatype is not None else (lang or None), datatype)
+        add(subject, predicate, obj)
+
+
+class _LazyPattern:
+    """Class attribute holding a regular expression that is compiled on first use.
+
+    The readers' patterns take longer to compile than the rest of the module takes
+    to import, and most commands never read a document.
+    """
+
+    def __init__(self, pattern: str, flags: int = 0):
+        self.pattern = pattern
+        self.flags = flags
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance, owner):
+        compiled = re.compile(self.pattern, self.flags)
+        # Replace the descriptor, so later lookups are plain attribute reads
+        setattr(owner, self.name, compiled)
+        return compiled
+
+
+class TurtleStreamReader:
+    """Statement-at-a-time Turtle and N-Triples reader that feeds a ``ConceptCollector``.
+
+    The text is decoded and tokenized in chunks, and each triple is handed to the
+    collector as soon as it is read, so a vocabulary is ingested in one pass with
+    memory bounded by the chunk size and what the collector keeps. Terms are resolved
+    the way rdflib's Turtle parser resolves them. Relative IRIs without an ``@base``
+    (which rdflib resolves against the working directory), N3 extensions and syntax
+    errors raise ``UnsupportedSyntaxError``.
+    """
+
+    CHUNK_SIZE = 1 << 20
+    LOOKAHEAD = 1 << 16
+    TOKEN = _LazyPattern(r"""
+        (?:[ \t\r\n]+|\#[^\r\n]*(?![^\r\n]))*
+        (?:(?P<iri><(?:[^<>"{}|^`\\\x00-\x20]|\\u[0-9A-Fa-f]{4}|\\U[0-9A-Fa-f]{8})*>)
+      | (?P<long>\"\"\"(?:(?:"|"")?(?:[^"\\]|\\.))*\"\"\"|'''(?:(?:'|'')?(?:[^'\\]|\\.))*''')
+      | (?P<short>"(?:[^"\\\r\n]|\\.)*"|'(?:[^'\\\r\n]|\\.)*')
+      | (?P<lang>@[A-Za-z]+(?:-[A-Za-z0-9]+)*)
+      | (?P<datatype>\^\^)
+      | (?P<number>[+-]?(?:\d+\.\d*[eE][+-]?\d+|\.?\d+[eE][+-]?\d+|\d*\.\d+|\d+))
+      | (?P<bnode>_:[\w-][\w.-]*)
+      | (?P<pname>(?:[^\W\d_][\w.-]*)?:(?:(?:[\w:%-]|\\[-_~.!$&'()*+,;=/?\#@%])(?:[\w.:%-]|\\[-_~.!$&'()*+,;=/?\#@%])*)?)
+      | (?P<word>[A-Za-z]+)
+      | (?P<anon>\[[ \t\r\n]*\])
+      | (?P<punct>[.;,\[\]()])
+      | (?P<other>[^ \t\r\n#])
+      | (?P<end>\Z))
+    """, re.VERBOSE | re.DOTALL)
+    STRING_ESCAPE = _LazyPattern(r"\\(?:u([0-9A-Fa-f]{4})|U([0-9A-Fa-f]{8})|(.))", re.DOTALL)
+    IRI_ESCAPE = _LazyPattern(r"\\u([0-9A-Fa-f]{4})|\\U([0-9A-Fa-f]{8})")
+    ECHARS = {"t": "\t", "b": "\b", "n": "\n", "r": "\r", "f": "\f", '"': '"', "'": "'", "\\": "\\"}
+    XSD = "http://www.w3.org/2001/XMLSchema#"
+    RDF_TYPE = RDF_NS + "type"
+    RDF_NIL = RDF_NS + "nil"
+
+    def __init__(self, collector: ConceptCollector):
+        self.collector = collector
+        self.prefixes: dict[str, str] = {}
+        self.base: Optional[str] = None
+        self._tokens = iter(())
+        self._token: Optional[tuple[str, str]] = None
+
+    def read(self, stream) -> None:
+        """Read a Turtle or N-Triples document from a binary stream."""
+        self._tokens = self._tokenize(stream)
+        self._advance()
+        while self._token is not None:
+            self._statement()
+
+    def _tokenize(self, stream):
+        """Yield ``(kind, text)`` tokens, decoding the stream a chunk at a time."""
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        buffer, pos, eof = "", 0, False
+        while True:
+            if not eof:
+                buffer, pos, eof = self._refill(stream, decoder, buffer, pos)
+            # Tokens starting within LOOKAHEAD of the end may be cut off; rescan them after a refill
+            limit = len(buffer) if eof else len(buffer) - self.LOOKAHEAD
+            for m in self.TOKEN.finditer(buffer, pos):
+                kind = m.lastgroup
+                if kind == "end":
+                    # Only whitespace and comments are left; rescan them after a refill
+                    if eof:
+                        return
+                    pos = m.start()
+                    break
+                if not eof and (m.start() >= limit or m.end() == len(buffer) or kind == "other"
+                                or (kind == "short" and buffer.startswith(('"""', "'''"), m.start(kind)))):
+                    pos = m.start()
+                    break
+                text = m.group(kind)
+                if kind in ("pname", "bnode") and text[-1] == ".":
+                    # A name cannot end with '.', which terminates the statement instead
+                    name = text.rstrip(".")
+                    yield kind, name
+                    for _ in range(len(text) - len(name)):
+                        yield "punct", "."
+                else:
+                    yield kind, text
+
+    def _refill(self, stream, decoder, buffer: str, pos: int) -> tuple[str, int, bool]:
+        """Append the next chunk of decoded text to the unconsumed part of the buffer."""
+        data = stream.read(self.CHUNK_SIZE)
+        eof = not data
+        try:
+            return buffer[pos:] + decoder.decode(data, final=eof), 0, eof
+        except UnicodeDecodeError as e:
+            raise UnsupportedSyntaxError(f"invalid UTF-8: {e}")
+
+    def _advance(self) -> Optional[tuple[str, str]]:
+        token = self._token
+        self._token = next(self._tokens, None)
+        return token
+
+    def _next(self, what: str) -> tuple[str, str]:
+        token = self._advance()
+        if token is None:
+            raise UnsupportedSyntaxError(f"unexpected end of input, expected {what}")
+        return token
+
+    def _at(self, text: str) -> bool:
+        return self._token is not None and self._token[1] == text
+
+    def _expect(self, text: str) -> None:
+        kind, found = self._next(f"'{text}'")
+        if found != text:
+            raise UnsupportedSyntaxError(f"expected '{text}', found {found!r}")
+
+    def _statement(self) -> None:
+        kind, text = self._token
+        if kind == "lang" and text in ("@prefix", "@base"):
+            self._advance()
+            self._directive(text[1:])
+            self._expect(".")
+            return
+        if kind == "word" and text.lower() in ("prefix", "base"):
+            self._advance()
+            self._directive(text.lower())
+            return
+
+        if self._at("["):
+            # A blank node property list may stand alone as a statement
+            self._advance()
+            self._predicate_objects(None)
+            self._expect("]")
+            if not self._at("."):
+                self._predicate_objects(None)
+        else:
+            self._predicate_objects(self._subject())
+        self._expect(".")
+
+    def _directive(self, name: str) -> None:
+        if name == "prefix":
+            kind, text = self._next("a prefix name")
+            if kind != "pname" or not text.endswith(":"):
+                raise UnsupportedSyntaxError(f"expected a prefix name, found {text!r}")
+            self.prefixes[text[:-1]] = self._iri(self._iri_token(), directive=True)
+        else:
+            self.base = self._iri(self._iri_token(), directive=True)
+
+    def _iri_token(self) -> str:
+        kind, text = self._next("an IRI")
+        if kind != "iri":
+            raise UnsupportedSyntaxError(f"expected an IRI, found {text!r}")
+        return text[1:-1]
+
+    def _iri(self, reference: str, directive: bool = False) -> str:
+        """Resolve an IRI reference the way rdflib's Turtle parser does."""
+        iri = self.IRI_ESCAPE.sub(lambda m: chr(int(m.group(1) or m.group(2), 16)), reference)
+        if self.base is not None:
+            from rdflib.plugins.parsers.notation3 import join
+            iri = join(self.base, iri)
+        elif ":" not in iri:
+            raise UnsupportedSyntaxError(f"relative IRI <{iri}> without @base")
+        if not directive and reference[-1:] == "#" and iri[-1:] != "#":
+            iri += "#"
+        return iri
+
+    def _pname(self, text: str) -> str:
+        prefix, _, local = text.partition(":")
+        namespace = self.prefixes.get(prefix)
+        if namespace is None:
+            raise UnsupportedSyntaxError(f"prefix '{prefix}:' is not bound")
+        if "\\" in local:
+            local = re.sub(r"\\(.)", r"\1", local)
+        return namespace + local
+
+    def _term(self, kind: str, text: str) -> Optional[str]:
+        """Return the IRI for an IRI or prefixed-name token, or None for other tokens."""
+        if kind == "iri":
+            return self._iri(text[1:-1])
+        if kind == "pname":
+            return self._pname(text)
+        return None
+
+    def _subject(self) -> Optional[str]:
+        kind, text = self._next("a subject")
+        iri = self._term(kind, text)
+        if iri is not None:
+            return iri
+        if kind in ("bnode", "anon"):
+            return None
+        if text == "(":
+            return self.RDF_NIL if self._collection() == self.RDF_NIL else None
+        raise UnsupportedSyntaxError(f"unexpected subject {text!r}")
+
+    def _predicate_objects(self, subject: Optional[str]) -> None:
+        add = self.collector.add
+        while True:
+            kind, text = self._next("a predicate")
+            predicate = self.RDF_TYPE if kind == "word" and text == "a" else self._term(kind, text)
+            if predicate is None:
+                raise UnsupportedSyntaxError(f"unexpected predicate {text!r}")
+
+            add(subject, predicate, self._object())
+            while self._at(","):
+                self._advance()
+                add(subject, predicate, self._object())
+
+            if not self._at(";"):
+                return
+            while self._at(";"):
+                self._advance()
+            if self._token is None or self._token[1] in (".", "]"):
+                return
+
+    def _object(self):
+        kind, text = self._next("an object")
+        iri = self._term(kind, text)
+        if iri is not None:
+            return iri
+        if kind in ("bnode", "anon"):
+            return ConceptCollector.BLANK
+        if kind in ("short", "long"):
+            quote = 3 if kind == "long" else 1
+            value = self._unescape(text[quote:-quote])
+            if self._token is not None and self._token[0] == "lang":
+                return value, self._advance()[1][1:], None
+            if self._token is not None and self._token[0] == "datatype":
+                self._advance()
+                kind, text = self._next("a datatype")
+                datatype = self._term(kind, text)
+                if datatype is None:
+                    raise UnsupportedSyntaxError(f"unexpected datatype {text!r}")
+                return value, None, datatype
+            return value, None, None
+        if kind == "number":
+            if "e" in text or "E" in text:
+                return text, None, self.XSD + "double"
+            return text, None, self.XSD + ("decimal" if "." in text else "integer")
+        if kind == "word" and text in ("true", "false"):
+            return text, None, self.XSD + "boolean"
+        if text == "[":
+            self._predicate_objects(None)
+            self._expect("]")
+            return ConceptCollector.BLANK
+        if text == "(":
+            return self._collection()
+        raise UnsupportedSyntaxError(f"unexpected object {text!r}")
+
+    def _collection(self):
+        """Read a collection after its '('; return rdf:nil if empty, else a blank node."""
+        empty = True
+        while not self._at(")"):
+            self._object()
+            empty = False
+        self._expect(")")
+        return self.RDF_NIL if empty else ConceptCollector.BLANK
+
+    def _unescape(self, text: str) -> str:
+        if "\\" not in text:
+            return text
+
+        def replace(m) -> str:
+            if m.group(3) is None:
+                return chr(int(m.group(1) or m.group(2), 16))
+            if m.group(3) not in self.ECHARS:
+                raise UnsupportedSyntaxError(f"invalid escape \\{m.group(3)}")
+            return self.ECHARS[m.group(3)]
+        return self.STRING_ESCAPE.sub(replace, text)
+
+
+class NTriplesStreamReader(TurtleStreamReader):
+    """Line-at-a-time N-Triples reader that feeds a ``ConceptCollector``.
+
+    Every line holds a complete statement, so a document can be read starting at
+    any line boundary; ``StandardRDFParser`` relies on this to split large dumps into
+    byte ranges read by separate processes. Terms are decoded as the Turtle reader
+    decodes them, and a line that is not a statement raises ``UnsupportedSyntaxError``.
+    """
+
+    _IRI = r"(?:[^<>\"{}|^`\\\x00-\x20]|\\u[0-9A-Fa-f]{4}|\\U[0-9A-Fa-f]{8})*"
+    _BNODE = r"_:[\w-](?:[\w.-]*[\w-])?"
+    _TRIPLE = (rf"[ \t]*(?:<({_IRI})>|{_BNODE})[ \t]*<({_IRI})>[ \t]*"
+               rf"(?:<({_IRI})>|{_BNODE}|\"((?:[^\"\\\r\n]|\\.)*)\""
+               rf"(?:@([A-Za-z]+(?:-[A-Za-z0-9]+)*)|\^\^<({_IRI})>)?)")
+    _END = r"[ \t]*\.[ \t\r]*(?:#.*)?"
+    LINE = _LazyPattern(_TRIPLE + _END)
+    EMPTY_LINE = _LazyPattern(r"[ \t\r]*(?:#.*)?")
+
+    def read(self, stream, limit: Optional[int] = None) -> None:
+        """Read statements from a binary stream, stopping after ``limit`` bytes if given."""
+        rest = b""
+        while True:
+            size = self.CHUNK_SIZE if limit is None else min(self.CHUNK_SIZE, limit)
+            block = stream.read(size) if size else b""
+            if limit is not None:
+                limit -= len(block)
+            if not block:
+                self._read_lines(rest)
+                return
+            block = rest + block
+            cut = block.rfind(b"\n") + 1
+            self._read_lines(block[:cut])
+            rest = block[cut:]
+
+    def _read_lines(self, data: bytes) -> None:
+        try:
+            text = data.decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise UnsupportedSyntaxError(f"invalid UTF-8: {e}")
+        add = self.collector.add
+        match = self.LINE.fullmatch
+        for line in text.split("\n"):
+            m = match(line)
+            if m is None:
+                if self.EMPTY_LINE.fullmatch(line):
+                    continue
+                raise UnsupportedSyntaxError(f"not a statement: {line[:80]!r}")
+            subject, predicate, iri, value, language, datatype = m.groups()
+            if iri is not None:
+                obj = self._iri(iri)
+            elif value is not None:
+                obj = (self._unescape(value), language, self._iri(datatype) if datatype is not None else None)
+            else:
+                obj = ConceptCollector.BLANK
+            add(self._iri(subject) if subject is not None else None, self._iri(predicate), obj)
+
+
+class NQuadsStreamReader(NTriplesStreamReader):
+    """N-Quads reader: N-Triples statements with an optional graph label, which is
+    ignored so that concepts are read from the union of all graphs."""
+
+    LINE = _LazyPattern(NTriplesStreamReader._TRIPLE
+                      + rf"(?:[ \t]*(?:<{NTriplesStreamReader._IRI}>|{NTriplesStreamReader._BNODE}))?"
+                      + NTriplesStreamReader._END)
+
+
+def _line_ranges(source: SourceDocument, size: int):
+    """Split a line-based source into pieces of about ``size`` bytes ending at line
+    boundaries, yielding ``(document, start, end)`` for each.
+
+    An uncompressed file is split into byte ranges of itself, which workers read
+    through their own memory map; other sources are read here and each piece is
+    handed over as an in-memory document.
+    """
+    with source.open() as stream:
+        if source.path is not None and source.compression == "none":
+            start = 0
+            while start < source.size:
+                stream.seek(min(start + size, source.size))
+                stream.readline()
+                end = stream.tell()
+                yield source, start, end
+                start = end
+            return
+        while True:
+            block = stream.read(size)
+            if not block:
+                return
+            block += stream.readline()
+            yield SourceDocument(url=source.url, sha256=source.sha256, size=len(block), data=block), 0, len(block)
+
+
+def _collect_line_range(reader_class, source: SourceDocument, start: int, end: int,
+                        concept_types: list[str], uri_filter: Optional[str]) -> ConceptCollector:
+    """Read one byte range of a line-based source in a worker process."""
+    collector = ConceptCollector(concept_types, uri_filter)
+    with source.open() as stream:
+        stream.seek(start)
+        reader_class(collector).read(stream, end - start)
+    return collector
+
+
+class StandardRDFParser(OntologyParser):
+    """Parser for standard RDF/XML ontologies (RDF, RDFS, OWL, FOAF, SKOS, DC)."""
+
+    # Types we're interested in extracting
+    CONCEPT_TYPES = {
+        RDFS_NS + "Class": "Class",
+        OWL_NS + "Class": "Class",
+        RDF_NS + "Property": "Property",
+        RDFS_NS + "Datatype": "Datatype",
+        OWL_NS + "ObjectProperty": "Property",
+        OWL_NS + "DatatypeProperty": "Property",
+        OWL_NS + "AnnotationProperty": "Property",
+    }
+
+    # Streaming reader for each format; formats without one are parsed with rdflib
+    STREAM_READERS = {
+        DataFormat.RDF_XML: RDFXMLStreamReader,
+        DataFormat.TURTLE: TurtleStreamReader,
+        DataFormat.N_TRIPLES: NTriplesStreamReader,
+        DataFormat.N_QUADS: NQuadsStreamReader,
+    }
+    # rdflib parser plugin for each format
+    RDFLIB_FORMATS = {
+        DataFormat.RDF_XML: "xml",
+        DataFormat.TURTLE: "turtle",
+        DataFormat.JSON_LD: "json-ld",
+        DataFormat.N_TRIPLES: "nt",
+        DataFormat.N_QUADS: "nquads",
+    }
+    # Line-based sources larger than this are read in ranges of this size by worker processes
+    LINE_RANGE_SIZE = 16 << 20
+
+    def extract(self, source: SourceDocument, config: OntologyConfig) -> list[Concept]:
+        """Parse an ontology and extract concepts."""
+        data_format = sniff_format(source, config.data_format)
+        reader_class = self.STREAM_READERS.get(data_format)
+        if reader_class is None:
+            return self._extract_rdflib(source, config, data_format)
+
+        from xml.etree import ElementTree
+
+        collector = ConceptCollector(list(self.CONCEPT_TYPES), config.uri_filter)
+        try:
+            if data_format in LINE_FORMATS and self.max_workers > 1 and source.size > self.LINE_RANGE_SIZE:
+                collector = self._collect_line_ranges(source, config, reader_class)
+            else:
+                with source.open() as stream:
+                    reader_class(collector).read(stream)
+        except (ElementTree.ParseError, UnsupportedSyntaxError) as e:
+            logger.info(f"Streaming {data_format.name} reader cannot handle {config.name} ({e}), "
+                        f"parsing with rdflib")
+            return self._extract_rdflib(source, config, data_format)
+
+        return self._concepts(collector, config)
+
+    def _collect_line_ranges(self, source: SourceDocument, config: OntologyConfig,
+                             reader_class) -> ConceptCollector:
+        """Read a line-based source in byte ranges across worker processes.
+
+        The partial collectors are merged in file order, giving exactly what one
+        reader would have collected. At most two ranges per worker are in flight, so
+        the pieces of a compressed source are never all held in memory at once.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        concept_types = list(self.CONCEPT_TYPES)
+        collector = ConceptCollector(concept_types, config.uri_filter)
+        pending = collections.deque()
+        logger.info(f"Reading {config.name} ({source.size / 1e6:.1f} MB) in line ranges "
+                    f"with {self.max_workers} worker processes")
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            try:
+                for piece, start, end in _line_ranges(source, self.LINE_RANGE_SIZE):
+                    pending.append(executor.submit(
+                        _collect_line_range, reader_class, piece, start, end, concept_types, config.uri_filter
+                    ))
+                    if len(pending) >= 2 * self.max_workers:
+                        collector.merge(pending.popleft().result())
+                while pending:
+                    collector.merge(pending.popleft().result())
+            except BaseException:
+                for future in pending:
+                    future.cancel()
+                raise
+        return collector
+
+    def _extract_rdflib(self, source: SourceDocument, config: OntologyConfig,
+                        data_format: Optional[DataFormat] = None) -> list[Concept]:
+        """Parse the source into an rdflib graph and extract concepts."""
+        from rdflib import Literal, URIRef
+
+        with self._parse_graph(source, self.RDFLIB_FORMATS[data_format or config.data_format], config,
+                               self.CONCEPT_TYPES, ConceptCollector.RULES) as graph:
+            collector = ConceptCollector(list(self.CONCEPT_TYPES), config.uri_filter)
+            rdf_type = ConceptCollector.RDF_TYPE
+            for concept_type in self.CONCEPT_TYPES:
+                for subject in graph.subjects(URIRef(rdf_type), URIRef(concept_type)):
+                    if isinstance(subject, URIRef):
+                        collector.add(str(subject), rdf_type, concept_type)
+
+            # One pass per label and description predicate gathers every candidate. The
+            # in-memory store visits objects in the order each was first used with the
+            # predicate, which is also the order graph.objects() gives for objects no other
+            # subject shares; subjects with shared objects are read again in their own order.
+            typed = {URIRef(uri) for subjects in collector.typed.values() for uri in subjects}
+            for predicate in ConceptCollector.RULES:
+                predicate_ref = URIRef(predicate)
+                candidates: dict[URIRef, list] = {}
+                owners: dict = {}
+                shared = set()
+                for subject, obj in graph.subject_objects(predicate_ref):
+                    # Keyed by text alone, which is cheaper to hash and errs towards re-reading
+                    text = str(obj)
+                    if owners.setdefault(text, subject) != subject:
+                        shared.add(text)
+                    if subject in typed:
+                        candidates.setdefault(subject, []).append(obj)
+
+                for subject, objects in candidates.items():
+                    if len(objects) > 1 and any(str(obj) in shared for obj in objects):
+                        objects = graph.objects(subject, predicate_ref)
+                    uri = str(subject)
+                    for obj in objects:
+                        if isinstance(obj, Literal):
+                            # Already rdflib's lexical form, whatever the datatype
+                            collector.add(uri, predicate, (str(obj), obj.language, None))
+                        else:
+                            collector.add(uri, predicate, str(obj))
+
+        return self._concepts(collector, config)
+
+    def _concepts(self, collector: ConceptCollector, config: OntologyConfig) -> list[Concept]:
+        """Build the concepts recorded by a collector."""
+        return collector.concepts(
+            list(self.CONCEPT_TYPES.items()),
+            config.uri_filter,
+            self._extract_local_name,
+        )
 
     def _extract_local_name(self, uri: str) -> str:
         """Extract the local name from a URI."""
@@ -406,37 +2141,192 @@ class StandardRDFParser:
         return uri.rstrip("/").split("/")[-1]
 
 
-class SchemaOrgParser:
-    """Parser for Schema.org JSON-LD ontology."""
+class SchemaOrgParser(OntologyParser):
+    """Parser for Schema.org JSON-LD ontology.
 
-    def __init__(self, fetcher: OntologyFetcher):
-        self.fetcher = fetcher
+    The schema.org dump is a flat ``@graph`` of nodes under a context of plain
+    prefix mappings, and only ``@type``, ``rdfs:label`` and ``rdfs:comment`` are
+    needed from it. The dump is therefore read with the JSON parser and walked
+    directly, which avoids full JSON-LD expansion into an rdflib graph. Documents
+    using any JSON-LD feature the fast path does not handle are parsed with rdflib,
+    which yields the same concepts.
+    """
 
-    def parse(self, config: OntologyConfig) -> list[Concept]:
+    # Node keys the fast path understands; any other keyword forces the rdflib path
+    NODE_KEYWORDS = {"@id", "@type"}
+    # Characters a prefix IRI must end with to be used in compact IRIs (JSON-LD 1.1)
+    PREFIX_DELIMITERS = ("/", "#", ":", "?", "[", "]", "@")
+    CONCEPT_TYPES = [
+        (RDFS_NS + "Class", "Class"),
+        (RDF_NS + "Property", "Property"),
+    ]
+
+    def extract(self, source: SourceDocument, config: OntologyConfig) -> list[Concept]:
         """Parse Schema.org JSON-LD and extract concepts."""
-        content = self.fetcher.fetch(
-            config.source_url,
-            config.data_format,
-            config.name
-        )
+        try:
+            with source.open() as stream:
+                data = json.load(stream)
+        except ValueError:
+            data = None
+
+        concepts = self._extract_json(data, config) if data is not None else None
+        if concepts is not None:
+            return concepts
+
+        logger.info(f"{config.name} is not a plain schema.org dump, parsing JSON-LD with rdflib")
+        return self._extract_rdflib(source, config)
+
+    def _extract_json(self, data, config: OntologyConfig) -> Optional[list[Concept]]:
+        """Extract concepts by walking the ``@graph`` array directly.
+
+        Returns None if the document uses anything beyond plain prefix mappings and
+        flat nodes, so that the caller can fall back to rdflib.
+        """
+        if not isinstance(data, dict) or not isinstance(data.get("@graph"), list):
+            return None
+        if set(data) - {"@context", "@graph"}:
+            return None
+
+        context = data.get("@context", {})
+        if not isinstance(context, dict):
+            return None
+        for term, iri in context.items():
+            if term.startswith("@") or not isinstance(iri, str) or not iri.endswith(self.PREFIX_DELIMITERS):
+                return None
 
+        def expand(value: str, vocab: bool) -> Optional[str]:
+            """Expand a term or compact IRI; None if it would need a base IRI."""
+            if vocab and value in context:
+                return context[value]
+            prefix, colon, suffix = value.partition(":")
+            if not colon:
+                return None
+            if prefix in context and not suffix.startswith("//"):
+                return context[prefix] + suffix
+            return value
+
+        label_iri = RDFS_NS + "label"
+        comment_iri = RDFS_NS + "comment"
+        typed: dict[str, dict[str, None]] = {iri: {} for iri, _ in self.CONCEPT_TYPES}
+        labels: dict[str, str] = {}
+        comments: dict[str, str] = {}
+
+        for node in data["@graph"]:
+            if not isinstance(node, dict):
+                return None
+            if any(key.startswith("@") and key not in self.NODE_KEYWORDS for key in node):
+                return None
+
+            uri = None
+            node_id = node.get("@id")
+            if node_id is not None:
+                if not isinstance(node_id, str):
+                    return None
+                if not node_id.startswith("_:"):
+                    uri = expand(node_id, vocab=False)
+                    if uri is None:
+                        return None
+
+            node_types = node.get("@type", [])
+            for node_type in node_types if isinstance(node_types, list) else [node_types]:
+                if not isinstance(node_type, str):
+                    return None
+                type_iri = expand(node_type, vocab=True)
+                if type_iri is None:
+                    return None
+                if uri is not None and type_iri in typed:
+                    typed[type_iri].setdefault(uri, None)
+
+            predicates = set()
+            for key, value in node.items():
+                if key in self.NODE_KEYWORDS:
+                    continue
+                predicate = expand(key, vocab=True)
+                if predicate is None:
+                    continue
+                if predicate in predicates:
+                    return None
+                predicates.add(predicate)
+
+                values = value if isinstance(value, list) else [value]
+                if predicate == label_iri or predicate == comment_iri:
+                    texts = self._literal_texts(values)
+                    if texts is None:
+                        return None
+                    target = labels if predicate == label_iri else comments
+                    if uri is not None and texts:
+                        target.setdefault(uri, texts[0])
+                elif not all(self._is_flat_value(v) for v in values):
+                    return None
+
+        concepts = []
+        seen_uris = set()
+        for type_iri, concept_type in self.CONCEPT_TYPES:
+            for uri in typed[type_iri]:
+                # Apply URI filter if specified in config
+                if config.uri_filter and not uri.startswith(config.uri_filter):
+                    continue
+
+                if uri in seen_uris:
+                    continue
+                seen_uris.add(uri)
+
+                concepts.append(Concept(
+                    uri=uri,
+                    label=labels[uri] if uri in labels else self._extract_local_name(uri),
+                    description=comments.get(uri, ""),
+                    concept_type=concept_type,
+                ))
+
+        return concepts
+
+    @staticmethod
+    def _literal_texts(values: list) -> Optional[list[str]]:
+        """Return the lexical forms of plain or language-tagged literals, or None."""
+        texts = []
+        for value in values:
+            if value is None:
+                continue
+            if isinstance(value, str):
+                texts.append(value)
+            elif isinstance(value, dict) and isinstance(value.get("@value"), str) \
+                    and set(value) <= {"@value", "@language"}:
+                texts.append(value["@value"])
+            else:
+                return None
+        return texts
+
+    @staticmethod
+    def _is_flat_value(value) -> bool:
+        """Return True if a property value adds no triples about other subjects' types."""
+        if isinstance(value, dict):
+            return set(value) <= {"@id"} or set(value) <= {"@value", "@language", "@type"}
+        return not isinstance(value, list)
+
+    def _extract_rdflib(self, source: SourceDocument, config: OntologyConfig) -> list[Concept]:
+        """Parse the source as JSON-LD with rdflib and extract concepts."""
         # Parse JSON-LD into rdflib Graph
-        graph = Graph()
         try:
-            graph.parse(data=content, format="json-ld")
+            with self._parse_graph(source, "json-ld", config, [iri for iri, _ in self.CONCEPT_TYPES],
+                                   [RDFS_NS + "label", RDFS_NS + "comment"]) as graph:
+                return self._graph_concepts(graph, config)
         except Exception as e:
             logger.error(f"Failed to parse Schema.org JSON-LD: {e}")
             raise
 
+    def _graph_concepts(self, graph: "Graph", config: OntologyConfig) -> list[Concept]:
+        """Extract concepts from a parsed Schema.org graph."""
+        from rdflib import URIRef
+
         concepts = []
         seen_uris = set()
 
         # Schema.org uses rdfs:Class and rdf:Property
         for rdf_type, concept_type in [
-            (RDFS.Class, "Class"),
-            (RDF.Property, "Property"),
+            (RDFS_NS + "Class", "Class"),
+            (RDF_NS + "Property", "Property"),
         ]:
-            for subject in graph.subjects(RDF.type, rdf_type):
+            for subject in graph.subjects(URIRef(RDF_NS + "type"), URIRef(rdf_type)):
                 if not isinstance(subject, URIRef):
                     continue
 
@@ -460,20 +2350,23 @@ class SchemaOrgParser:
                     concept_type=concept_type,
                 ))
 
-        logger.info(f"Extracted {len(concepts)} concepts from {config.name}")
         return concepts
 
-    def _get_label(self, graph: Graph, subject: URIRef, uri: str) -> str:
+    def _get_label(self, graph: "Graph", subject: "URIRef", uri: str) -> str:
         """Extract label from Schema.org concept."""
-        for label in graph.objects(subject, RDFS.label):
+        from rdflib import URIRef
+
+        for label in graph.objects(subject, URIRef(RDFS_NS + "label")):
             return str(label)
 
         # Extract from URI
         return self._extract_local_name(uri)
 
-    def _get_description(self, graph: Graph, subject: URIRef) -> str:
+    def _get_description(self, graph: "Graph", subject: "URIRef") -> str:
         """Extract description from Schema.org concept."""
-        for desc in graph.objects(subject, RDFS.comment):
+        from rdflib import URIRef
+
+        for desc in graph.objects(subject, URIRef(RDFS_NS + "comment")):
             return str(desc)
         return ""
 
@@ -482,60 +2375,181 @@ class SchemaOrgParser:
         return uri.rstrip("/").split("/")[-1]
 
 
-class ContextMapParser:
-    """Parser for JSON-LD Context files (W3C VC)."""
+class ContextCycleError(ValueError):
+    """Raised when JSON-LD contexts import each other in a cycle."""
+
+
+class ContextLoader:
+    """Document loader that resolves JSON-LD contexts to the IRIs of their terms.
+
+    A context may import remote contexts, as string entries of an ``@context``
+    array or through ``@import``. Each remote context is fetched through the
+    ``OntologyFetcher``, so it is kept in the persistent source cache, and resolved
+    once: its expanded terms are memoized by URL for every later context that
+    imports it. Contexts that import each other raise ``ContextCycleError``.
+    The remote contexts each ontology imports, directly or not, are recorded by
+    ontology name.
+    """
 
     def __init__(self, fetcher: OntologyFetcher):
         self.fetcher = fetcher
+        # Resolved terms of each remote context, by URL
+        self._contexts: dict[str, dict[str, Optional[str]]] = {}
+        # URLs of the remote contexts each remote context imports, directly or not
+        self._imports: dict[str, set[str]] = {}
+        # URLs of the remote contexts each ontology imports, by ontology name
+        self._imported: dict[str, set[str]] = {}
+        # URLs of the remote contexts being resolved, outermost first
+        self._loading: list[str] = []
+
+    def load(self, url: str, ontology_name: str, ttl: Optional[float] = None) -> dict[str, Optional[str]]:
+        """Return the resolved terms of the remote context at ``url``, fetched for ``ontology_name``."""
+        url = urldefrag(url)[0]
+        terms = self._contexts.get(url)
+        if terms is not None:
+            return terms
+        if url in self._loading:
+            cycle = " -> ".join(self._loading[self._loading.index(url):] + [url])
+            raise ContextCycleError(f"JSON-LD contexts import each other: {cycle}")
+
+        self._loading.append(url)
+        try:
+            source = self.fetcher.fetch_source(url, DataFormat.JSON_LD, ontology_name, ttl=ttl)
+            with source.open() as stream:
+                document = json.load(stream)
+            if not isinstance(document, dict) or "@context" not in document:
+                raise ValueError(f"{url} is not a JSON-LD context document")
+            terms, imports = self._resolve(document["@context"], ontology_name, url, ttl)
+        finally:
+            self._loading.pop()
+        logger.debug(f"Resolved {len(terms)} terms of context {url}")
+        self._contexts[url] = terms
+        self._imports[url] = imports
+        return terms
+
+    def resolve(self, context, ontology_name: str, base: Optional[str] = None,
+                ttl: Optional[float] = None) -> dict[str, Optional[str]]:
+        """Resolve an ``@context`` value of ``ontology_name`` to the IRI of each term it defines.
+
+        The value is a context object, the URL of a remote context, or an array of
+        these, processed in order: later definitions override earlier ones and null
+        clears them. Keywords such as ``@vocab`` keep their value; other terms map to
+        their expanded IRI, or None if they have none.
+        """
+        terms, imports = self._resolve(context, ontology_name, base, ttl)
+        self._imported.setdefault(ontology_name, set()).update(imports)
+        return terms
+
+    def imported_by(self, ontology_name: str) -> list[str]:
+        """Return the URLs of the remote contexts an ontology's contexts imported, directly or not."""
+        return sorted(self._imported.get(ontology_name, ()))
+
+    def _resolve(self, context, ontology_name: str, base: Optional[str],
+                 ttl: Optional[float]) -> tuple[dict[str, Optional[str]], set[str]]:
+        """Resolve an ``@context`` value and return its terms with the URLs of the contexts it imports."""
+        terms: dict[str, Optional[str]] = {}
+        imports: set[str] = set()
+
+        def load(reference: str) -> dict[str, Optional[str]]:
+            url = urldefrag(urljoin(base or "", reference))[0]
+            imported = self.load(url, ontology_name, ttl)
+            imports.update({url, *self._imports[url]})
+            return imported
+
+        for item in context if isinstance(context, list) else [context]:
+            if item is None:
+                terms = {}
+            elif isinstance(item, str):
+                terms.update(load(item))
+            elif isinstance(item, dict):
+                if isinstance(item.get("@import"), str):
+                    terms.update(load(item["@import"]))
+                terms.update(self._define(item, terms))
+            else:
+                logger.warning(f"Ignoring unexpected context entry: {item!r}")
+        return terms, imports
+
+    @staticmethod
+    def _define(definitions: dict, active: dict[str, Optional[str]]) -> dict[str, Optional[str]]:
+        """Expand the terms of one context object against the context active before it."""
+        vocab = definitions.get("@vocab", active.get("@vocab"))
+        terms: dict[str, Optional[str]] = {key: value for key, value in definitions.items()
+                                           if key.startswith("@") and key != "@import"}
+        pending: set[str] = set()
+
+        def expand(term: str) -> Optional[str]:
+            if term in terms:
+                return terms[term]
+            value = definitions[term]
+            if isinstance(value, dict):
+                value = value.get("@id")
+                if not value:
+                    return vocab + term if isinstance(vocab, str) else None
+            if not isinstance(value, str):
+                return None
+            if value.startswith(("http://", "https://")):
+                return value
+            if ":" in value and not value.startswith("@"):
+                prefix, local = value.split(":", 1)
+                if prefix in definitions and not prefix.startswith("@"):
+                    if prefix in pending:
+                        return None
+                    pending.add(prefix)
+                    namespace = terms[prefix] = expand(prefix)
+                    pending.discard(prefix)
+                else:
+                    namespace = active.get(prefix)
+                if namespace is not None:
+                    return namespace + local
+            return None
+
+        for term in definitions:
+            if term not in terms:
+                terms[term] = expand(term)
+        return terms
 
-    def parse(self, config: OntologyConfig) -> list[Concept]:
-        """Parse a JSON-LD context file and extract concepts."""
-        content = self.fetcher.fetch(
-            config.source_url,
-            config.data_format,
-            config.name
-        )
 
+class ContextMapParser(OntologyParser):
+    """Parser for JSON-LD Context files (W3C VC)."""
+
+    def __init__(self, fetcher: OntologyFetcher, max_workers: Optional[int] = None):
+        super().__init__(fetcher, max_workers)
+        # Extraction only walks contexts the loader memoizes, and a concept cache keyed
+        # by the document alone would miss changes to the contexts it imports
+        self.concept_cache = None
+        self.context_loader = ContextLoader(fetcher)
+
+    def _extract_sources(self, sources: list[SourceDocument], config: OntologyConfig) -> list[list[Concept]]:
+        """Extract sources in this process, where the loader records the contexts they import."""
+        return [self.extract(source, config) for source in sources]
+
+    def imported_sources(self, config: OntologyConfig) -> list[str]:
+        """Return the URLs of the remote contexts an ontology's contexts imported."""
+        return self.context_loader.imported_by(config.name)
+
+    def extract(self, source: SourceDocument, config: OntologyConfig) -> list[Concept]:
+        """Parse a JSON-LD context file and extract concepts."""
         try:
-            data = json.loads(content)
+            with source.open() as stream:
+                data = json.load(stream)
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON context: {e}")
             raise
 
         concepts = []
         context = data.get("@context", data)
-
-        # Handle nested context (array or dict)
-        if isinstance(context, list):
-            # Merge all context objects
-            merged = {}
-            for item in context:
-                if isinstance(item, dict):
-                    merged.update(item)
-            context = merged
-
-        if not isinstance(context, dict):
+        if not isinstance(context, (dict, list, str)):
             logger.warning(f"Unexpected context type: {type(context)}")
             return concepts
 
-        for key, value in context.items():
-            # Skip system keys
-            if key.startswith("@"):
-                continue
+        # Resolve the context, with the contexts it imports, to each term's full IRI
+        terms = self.context_loader.resolve(context, config.name, base=source.url, ttl=config.cache_ttl)
 
-            # Resolve the full IRI
-            uri = self._resolve_uri(key, value, context)
-            if not uri:
+        for key, uri in terms.items():
+            # Skip system keys and terms that do not map to an IRI
+            if key.startswith("@") or not uri:
                 continue
 
-            # Determine type based on value structure
-            concept_type = "Property"  # Default for VC contexts
-            if isinstance(value, dict):
-                if value.get("@type") == "@id":
-                    concept_type = "Property"
-                elif "@container" in value:
-                    concept_type = "Property"
-
             # Generate label from key (CamelCase split)
             label = self._camel_case_to_words(key)
             description = f"Defined in {config.name}"
@@ -544,39 +2558,11 @@ class ContextMapParser:
                 uri=uri,
                 label=label,
                 description=description,
-                concept_type=concept_type,
+                concept_type="Property",  # Terms of VC contexts are properties
             ))
 
-        logger.info(f"Extracted {len(concepts)} concepts from {config.name}")
         return concepts
 
-    def _resolve_uri(self, key: str, value, context: dict) -> Optional[str]:
-        """Resolve a context key to its full IRI."""
-        if isinstance(value, str):
-            # Simple string mapping
-            if value.startswith("http://") or value.startswith("https://"):
-                return value
-            # Check for prefix:local format
-            if ":" in value and not value.startswith("@"):
-                prefix, local = value.split(":", 1)
-                if prefix in context:
-                    base = context[prefix]
-                    if isinstance(base, str):
-                        return base + local
-            return None
-
-        elif isinstance(value, dict):
-            # Object with @id
-            id_value = value.get("@id")
-            if id_value:
-                return self._resolve_uri(key, id_value, context)
-            # If no @id, try to construct from vocab
-            vocab = context.get("@vocab")
-            if vocab:
-                return vocab + key
-
-        return None
-
     def _camel_case_to_words(self, name: str) -> str:
         """Convert CamelCase to space-separated words."""
         # Insert space before uppercase letters
@@ -584,70 +2570,346 @@ class ContextMapParser:
         return result
 
 
+# Parser for each processing strategy, by name. A plugin parser may be registered as a
+# "module:ClassName" reference, imported the first time an ontology using it is processed
+_STRATEGY_PARSERS: dict[str, Union[type[OntologyParser], str]] = {
+    ProcessingStrategy.STANDARD_RDF.value: StandardRDFParser,
+    ProcessingStrategy.SCHEMA_ORG_LD.value: SchemaOrgParser,
+    ProcessingStrategy.CONTEXT_MAP.value: ContextMapParser,
+}
+# Entry point group through which installed packages provide parsers, named by strategy
+STRATEGY_ENTRY_POINT_GROUP = "known_value_assigner.strategies"
+_strategy_entry_points_loaded = False
+
+
+def register_strategy(name: str, parser: Union[type[OntologyParser], str]) -> None:
+    """Register the parser for a processing strategy, replacing any earlier one.
+
+    ``parser`` is an ``OntologyParser`` subclass, or a ``"module:ClassName"``
+    reference so that the plugin module is only imported when an ontology with
+    ``strategy=name`` is processed.
+    """
+    if isinstance(parser, str) and ":" not in parser:
+        raise ValueError(f"Parser reference must be 'module:ClassName', got {parser!r}")
+    _STRATEGY_PARSERS[name] = parser
+
+
+def get_parser_class(strategy: Union[ProcessingStrategy, str]) -> Optional[type[OntologyParser]]:
+    """Return the parser class for a strategy, importing a plugin on first use.
+
+    Strategies that were not registered are looked up among the installed
+    ``known_value_assigner.strategies`` entry points; None if there is none.
+    """
+    global _strategy_entry_points_loaded
+    name = strategy.value if isinstance(strategy, ProcessingStrategy) else strategy
+    if name not in _STRATEGY_PARSERS and not _strategy_entry_points_loaded:
+        from importlib.metadata import entry_points
+
+        for entry_point in entry_points(group=STRATEGY_ENTRY_POINT_GROUP):
+            _STRATEGY_PARSERS.setdefault(entry_point.name, entry_point.value)
+        _strategy_entry_points_loaded = True
+
+    parser = _STRATEGY_PARSERS.get(name)
+    if isinstance(parser, str):
+        import importlib
+
+        module_name, _, class_name = parser.partition(":")
+        parser = getattr(importlib.import_module(module_name), class_name)
+        _STRATEGY_PARSERS[name] = parser
+    return parser
+
+
+class ProcessStatus(Enum):
+    """Outcome of processing one ontology."""
+    WRITTEN = "written"
+    UP_TO_DATE = "up to date"
+    FAILED = "failed"
+
+
+class BuildManifest:
+    """Record of the inputs each registry was last generated from.
+
+    For every written registry the manifest stores hashes of its inputs (source
+    content, ``OntologyConfig`` fields, the Blockchain Commons overrides that apply
+    to its URIs, the assignment mode, the tool version and the documents the
+    sources import, such as remote JSON-LD contexts) and of its output files. A
+    registry whose inputs and outputs still match can be skipped on the next run.
+    """
+
+    FILENAME = "build_manifest.json"
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _hash(value) -> str:
+        return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    @classmethod
+    def compute_inputs(cls, config: OntologyConfig, source_sha256: str, bc_overrides: list,
+                       stable: bool = False, imports: Optional[dict[str, str]] = None) -> dict:
+        """Hash the inputs that determine a registry's content.
+
+        ``imports`` maps the URL of each document the sources import to its hash.
+        """
+        config_fields = {
+            key: value.value if isinstance(value, Enum) else value
+            for key, value in asdict(config).items()
+        }
+        return {
+            "source": source_sha256,
+            "config": cls._hash(config_fields),
+            "bc_overrides": cls._hash(bc_overrides),
+            "tool_version": TOOL_VERSION,
+            **({"assignment": "stable"} if stable else {}),
+            **({"imports": dict(sorted(imports.items()))} if imports else {}),
+        }
+
+    @staticmethod
+    def hash_file(path: Path) -> Optional[str]:
+        """Return the SHA-256 of a file, or None if it does not exist."""
+        try:
+            return hashlib.sha256(path.read_bytes()).hexdigest()
+        except FileNotFoundError:
+            return None
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the recorded build for a registry, if any."""
+        return _read_json_file(self.path, "builds").get(key)
+
+    def record(self, key: str, inputs: dict, outputs: dict[str, str]) -> None:
+        """Record the inputs and output hashes of a registry that was just written."""
+        build = {"inputs": inputs, "outputs": outputs}
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            _update_json_file(self.path, lambda builds: builds.__setitem__(key, build), "builds")
+
+
+class CodepointOverlapError(ValueError):
+    """Raised when a registry would use codepoints within another registry's range."""
+
+
+@dataclass(frozen=True)
+class CodepointRange:
+    """The codepoints a registry occupies: from its start to the highest one it assigned."""
+    registry: str
+    start: int
+    end: int
+    used: int
+
+    @classmethod
+    def of_codepoints(cls, registry: str, start: int, codepoints) -> "CodepointRange":
+        """Build the range of a registry from the codepoints it lists, tombstones included.
+
+        Codepoints below ``start`` were reused from the Blockchain Commons registry
+        and are not part of the range. A registry without any is reserved at ``start``.
+        """
+        own = [codepoint for codepoint in codepoints if codepoint >= start]
+        return cls(registry, start, max(own, default=start), len(own))
+
+    @classmethod
+    def of_registry(cls, registry: str, data: dict) -> "CodepointRange":
+        """Build the range of a registry from its JSON content."""
+        start = data.get("ontology", {}).get("start_code_point", 0)
+        listed = [*data.get("entries", []), *data.get("tombstones", [])]
+        return cls.of_codepoints(registry, start, [
+            entry["codepoint"] for entry in listed if isinstance(entry.get("codepoint"), int)
+        ])
+
+    def overlaps(self, other: "CodepointRange") -> bool:
+        return self.start <= other.end and other.start <= self.end
+
+
+class CodepointRangeMap:
+    """Interval index of the codepoint ranges used by a directory of JSON registries.
+
+    Ranges are kept sorted by start, so overlaps, headroom and free gaps are found
+    in one sweep after an O(n log n) sort, cheap enough to run on every build.
+    """
+
+    def __init__(self, ranges: list[CodepointRange]):
+        self.ranges = sorted(ranges, key=lambda r: (r.start, r.end, r.registry))
+
+    @classmethod
+    def from_directory(cls, json_dir: Path) -> "CodepointRangeMap":
+        """Index every ``*_registry.json`` file in a directory; unreadable files are skipped."""
+        return cls.from_index(KnownValueIndex.from_directory(json_dir))
+
+    @classmethod
+    def from_index(cls, index: KnownValueIndex) -> "CodepointRangeMap":
+        """Build the ranges of the registries in a Known Value index."""
+        return cls([
+            CodepointRange.of_codepoints(
+                r.registry, r.start, [*(value.codepoint for value in r.values), *r.tombstones]
+            )
+            for r in index.registries.values()
+        ])
+
+    def add(self, codepoint_range: CodepointRange) -> None:
+        """Insert or replace the range of a registry."""
+        import bisect
+
+        self.ranges = [r for r in self.ranges if r.registry != codepoint_range.registry]
+        keys = [(r.start, r.end, r.registry) for r in self.ranges]
+        index = bisect.bisect(keys, (codepoint_range.start, codepoint_range.end, codepoint_range.registry))
+        self.ranges.insert(index, codepoint_range)
+
+    def conflicts(self, codepoint_range: CodepointRange) -> list[CodepointRange]:
+        """Return the ranges of other registries that a range overlaps."""
+        conflicts = []
+        for other in self.ranges:
+            if other.start > codepoint_range.end:
+                break
+            if other.registry != codepoint_range.registry and other.overlaps(codepoint_range):
+                conflicts.append(other)
+        return conflicts
+
+    def overlaps(self) -> list[tuple[CodepointRange, CodepointRange]]:
+        """Return every pair of overlapping ranges."""
+        pairs = []
+        active: list[CodepointRange] = []
+        for current in self.ranges:
+            active = [r for r in active if r.end >= current.start]
+            pairs.extend((r, current) for r in active)
+            active.append(current)
+        return pairs
+
+    def headroom(self) -> dict[str, Optional[int]]:
+        """Codepoints each registry can still assign before reaching the next range; None after the last."""
+        headroom: dict[str, Optional[int]] = {}
+        # Ranges are sorted by start, so the next greater start only ever moves forward
+        following = 0
+        for current in self.ranges:
+            while following < len(self.ranges) and self.ranges[following].start <= current.start:
+                following += 1
+            if following < len(self.ranges):
+                headroom[current.registry] = max(self.ranges[following].start - current.end - 1, 0)
+            else:
+                headroom[current.registry] = None
+        return headroom
+
+    def gaps(self, limit: int = 5) -> list[tuple[int, int]]:
+        """Return the largest free intervals ``(first, last)`` between ranges, largest first.
+
+        Codepoints above the last range are open-ended and not reported as a gap.
+        """
+        gaps = []
+        covered = -1
+        for current in self.ranges:
+            if current.start > covered + 1:
+                gaps.append((covered + 1, current.start - 1))
+            covered = max(covered, current.end)
+        gaps.sort(key=lambda gap: (gap[0] - gap[1], gap[0]))
+        return gaps[:limit]
+
+
+def print_codepoint_ranges(json_dir: Path) -> bool:
+    """Print the codepoint ranges of the registries in a directory; return False on overlaps."""
+    range_map = CodepointRangeMap.from_directory(json_dir)
+    headroom = range_map.headroom()
+    print(f"\nCodepoint Ranges in {json_dir}:")
+    print("-" * 76)
+    print(f"{'Registry':<34} {'Start':>8} {'End':>8} {'Used':>7} {'Headroom':>14}")
+    print("-" * 76)
+    for r in range_map.ranges:
+        room = headroom[r.registry]
+        print(f"{r.registry:<34} {r.start:>8} {r.end:>8} {r.used:>7} {'unbounded' if room is None else room:>14}")
+    print("-" * 76)
+
+    overlaps = range_map.overlaps()
+    for a, b in overlaps:
+        print(f"OVERLAP: {a.registry} ({a.start}-{a.end}) and {b.registry} ({b.start}-{b.end})")
+    if not overlaps:
+        print("No overlapping ranges")
+    print("Largest free gaps: " + ", ".join(
+        f"{first}-{last} ({last - first + 1})" for first, last in range_map.gaps()
+    ))
+    return not overlaps
+
+
 class KnownValueAssigner:
     """Main class for assigning Known Values to ontological concepts."""
 
-    def __init__(self, output_dir: Path, cache_dir: Path, use_cache: bool = True, verbose: bool = False):
+    def __init__(self, output_dir: Path, cache_dir: Path, use_cache: bool = True, verbose: bool = False,
+                 revalidate: bool = False, incremental: bool = True, stages: Optional[StageTimer] = None,
+                 profile_dir: Optional[Path] = None, stable: bool = False,
+                 parser_workers: Optional[int] = None):
         self.output_dir = output_dir
-        self.fetcher = OntologyFetcher(cache_dir, use_cache)
+        # Worker processes each parser may start (None = one per CPU core)
+        self.parser_workers = parser_workers
+        # Per-stage timings of every ontology this assigner processes
+        self.stages = stages or StageTimer()
+        self.fetcher = OntologyFetcher(cache_dir, use_cache, revalidate=revalidate, stages=self.stages)
         self.verbose = verbose
+        # Write a cProfile dump of each processed ontology here
+        self.profile_dir = profile_dir
+        # Keep the codepoints of the registry already on disk and only append new ones
+        self.stable = stable
+        # Ranges of the registries in the output directory, loaded before the first write
+        self._range_map: Optional[CodepointRangeMap] = None
+        # Skip registries whose inputs are unchanged (requires the source cache)
+        self.manifest = BuildManifest(cache_dir / BuildManifest.FILENAME) if use_cache and incremental else None
+
+        # Parsers by strategy name, built for the first ontology that needs each
+        self._parsers: dict[str, OntologyParser] = {}
+
+        # Every registry in the output directory, indexed once; the snapshot in the
+        # cache directory is reused while the registry files are unchanged
+        self.index = KnownValueIndex.from_directory(
+            output_dir / "json", snapshot=cache_dir / KnownValueIndex.SNAPSHOT_FILENAME if use_cache else None
+        )
 
-        # Initialize parsers
-        self.standard_parser = StandardRDFParser(self.fetcher)
-        self.schema_parser = SchemaOrgParser(self.fetcher)
-        self.context_parser = ContextMapParser(self.fetcher)
-
-        # Load Blockchain Commons core registry for URI -> codepoint mapping
-        self.bc_uri_to_codepoint: dict[str, int] = {}
+        # Blockchain Commons core registry for URI -> codepoint mapping
+        self.bc_uri_to_codepoint: dict[str, tuple[int, str]] = {}
         self._load_blockchain_commons_registry()
 
     def _load_blockchain_commons_registry(self) -> None:
-        """Load the Blockchain Commons registry to get pre-assigned codepoints and names."""
-        bc_registry_path = self.output_dir / "json" / "0_blockchain_commons_registry.json"
-        if not bc_registry_path.exists():
-            logger.warning(f"Blockchain Commons registry not found at {bc_registry_path}")
+        """Take the pre-assigned codepoints and names of the Blockchain Commons registry from the index."""
+        if BLOCKCHAIN_COMMONS_REGISTRY not in self.index.registries:
+            logger.warning(f"Blockchain Commons registry not found in {self.output_dir / 'json'}")
             return
 
-        try:
-            with open(bc_registry_path, "r", encoding="utf-8") as f:
-                registry = json.load(f)
-
-            for entry in registry.get("entries", []):
-                uri = entry.get("uri", "")
-                codepoint = entry.get("codepoint")
-                name = entry.get("name", "")
-                if uri and codepoint is not None:
-                    self.bc_uri_to_codepoint[uri] = (codepoint, name)
-
-            logger.info(f"Loaded {len(self.bc_uri_to_codepoint)} URI mappings from Blockchain Commons registry")
-        except Exception as e:
-            logger.error(f"Failed to load Blockchain Commons registry: {e}")
+        for value in self.index.values(BLOCKCHAIN_COMMONS_REGISTRY):
+            if value.uri:
+                self.bc_uri_to_codepoint[value.uri] = (value.codepoint, value.name)
+        logger.info(f"Loaded {len(self.bc_uri_to_codepoint)} URI mappings from Blockchain Commons registry")
+
+    def parser_for(self, config: OntologyConfig) -> Optional[OntologyParser]:
+        """Return the parser for an ontology's strategy, or None if none is registered."""
+        parser = self._parsers.get(config.strategy_name)
+        if parser is None:
+            parser_class = get_parser_class(config.strategy)
+            if parser_class is None:
+                return None
+            parser = self._parsers[config.strategy_name] = parser_class(self.fetcher)
+            if self.parser_workers is not None:
+                parser.max_workers = self.parser_workers
+        return parser
 
     def process_ontology(self, config: OntologyConfig) -> Optional[list[KnownValueEntry]]:
         """Process a single ontology and return its Known Value entries."""
         logger.info(f"Processing ontology: {config.name}")
 
         try:
-            # Parse based on strategy
-            if config.strategy == ProcessingStrategy.STANDARD_RDF:
-                concepts = self.standard_parser.parse(config)
-            elif config.strategy == ProcessingStrategy.SCHEMA_ORG_LD:
-                concepts = self.schema_parser.parse(config)
-            elif config.strategy == ProcessingStrategy.CONTEXT_MAP:
-                concepts = self.context_parser.parse(config)
-            else:
-                logger.error(f"Unknown strategy: {config.strategy}")
+            parser = self.parser_for(config)
+            if parser is None:
+                logger.error(f"Unknown strategy: {config.strategy_name}")
                 return None
+            concepts = parser.parse(config)
 
             if not concepts:
                 logger.warning(f"No concepts extracted from {config.name}")
                 return []
 
             # Deterministic assignment
-            entries = self._assign_known_values(concepts, config)
+            with self.stages.stage(config.name, "assign", concepts=len(concepts)) as span:
+                entries = self._assign_known_values(concepts, config)
+                span["entries"] = len(entries)
 
             # Check for semantic collisions with core values
-            self._check_collisions(entries)
+            with self.stages.stage(config.name, "collision-check", entries=len(entries)):
+                self._check_collisions(entries)
 
             return entries
 
@@ -658,13 +2920,66 @@ class KnownValueAssigner:
                 traceback.print_exc()
             return None
 
+    def _previous_registry(self, config: OntologyConfig) -> Optional[dict]:
+        """Load the registry last written for an ontology, or None if there is none."""
+        json_file, _ = self._registry_paths(config)
+        try:
+            with open(json_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            raise ValueError(f"Cannot read the existing registry {json_file} for stable assignment: {e}")
+
+    def _locked_codepoints(self, config: OntologyConfig) -> dict[str, int]:
+        """Map each URI ever assigned in the previous registry to its codepoint.
+
+        Retired entries are included, so a concept that returns gets its old codepoint
+        back. Codepoints below the ontology's range came from the Blockchain Commons
+        registry, which is consulted afresh instead.
+        """
+        registry = self._previous_registry(config)
+        if registry is None:
+            return {}
+        locked = {}
+        for entry in [*registry.get("entries", []), *registry.get("tombstones", [])]:
+            uri, codepoint = entry.get("uri"), entry.get("codepoint")
+            if uri and isinstance(codepoint, int) and codepoint >= config.start_code_point:
+                locked[uri] = codepoint
+        return locked
+
+    def _tombstones(self, config: OntologyConfig, entries: list[KnownValueEntry]) -> list[dict]:
+        """Return the previous registry's entries and tombstones whose URIs no longer hold a codepoint in
+        the ontology's range, by codepoint.
+
+        Besides URIs that are gone, this retires the codepoint of a URI that now uses a
+        Blockchain Commons codepoint, so it is neither reused nor lost if core drops the URI again.
+        """
+        registry = self._previous_registry(config)
+        if registry is None:
+            return []
+        current = {entry.uri for entry in entries if entry.codepoint >= config.start_code_point}
+        tombstones = {}
+        for entry in [*registry.get("tombstones", []), *registry.get("entries", [])]:
+            if entry.get("uri") not in current and entry.get("codepoint", -1) >= config.start_code_point:
+                tombstones[entry["uri"]] = entry
+        return sorted(tombstones.values(), key=lambda entry: entry["codepoint"])
+
     def _assign_known_values(self, concepts: list[Concept], config: OntologyConfig) -> list[KnownValueEntry]:
-        """Deterministically assign Known Values to concepts."""
+        """Deterministically assign Known Values to concepts.
+
+        In stable mode the previously written registry acts as a lockfile: URIs it
+        assigned keep their codepoints, and new URIs are numbered, in URI order, after
+        the highest codepoint it ever assigned, so no codepoint shifts or is reused.
+        """
         # Sort alphabetically by URI for deterministic assignment
         sorted_concepts = sorted(concepts, key=lambda c: c.uri)
 
         entries = []
         current_codepoint = config.start_code_point
+        locked = self._locked_codepoints(config) if self.stable else {}
+        if locked:
+            current_codepoint = max(locked.values()) + 1
 
         for concept in sorted_concepts:
             # Check if this URI already has a codepoint in Blockchain Commons registry
@@ -682,18 +2997,24 @@ class KnownValueAssigner:
                 # Extract local name from label or URI, then prepend ontology name as prefix
                 local_name = self._to_local_name(concept.label, concept.uri)
                 name = f"{config.name}:{local_name}"
-                # Assign from ontology's range
+                codepoint = locked.get(concept.uri)
+                if codepoint is None:
+                    # Assign from ontology's range
+                    codepoint = current_codepoint
+                    current_codepoint += 1
                 entry = KnownValueEntry(
-                    codepoint=current_codepoint,
+                    codepoint=codepoint,
                     name=name,
                     type=concept.concept_type.lower(),
                     uri=concept.uri,
                     description=concept.description if concept.description else "",
                 )
-                current_codepoint += 1
 
             entries.append(entry)
 
+        if locked:
+            entries.sort(key=lambda entry: entry.codepoint)
+
         # Check for duplicate canonical names
         self._check_duplicate_names(entries, config)
 
@@ -773,38 +3094,64 @@ class KnownValueAssigner:
 
     def write_registry(self, config: OntologyConfig, entries: list[KnownValueEntry]) -> tuple[Path | None, Path | None]:
         """Write the registry to JSON and Markdown files."""
+        with self.stages.stage(config.name, "write", entries=len(entries)) as span:
+            json_file, markdown_file = self._write_registry(config, entries)
+            span["bytes"] = sum(path.stat().st_size for path in (json_file, markdown_file) if path is not None)
+            return json_file, markdown_file
+
+    def _write_registry(self, config: OntologyConfig,
+                        entries: list[KnownValueEntry]) -> tuple[Path | None, Path | None]:
         # Create output subdirectories
-        json_dir = self.output_dir / "json"
-        markdown_dir = self.output_dir / "markdown"
-        json_dir.mkdir(parents=True, exist_ok=True)
-        markdown_dir.mkdir(parents=True, exist_ok=True)
+        json_file, markdown_file = self._registry_paths(config)
+        json_file.parent.mkdir(parents=True, exist_ok=True)
+        markdown_file.parent.mkdir(parents=True, exist_ok=True)
 
-        base_name = f"{config.start_code_point}_{config.name}_registry"
-        json_file = json_dir / f"{base_name}.json"
-        markdown_file = markdown_dir / f"{base_name}.md"
+        base_name = json_file.stem
 
         # Protect manually-created 0_* files from being overwritten
         if base_name.startswith("0_"):
             logger.warning(f"Skipping protected file: {base_name} (0_* files are manually maintained)")
             return None, None
 
+        tombstones = self._tombstones(config, entries) if self.stable else []
+        if tombstones:
+            logger.info(f"Retired {len(tombstones)} codepoints of {config.name} whose concepts were removed")
+
+        # Codepoints reused from the Blockchain Commons registry are outside the range
+        codepoint_range = CodepointRange.of_codepoints(
+            base_name,
+            config.start_code_point,
+            [e.codepoint for e in entries if e.uri not in self.bc_uri_to_codepoint]
+            + [t["codepoint"] for t in tombstones],
+        )
+        if self._range_map is None:
+            self._range_map = CodepointRangeMap.from_index(self.index)
+        conflicts = self._range_map.conflicts(codepoint_range)
+        if conflicts:
+            raise CodepointOverlapError(
+                f"{base_name} would use codepoints {codepoint_range.start}-{codepoint_range.end}, overlapping "
+                + ", ".join(f"{r.registry} ({r.start}-{r.end})" for r in conflicts)
+            )
+
         registry = {
             "ontology": {
                 "name": config.name,
                 "source_url": config.source_url,
+                **({"sources": config.source_urls} if config.sources else {}),
                 "start_code_point": config.start_code_point,
-                "processing_strategy": config.strategy.value,
+                "processing_strategy": config.strategy_name,
             },
             "generated": {
                 "tool": "KnownValueAssigner",
-                "version": "1.0.0",
+                "version": TOOL_VERSION,
             },
             "entries": [entry.to_dict() for entry in entries],
+            **({"tombstones": tombstones} if tombstones else {}),
             "statistics": {
                 "total_entries": len(entries),
                 "code_point_range": {
-                    "start": config.start_code_point,
-                    "end": config.start_code_point + len(entries) - 1 if entries else config.start_code_point,
+                    "start": codepoint_range.start,
+                    "end": codepoint_range.end,
                 },
             },
         }
@@ -813,6 +3160,8 @@ class KnownValueAssigner:
         with open(json_file, "w", encoding="utf-8") as f:
             json.dump(registry, f, indent=2, ensure_ascii=False)
         logger.info(f"Wrote JSON registry to {json_file}")
+        self._range_map.add(codepoint_range)
+        self.index.add_registry(base_name, registry)
 
         # Write Markdown
         self._write_markdown_registry(markdown_file, config, entries, registry)
@@ -820,6 +3169,14 @@ class KnownValueAssigner:
 
         return json_file, markdown_file
 
+    def _registry_paths(self, config: OntologyConfig) -> tuple[Path, Path]:
+        """Return the JSON and Markdown registry paths for an ontology."""
+        base_name = f"{config.start_code_point}_{config.name}_registry"
+        return (
+            self.output_dir / "json" / f"{base_name}.json",
+            self.output_dir / "markdown" / f"{base_name}.md",
+        )
+
     def _write_markdown_registry(self, filepath: Path, config: OntologyConfig,
                                   entries: list[KnownValueEntry], registry: dict) -> None:
         """Write the registry as a Markdown table."""
@@ -832,8 +3189,9 @@ class KnownValueAssigner:
             f"|----------|-------|",
             f"| **Name** | {config.name} |",
             f"| **Source URL** | {config.source_url} |",
+            *([f"| **Additional Sources** | {', '.join(config.sources)} |"] if config.sources else []),
             f"| **Start Code Point** | {config.start_code_point} |",
-            f"| **Processing Strategy** | {config.strategy.value} |",
+            f"| **Processing Strategy** | {config.strategy_name} |",
             "",
             "## Statistics",
             "",
@@ -855,13 +3213,228 @@ class KnownValueAssigner:
             desc = entry.description.replace("|", "\\|").replace("\n", " ") if entry.description else ""
             lines.append(f"| {entry.codepoint} | `{name}` | {entry.type} | {uri} | {desc} |")
 
+        if registry.get("tombstones"):
+            lines += [
+                "",
+                "## Retired Codepoints",
+                "",
+                "These codepoints belonged to concepts that were removed upstream or now use a Blockchain Commons "
+                "codepoint. They are never reassigned.",
+                "",
+                "| Codepoint | Name | URI |",
+                "|-----------|------|-----|",
+            ]
+            for tombstone in registry["tombstones"]:
+                name = tombstone.get("name", "").replace("|", "\\|")
+                uri = tombstone.get("uri", "").replace("|", "\\|")
+                lines.append(f"| {tombstone['codepoint']} | `{name}` | {uri} |")
+
         lines.append("")  # Final newline
 
         with open(filepath, "w", encoding="utf-8") as f:
             f.write("\n".join(lines))
 
+    def _bc_overrides_for(self, uris) -> list:
+        """Return the Blockchain Commons overrides that apply to any of the given URIs."""
+        return sorted(
+            [uri, *self.bc_uri_to_codepoint[uri]]
+            for uri in set(uris) if uri in self.bc_uri_to_codepoint
+        )
+
+    def _sources_sha256(self, config: OntologyConfig) -> Optional[str]:
+        """Hash the cached content of all of an ontology's sources, or None if any is missing."""
+        hashes = [self.fetcher.cached_sha256(url, config.name, config.cache_ttl) for url in config.source_urls]
+        if None in hashes:
+            return None
+        if len(hashes) == 1:
+            return hashes[0]
+        return hashlib.sha256("\n".join(hashes).encode("utf-8")).hexdigest()
+
+    def _imports_sha256(self, config: OntologyConfig, urls) -> Optional[dict[str, str]]:
+        """Hash the cached content of documents an ontology's sources import, or None if any is missing."""
+        hashes = {url: self.fetcher.cached_sha256(url, config.name, config.cache_ttl) for url in urls}
+        if None in hashes.values():
+            return None
+        return hashes
+
+    def _is_up_to_date(self, config: OntologyConfig) -> bool:
+        """Return True if the registry on disk was built from the current inputs."""
+        json_file, markdown_file = self._registry_paths(config)
+        build = self.manifest.get(str(json_file.resolve()))
+        if build is None:
+            return False
+
+        source_sha256 = self._sources_sha256(config)
+        if source_sha256 is None or build["inputs"].get("source") != source_sha256:
+            return False
+        # The imports recorded last time; if the sources changed what they import, they changed too
+        imports = self._imports_sha256(config, build["inputs"].get("imports", {}))
+        if imports is None:
+            return False
+
+        try:
+            json_bytes = json_file.read_bytes()
+        except FileNotFoundError:
+            return False
+        outputs = {
+            "json": hashlib.sha256(json_bytes).hexdigest(),
+            "markdown": BuildManifest.hash_file(markdown_file),
+        }
+        if outputs != build["outputs"]:
+            return False
+
+        uris = [entry.get("uri", "") for entry in json.loads(json_bytes).get("entries", [])]
+        inputs = BuildManifest.compute_inputs(config, source_sha256, self._bc_overrides_for(uris), self.stable,
+                                              imports)
+        return inputs == build["inputs"]
+
+    def _record_build(self, config: OntologyConfig, entries: list[KnownValueEntry],
+                      json_file: Path, markdown_file: Path) -> None:
+        """Record the inputs and outputs of a registry that was just written."""
+        source_sha256 = self._sources_sha256(config)
+        imports = self._imports_sha256(config, self.parser_for(config).imported_sources(config))
+        if source_sha256 is None or imports is None:
+            return
+        inputs = BuildManifest.compute_inputs(
+            config, source_sha256, self._bc_overrides_for(e.uri for e in entries), self.stable, imports
+        )
+        outputs = {
+            "json": BuildManifest.hash_file(json_file),
+            "markdown": BuildManifest.hash_file(markdown_file),
+        }
+        self.manifest.record(str(json_file.resolve()), inputs, outputs)
+
+    def process_and_write(self, config: OntologyConfig) -> ProcessStatus:
+        """Process a single ontology and write its registry, unless it is up to date.
+
+        With a ``profile_dir``, the work is profiled into ``<name>.pstats`` there.
+        """
+        if self.profile_dir is None:
+            return self._process_and_write(config)
 
-def parse_args() -> argparse.Namespace:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(self._process_and_write, config)
+        finally:
+            self.profile_dir.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(self.profile_dir / f"{config.name}.pstats")
+
+    def _process_and_write(self, config: OntologyConfig) -> ProcessStatus:
+        if self.manifest is not None and self._is_up_to_date(config):
+            logger.info(f"{config.name} is up to date; skipping")
+            return ProcessStatus.UP_TO_DATE
+
+        entries = self.process_ontology(config)
+        if entries is None:
+            return ProcessStatus.FAILED
+        try:
+            json_file, markdown_file = self.write_registry(config, entries)
+        except CodepointOverlapError as e:
+            logger.error(f"Refusing to write the {config.name} registry: {e}")
+            return ProcessStatus.FAILED
+        if self.manifest is not None and json_file is not None:
+            self._record_build(config, entries, json_file, markdown_file)
+        return ProcessStatus.WRITTEN
+
+
+def _process_ontology_job(config: OntologyConfig, output_dir: Path, cache_dir: Path,
+                          options: dict, strategies: dict) -> tuple[str, ProcessStatus, list[dict]]:
+    """Process and write one ontology in a worker process.
+
+    Each worker builds its own assigner so that nothing but the config, the
+    registered strategies, a status and the stage timings crosses the process
+    boundary; the written files are identical to those of a serial run.
+    """
+    _STRATEGY_PARSERS.update(strategies)
+    if options.get("verbose"):
+        logging.getLogger().setLevel(logging.DEBUG)
+    # The ontologies already use every worker; parsers must not start pools of their own
+    options = {"parser_workers": 1, **options}
+    assigner = KnownValueAssigner(output_dir=output_dir, cache_dir=cache_dir, **options)
+    status = assigner.process_and_write(config)
+    return config.name, status, assigner.stages.spans
+
+
+def run_parallel(configs: list[OntologyConfig], jobs: int, output_dir: Path, cache_dir: Path,
+                 stages: Optional[StageTimer] = None, **options) -> list[tuple[str, ProcessStatus]]:
+    """Process ontologies across a pool of worker processes, one ontology per worker.
+
+    ``options`` are passed on to each worker's ``KnownValueAssigner``. Results are
+    returned in the order of ``configs`` regardless of completion order, and the
+    workers' stage timings are added to ``stages`` if given.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = min(jobs, len(configs))
+    logger.info(f"Processing {len(configs)} ontologies with {workers} worker processes")
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_process_ontology_job, config, output_dir, cache_dir, options, dict(_STRATEGY_PARSERS))
+            for config in configs
+        ]
+        results = []
+        for config, future in zip(configs, futures):
+            try:
+                name, status, spans = future.result()
+            except Exception as e:
+                logger.error(f"Worker for {config.name} failed: {e}")
+                results.append((config.name, ProcessStatus.FAILED))
+                continue
+            results.append((name, status))
+            if stages is not None:
+                stages.extend(spans)
+    return results
+
+
+def write_run_report(path: Path, results: list[tuple[str, ProcessStatus]], stages: StageTimer,
+                     seconds: float, jobs: int) -> None:
+    """Write the outcome and per-stage timings of a run as JSON."""
+    report = {
+        "tool": "KnownValueAssigner",
+        "version": TOOL_VERSION,
+        "jobs": jobs,
+        "seconds": seconds,
+        "stages": stages.summary(),
+        "ontologies": {
+            name: {"status": status.value, "stages": stages.summary(name)}
+            for name, status in results
+        },
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    logger.info(f"Wrote run report to {path}")
+
+
+def write_traces(profile_dir: Path, stages: StageTimer) -> None:
+    """Write a Chrome trace of each ontology's stages to ``<name>.trace.json``."""
+    profile_dir.mkdir(parents=True, exist_ok=True)
+    for name in stages.ontologies():
+        with open(profile_dir / f"{name}.trace.json", "w", encoding="utf-8") as f:
+            json.dump(stages.chrome_trace(name), f)
+    logger.info(f"Wrote profiles and stage traces to {profile_dir}")
+
+
+def write_binary_registry(output_dir: Path) -> Path:
+    """Export every registry in the output directory as one memory-mappable file for codepoint lookups."""
+    path = output_dir / "binary" / BinaryRegistry.FILENAME
+    index = KnownValueIndex.from_directory(output_dir / "json")
+    index.save_binary(path)
+    logger.info(f"Wrote binary registry of {len(index)} Known Values to {path}")
+    return path
+
+
+def _non_negative_int(value: str) -> int:
+    """argparse type for counts where 0 has a meaning of its own."""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or more, got {number}")
+    return number
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
     """Parse command-line arguments."""
     parser = argparse.ArgumentParser(
         description="Semantic Ontology Ingest & Known Value Assigner",
@@ -873,6 +3446,10 @@ Examples:
   %(prog)s -o rdf -o owl           Process RDF/RDFS and OWL
   %(prog)s --list                  List available ontologies
   %(prog)s -o foaf -v -d ./output  Process FOAF with verbose output
+  %(prog)s -j 0                    Process all ontologies using every CPU core
+  %(prog)s --revalidate            Check every cached source for upstream changes
+  %(prog)s --stable                Append new concepts without renumbering existing ones
+  %(prog)s --report run.json       Record how long each stage of each ontology took
         """
     )
 
@@ -890,6 +3467,12 @@ Examples:
         help="List all available ontology names and exit."
     )
 
+    parser.add_argument(
+        "--ranges",
+        action="store_true",
+        help="Report the codepoint range, headroom and overlaps of every registry in the output directory and exit."
+    )
+
     parser.add_argument(
         "-d", "--output-dir",
         type=Path,
@@ -910,18 +3493,58 @@ Examples:
         help="Disable caching; always fetch from network."
     )
 
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate every registry, even those whose inputs are unchanged."
+    )
+
+    parser.add_argument(
+        "--stable",
+        action="store_true",
+        help="Keep the codepoints of existing registries; number only new concepts, after the highest used."
+    )
+
+    parser.add_argument(
+        "--revalidate",
+        action="store_true",
+        help="Revalidate every cached source with a conditional GET (ETag/Last-Modified) before use."
+    )
+
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
         help="Enable verbose logging output."
     )
 
-    return parser.parse_args()
+    parser.add_argument(
+        "-j", "--jobs",
+        type=_non_negative_int,
+        default=1,
+        metavar="N",
+        help="Process ontologies in N worker processes (0 = one per CPU core). Defaults to 1."
+    )
 
+    parser.add_argument(
+        "--report",
+        type=Path,
+        metavar="FILE",
+        help="Write per-stage timings, byte and concept counts, and outcomes as JSON to FILE."
+    )
 
-def main() -> int:
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        metavar="DIR",
+        help="Write a cProfile dump (NAME.pstats) and a Chrome trace (NAME.trace.json) per ontology to DIR."
+    )
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
     """Main entry point."""
-    args = parse_args()
+    args = parse_args(argv)
 
     # Set logging level
     if args.verbose:
@@ -932,6 +3555,9 @@ def main() -> int:
         list_ontologies()
         return 0
 
+    if args.ranges:
+        return 0 if print_codepoint_ranges(args.output_dir / "json") else 1
+
     # Determine which ontologies to process
     if args.ontologies:
         configs_to_process = []
@@ -947,28 +3573,68 @@ def main() -> int:
     else:
         configs_to_process = ONTOLOGY_CONFIGS
 
-    # Initialize assigner
-    assigner = KnownValueAssigner(
-        output_dir=args.output_dir,
-        cache_dir=args.cache_dir,
-        use_cache=not args.no_cache,
-        verbose=args.verbose,
-    )
-
-    # Process each ontology
-    success_count = 0
-    failure_count = 0
+    jobs = args.jobs or os.cpu_count() or 1
+    stages = StageTimer()
+    started = time.perf_counter()
+
+    if jobs > 1 and len(configs_to_process) > 1:
+        # Populate (and revalidate) the shared cache concurrently so workers only parse
+        if not args.no_cache:
+            OntologyFetcher(args.cache_dir, revalidate=args.revalidate, stages=stages).prefetch(configs_to_process)
+        results = run_parallel(
+            configs_to_process,
+            jobs,
+            output_dir=args.output_dir,
+            cache_dir=args.cache_dir,
+            stages=stages,
+            use_cache=not args.no_cache,
+            verbose=args.verbose,
+            incremental=not args.force,
+            profile_dir=args.profile,
+            stable=args.stable,
+        )
+    else:
+        # Initialize assigner
+        assigner = KnownValueAssigner(
+            output_dir=args.output_dir,
+            cache_dir=args.cache_dir,
+            use_cache=not args.no_cache,
+            verbose=args.verbose,
+            revalidate=args.revalidate,
+            incremental=not args.force,
+            stages=stages,
+            profile_dir=args.profile,
+            stable=args.stable,
+        )
 
-    for config in configs_to_process:
-        entries = assigner.process_ontology(config)
-        if entries is not None:
-            assigner.write_registry(config, entries)
-            success_count += 1
-        else:
-            failure_count += 1
+        # Download everything up front, then process each ontology
+        assigner.fetcher.prefetch(configs_to_process)
+        results = [(config.name, assigner.process_and_write(config)) for config in configs_to_process]
 
     # Summary
-    logger.info(f"Processing complete: {success_count} succeeded, {failure_count} failed")
+    failed = [name for name, status in results if status == ProcessStatus.FAILED]
+    up_to_date = [name for name, status in results if status == ProcessStatus.UP_TO_DATE]
+    failure_count = len(failed)
+    success_count = len(results) - failure_count
+    logger.info(
+        f"Processing complete: {success_count} succeeded "
+        f"({len(up_to_date)} up to date), {failure_count} failed"
+    )
+    if up_to_date:
+        logger.info(f"Up to date: {', '.join(up_to_date)}")
+    if failed:
+        logger.info(f"Failed ontologies: {', '.join(failed)}")
+
+    # The binary registry covers every registry, so rebuild it whenever one changed
+    if any(status == ProcessStatus.WRITTEN for _, status in results) or (
+        (args.output_dir / "json").is_dir() and not (args.output_dir / "binary" / BinaryRegistry.FILENAME).exists()
+    ):
+        write_binary_registry(args.output_dir)
+
+    if args.report:
+        write_run_report(args.report, results, stages, time.perf_counter() - started, jobs)
+    if args.profile:
+        write_traces(args.profile, stages)
 
     return 0 if failure_count == 0 else 1
 
@@ -0,0 +1,402 @@
+"""
+In-memory index of the Known Values assigned across a directory of registries.
+
+Every ``*_registry.json`` file is read once into codepoint, name and URI lookup
+tables, so the assigner and the community request scripts answer "is this taken,
+and by whom?" with dictionary lookups instead of re-reading registries. The index
+can be saved as a snapshot that is reused for as long as the registry files it
+was built from are unchanged.
+
+For consumers that only decode codepoints, the index is also exported as one
+binary file that ``BinaryRegistry`` memory-maps and binary-searches in place.
+
+The module only uses the standard library, so tools that just look values up
+start without the assigner's parsing dependencies.
+"""
+
+import bisect
+import json
+import logging
+import mmap
+import os
+import re
+import struct
+import sys
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Registry maintained by hand, whose values other registries reuse
+BLOCKCHAIN_COMMONS_REGISTRY = "0_blockchain_commons_registry"
+
+# Binary registry layout, all little-endian:
+#   header      magic, version, registry/entry/string counts, section offsets
+#   registries  per registry: name and ontology string ids, start, end, codepoints used
+#   codepoints  sorted u64 array, one per Known Value
+#   records     per codepoint: name, type, uri, description string ids and registry number
+#   offsets     u32 array of string_count + 1 offsets into the pool
+#   pool        deduplicated UTF-8 strings
+_BINARY_HEADER = struct.Struct("<8sIIII6Q")
+_BINARY_REGISTRY = struct.Struct("<IIQQI4x")
+_BINARY_RECORD = struct.Struct("<IIIII")
+_BINARY_MAGIC = b"KNOWNVAL"
+_BINARY_VERSION = 1
+
+
+@dataclass(frozen=True)
+class KnownValue:
+    """A Known Value as listed in a registry file."""
+    codepoint: int
+    name: str
+    type: str
+    uri: str
+    description: str
+    registry: str
+
+
+@dataclass(frozen=True)
+class IndexedRegistry:
+    """The values and retired codepoints of one registry file."""
+    registry: str
+    ontology: str
+    start: int
+    values: tuple[KnownValue, ...]
+    tombstones: tuple[int, ...] = ()
+
+    @classmethod
+    def of_registry(cls, registry: str, data: dict) -> "IndexedRegistry":
+        """Index the JSON content of a registry; entries without an integer codepoint are skipped."""
+        ontology = data.get("ontology", {})
+        start = ontology.get("start_code_point")
+        if not isinstance(start, int):
+            prefix = re.match(r"\d+", registry)
+            start = int(prefix.group()) if prefix else 0
+        values = tuple(
+            KnownValue(entry["codepoint"], entry.get("name", ""), entry.get("type", ""),
+                       entry.get("uri", "") or "", entry.get("description", ""), registry)
+            for entry in data.get("entries", []) if isinstance(entry.get("codepoint"), int)
+        )
+        tombstones = tuple(
+            t["codepoint"] for t in data.get("tombstones", []) if isinstance(t.get("codepoint"), int)
+        )
+        return cls(registry, ontology.get("name", registry), start, values, tombstones)
+
+
+class KnownValueIndex:
+    """Codepoint, name and URI lookup tables over a set of registries.
+
+    Registries are indexed in order of their start codepoint. Other registries
+    repeat the values they reuse from the Blockchain Commons registry, so when
+    several registries list the same codepoint, name or URI, the lookup returns the
+    value of the registry with the lowest start, which is the one that assigned it.
+    """
+
+    SNAPSHOT_FILENAME = "known_value_index.json"
+    SNAPSHOT_VERSION = 1
+
+    def __init__(self, registries: Iterable[IndexedRegistry] = ()):
+        self._reindex(registries)
+
+    def _reindex(self, registries: Iterable[IndexedRegistry]) -> None:
+        self.registries: dict[str, IndexedRegistry] = {}
+        self.by_codepoint: dict[int, KnownValue] = {}
+        self.by_name: dict[str, KnownValue] = {}
+        self.by_uri: dict[str, KnownValue] = {}
+        for registry in sorted(registries, key=lambda r: (r.start, r.registry)):
+            self.registries[registry.registry] = registry
+            for value in registry.values:
+                self.by_codepoint.setdefault(value.codepoint, value)
+                if value.name:
+                    self.by_name.setdefault(value.name, value)
+                if value.uri:
+                    self.by_uri.setdefault(value.uri, value)
+
+    def __len__(self) -> int:
+        return len(self.by_codepoint)
+
+    @staticmethod
+    def registry_files(json_dir: Path) -> dict[str, Path]:
+        """Return the registry files in a directory, keyed by file stem."""
+        return {path.stem: path for path in sorted(json_dir.glob("*_registry.json"))}
+
+    @classmethod
+    def fingerprint(cls, json_dir: Path) -> dict[str, list[int]]:
+        """Modification time and size of each registry file, which decide whether a snapshot is current."""
+        fingerprint = {}
+        for registry, path in cls.registry_files(json_dir).items():
+            stat = path.stat()
+            fingerprint[registry] = [stat.st_mtime_ns, stat.st_size]
+        return fingerprint
+
+    @classmethod
+    def from_directory(cls, json_dir: Path, snapshot: Optional[Path] = None) -> "KnownValueIndex":
+        """Index every ``*_registry.json`` file in a directory; unreadable files are skipped.
+
+        With ``snapshot``, a snapshot taken of the same unchanged files is loaded
+        instead of the registries, and otherwise one is saved after indexing.
+        """
+        fingerprint = cls.fingerprint(json_dir) if snapshot is not None else None
+        if snapshot is not None and snapshot.exists():
+            index = cls.load_snapshot(snapshot, fingerprint)
+            if index is not None:
+                return index
+
+        index = cls.from_files(cls.registry_files(json_dir).values())
+
+        if snapshot is not None:
+            try:
+                index.save_snapshot(snapshot, fingerprint)
+            except OSError as e:
+                logger.warning(f"Could not save Known Value index snapshot {snapshot}: {e}")
+        return index
+
+    @classmethod
+    def from_files(cls, paths: Iterable[Path]) -> "KnownValueIndex":
+        """Index the given registry files, each named by its file stem; unreadable files are skipped."""
+        registries = []
+        for path in paths:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    registries.append(IndexedRegistry.of_registry(path.stem, json.load(f)))
+            except (OSError, ValueError, AttributeError, KeyError, TypeError) as e:
+                logger.warning(f"Ignoring unreadable registry {path}: {e}")
+        return cls(registries)
+
+    def add_registry(self, registry: str, data: dict) -> IndexedRegistry:
+        """Index the JSON content of a registry, replacing its previous content."""
+        indexed = IndexedRegistry.of_registry(registry, data)
+        self._reindex([*(r for r in self.registries.values() if r.registry != registry), indexed])
+        return indexed
+
+    def subset(self, *registries: str) -> "KnownValueIndex":
+        """Return an index of only the given registries; unknown ones are ignored."""
+        return KnownValueIndex(self.registries[r] for r in registries if r in self.registries)
+
+    def values(self, registry: str) -> tuple[KnownValue, ...]:
+        """Values listed in a registry, in file order; empty for an unknown registry."""
+        indexed = self.registries.get(registry)
+        return indexed.values if indexed else ()
+
+    def lookup_codepoints(self, codepoints: Iterable[int]) -> dict[int, KnownValue]:
+        """Return the values of the given codepoints that are assigned."""
+        by_codepoint = self.by_codepoint
+        return {c: by_codepoint[c] for c in codepoints if c in by_codepoint}
+
+    def lookup_names(self, names: Iterable[str]) -> dict[str, KnownValue]:
+        """Return the values of the given names that are assigned."""
+        by_name = self.by_name
+        return {n: by_name[n] for n in names if n in by_name}
+
+    def lookup_uris(self, uris: Iterable[str]) -> dict[str, KnownValue]:
+        """Return the values of the given URIs that are assigned."""
+        by_uri = self.by_uri
+        return {u: by_uri[u] for u in uris if u in by_uri}
+
+    def save_snapshot(self, path: Path, fingerprint: Optional[dict] = None) -> None:
+        """Write the index to ``path``, recording the registry files it was built from."""
+        registries = list(self.registries.values())
+        snapshot = {
+            "version": self.SNAPSHOT_VERSION,
+            "files": fingerprint or {},
+            "registries": [[r.registry, r.ontology, r.start, list(r.tombstones)] for r in registries],
+            "entries": [
+                [i, v.codepoint, v.name, v.type, v.uri, v.description]
+                for i, r in enumerate(registries) for v in r.values
+            ],
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_file, path)
+
+    def save_binary(self, path: Path) -> None:
+        """Export the index as one binary registry that ``BinaryRegistry`` memory-maps."""
+        strings: dict[str, int] = {"": 0}
+
+        def intern(text: str) -> int:
+            return strings.setdefault(text, len(strings))
+
+        registries = list(self.registries.values())
+        registry_table = bytearray()
+        for r in registries:
+            # Codepoints below the start were reused from a lower registry
+            own = [v.codepoint for v in r.values if v.codepoint >= r.start]
+            own.extend(c for c in r.tombstones if c >= r.start)
+            registry_table += _BINARY_REGISTRY.pack(
+                intern(r.registry), intern(r.ontology), r.start, max(own, default=r.start), len(own)
+            )
+
+        numbers = {r.registry: i for i, r in enumerate(registries)}
+        values = sorted(self.by_codepoint.values(), key=lambda v: v.codepoint)
+        codepoints = struct.pack(f"<{len(values)}Q", *(v.codepoint for v in values))
+        records = b"".join(
+            _BINARY_RECORD.pack(intern(v.name), intern(v.type), intern(v.uri), intern(v.description),
+                                numbers[v.registry])
+            for v in values
+        )
+
+        pool = bytearray()
+        offsets = [0]
+        for text in strings:
+            pool += text.encode("utf-8")
+            offsets.append(len(pool))
+        offset_table = struct.pack(f"<{len(offsets)}I", *offsets)
+
+        registries_at = _BINARY_HEADER.size
+        codepoints_at = registries_at + len(registry_table)
+        records_at = codepoints_at + len(codepoints)
+        offsets_at = records_at + len(records)
+        pool_at = offsets_at + len(offset_table)
+        header = _BINARY_HEADER.pack(
+            _BINARY_MAGIC, _BINARY_VERSION, len(registries), len(values), len(strings),
+            registries_at, codepoints_at, records_at, offsets_at, pool_at, len(pool),
+        )
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_file, "wb") as f:
+            for section in (header, registry_table, codepoints, records, offset_table, pool):
+                f.write(section)
+        os.replace(tmp_file, path)
+
+    @classmethod
+    def load_snapshot(cls, path: Path, fingerprint: Optional[dict] = None) -> Optional["KnownValueIndex"]:
+        """Load a snapshot, or return None if it is unreadable or, given ``fingerprint``, out of date."""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+            if snapshot.get("version") != cls.SNAPSHOT_VERSION:
+                return None
+            if fingerprint is not None and snapshot.get("files") != fingerprint:
+                return None
+            names = [registry for registry, *_ in snapshot["registries"]]
+            values: dict[str, list[KnownValue]] = {name: [] for name in names}
+            for i, codepoint, name, value_type, uri, description in snapshot["entries"]:
+                values[names[i]].append(KnownValue(codepoint, name, value_type, uri, description, names[i]))
+            return cls(
+                IndexedRegistry(registry, ontology, start, tuple(values[registry]), tuple(tombstones))
+                for registry, ontology, start, tombstones in snapshot["registries"]
+            )
+        except (OSError, ValueError, TypeError, KeyError, IndexError) as e:
+            logger.warning(f"Ignoring unreadable Known Value index snapshot {path}: {e}")
+            return None
+
+
+class _PackedArray:
+    """Read-only sequence over little-endian integers in a buffer, for big-endian hosts."""
+
+    def __init__(self, buffer, offset: int, count: int, code: str):
+        self._item = struct.Struct("<" + code)
+        self._buffer = buffer
+        self._offset = offset
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i: int) -> int:
+        if not 0 <= i < self._count:
+            raise IndexError(i)
+        return self._item.unpack_from(self._buffer, self._offset + i * self._item.size)[0]
+
+    def release(self) -> None:
+        pass
+
+
+class BinaryRegistry:
+    """Codepoint lookups in a binary registry written by ``KnownValueIndex.save_binary``.
+
+    The file is memory-mapped and nothing but its fixed-size header is read on
+    open. ``find`` binary-searches the codepoint array in place, so checking a
+    codepoint reads a few pages and creates no objects per entry; only the strings
+    a lookup returns are decoded.
+    """
+
+    FILENAME = "known_values.bin"
+
+    def __init__(self, path: Path):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            (magic, version, self._registry_count, self._count, string_count, self._registries_at,
+             codepoints_at, records_at, offsets_at, self._pool_at, pool_size) = _BINARY_HEADER.unpack_from(self._mmap)
+        except struct.error as e:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a binary Known Value registry: {e}")
+        if magic != _BINARY_MAGIC or version != _BINARY_VERSION or self._pool_at + pool_size > len(self._mmap):
+            self._mmap.close()
+            raise ValueError(f"{path} is not a version {_BINARY_VERSION} binary Known Value registry")
+
+        self._records_at = records_at
+        self._view = memoryview(self._mmap)
+        if sys.byteorder == "little":
+            self._codepoints = self._view[codepoints_at:codepoints_at + 8 * self._count].cast("Q")
+            self._offsets = self._view[offsets_at:offsets_at + 4 * (string_count + 1)].cast("I")
+        else:
+            self._codepoints = _PackedArray(self._mmap, codepoints_at, self._count, "Q")
+            self._offsets = _PackedArray(self._mmap, offsets_at, string_count + 1, "I")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, codepoint: int) -> bool:
+        return self.find(codepoint) >= 0
+
+    def __enter__(self) -> "BinaryRegistry":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Unmap the file; lookups are no longer possible."""
+        if self._mmap.closed:
+            return
+        self._codepoints.release()
+        self._offsets.release()
+        self._view.release()
+        self._mmap.close()
+
+    def find(self, codepoint: int) -> int:
+        """Return the position of a codepoint in the file, or -1 if it is not assigned."""
+        i = bisect.bisect_left(self._codepoints, codepoint)
+        return i if i < self._count and self._codepoints[i] == codepoint else -1
+
+    def _string(self, string_id: int) -> str:
+        start = self._pool_at + self._offsets[string_id]
+        return str(self._view[start:self._pool_at + self._offsets[string_id + 1]], "utf-8")
+
+    def _record(self, codepoint: int) -> Optional[tuple]:
+        i = self.find(codepoint)
+        return None if i < 0 else _BINARY_RECORD.unpack_from(self._mmap, self._records_at + i * _BINARY_RECORD.size)
+
+    def name(self, codepoint: int) -> Optional[str]:
+        """Return the name of a codepoint, or None if it is not assigned."""
+        record = self._record(codepoint)
+        return None if record is None else self._string(record[0])
+
+    def lookup(self, codepoint: int) -> Optional[KnownValue]:
+        """Return the full value of a codepoint, or None if it is not assigned."""
+        record = self._record(codepoint)
+        if record is None:
+            return None
+        name, value_type, uri, description, registry = record
+        registry_name = _BINARY_REGISTRY.unpack_from(
+            self._mmap, self._registries_at + registry * _BINARY_REGISTRY.size
+        )[0]
+        return KnownValue(codepoint, self._string(name), self._string(value_type), self._string(uri),
+                          self._string(description), self._string(registry_name))
+
+    def registries(self) -> list[tuple[str, str, int, int, int]]:
+        """Return ``(registry, ontology, start, end, used)`` for each registry, ordered by start."""
+        result = []
+        for i in range(self._registry_count):
+            registry, ontology, start, end, used = _BINARY_REGISTRY.unpack_from(
+                self._mmap, self._registries_at + i * _BINARY_REGISTRY.size
+            )
+            result.append((self._string(registry), self._string(ontology), start, end, used))
+        return result
@@ -0,0 +1,190 @@
+"""
+rdflib stores used when an ontology source is parsed into a graph.
+
+``known_value_assigner`` imports this module, and with it rdflib, only on the
+code paths that parse with rdflib, so commands that never do (``--list``,
+lookups, sources handled by the streaming readers) start without that cost.
+"""
+
+import sqlite3
+from pathlib import Path
+from typing import Optional
+
+from rdflib import BNode, Literal, URIRef
+from rdflib.namespace import RDF
+from rdflib.plugins.stores.memory import Memory
+from rdflib.store import Store
+
+
+class TripleFilter:
+    """Decides which parsed triples concept extraction needs.
+
+    Only ``rdf:type`` triples naming one of ``types`` and triples whose predicate
+    is in ``predicates`` are kept, and only for IRI subjects matching ``uri_filter``.
+    Restrictions, blank-node axioms, domains, ranges and the like are rejected.
+    """
+
+    def __init__(self, types, predicates, uri_filter: Optional[str] = None):
+        self.types = {URIRef(t) for t in types}
+        self.predicates = {URIRef(p) for p in predicates}
+        self.uri_filter = uri_filter
+        self.kept = 0
+        self.dropped = 0
+
+    def __call__(self, triple) -> bool:
+        subject, predicate, obj = triple
+        if (obj in self.types if predicate == RDF.type else predicate in self.predicates) \
+                and isinstance(subject, URIRef) \
+                and not (self.uri_filter and not subject.startswith(self.uri_filter)):
+            self.kept += 1
+            return True
+        self.dropped += 1
+        return False
+
+
+class FilteringStore(Memory):
+    """In-memory rdflib store that discards triples a ``TripleFilter`` rejects as the
+    parser emits them."""
+
+    def __init__(self, triple_filter: TripleFilter):
+        super().__init__()
+        self.triple_filter = triple_filter
+
+    def add(self, triple, context, quoted: bool = False) -> None:
+        if self.triple_filter(triple):
+            super().add(triple, context, quoted)
+
+
+class SQLiteStore(Store):
+    """Disk-backed rdflib store for graphs larger than memory.
+
+    Triples are buffered and written to an SQLite database in batches, deduplicated
+    on insert, and read back with indexed queries in insertion order, which is the
+    order rdflib's in-memory store yields them in, so extraction selects the same
+    concepts. The store holds a single graph: contexts and named graphs are accepted
+    (JSON-LD and N-Quads parsing need a store that supports them) but ignored.
+    """
+
+    context_aware = True
+    graph_aware = True
+    BATCH_SIZE = 10_000
+    # Object kinds
+    IRI, BLANK, LITERAL = "I", "B", "L"
+
+    def __init__(self, path: Path, triple_filter: Optional[TripleFilter] = None):
+        super().__init__()
+        self.path = path
+        self.triple_filter = triple_filter
+        self._pending: list[tuple] = []
+        self._indexed = False
+        self._namespaces: dict[str, URIRef] = {}
+        self._db = sqlite3.connect(path)
+        # A scratch database: durability is not needed, bounded page cache is
+        self._db.executescript("""
+            PRAGMA journal_mode = OFF;
+            PRAGMA synchronous = OFF;
+            PRAGMA cache_size = -65536;
+            CREATE TABLE IF NOT EXISTS triples (
+                seq INTEGER PRIMARY KEY,
+                s TEXT NOT NULL,
+                p TEXT NOT NULL,
+                o TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                lang TEXT NOT NULL,
+                datatype TEXT NOT NULL,
+                UNIQUE (s, p, o, kind, lang, datatype)
+            );
+        """)
+
+    @classmethod
+    def _encode(cls, term) -> tuple[str, str, str, str]:
+        """Return the ``(value, kind, language, datatype)`` columns for a term."""
+        if isinstance(term, Literal):
+            return str(term), cls.LITERAL, term.language or "", str(term.datatype or "")
+        if isinstance(term, BNode):
+            return str(term), cls.BLANK, "", ""
+        return str(term), cls.IRI, "", ""
+
+    @staticmethod
+    def _subject_key(subject) -> str:
+        """Return the ``s`` column for a subject; blank nodes are prefixed with ``_:``."""
+        return str(subject) if isinstance(subject, URIRef) else "_:" + subject
+
+    @classmethod
+    def _decode(cls, value: str, kind: str, lang: str, datatype: str):
+        if kind == cls.LITERAL:
+            return Literal(value, lang=lang or None, datatype=datatype or None)
+        return BNode(value) if kind == cls.BLANK else URIRef(value)
+
+    def add(self, triple, context, quoted: bool = False) -> None:
+        if self.triple_filter is not None and not self.triple_filter(triple):
+            return
+        subject, predicate, obj = triple
+        self._pending.append((self._subject_key(subject), str(predicate)) + self._encode(obj))
+        if len(self._pending) >= self.BATCH_SIZE:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._pending:
+            self._db.executemany(
+                "INSERT OR IGNORE INTO triples (s, p, o, kind, lang, datatype) VALUES (?, ?, ?, ?, ?, ?)",
+                self._pending,
+            )
+            self._pending.clear()
+            self._indexed = False
+
+    def _ready(self) -> None:
+        """Write buffered triples and make sure lookups by predicate and object are indexed."""
+        self._flush()
+        if not self._indexed:
+            self._db.execute("CREATE INDEX IF NOT EXISTS triples_pos ON triples (p, o, seq)")
+            self._indexed = True
+
+    def triples(self, triple_pattern, context=None):
+        self._ready()
+        subject, predicate, obj = triple_pattern
+        clauses, params = [], []
+        if subject is not None:
+            clauses.append("s = ?")
+            params.append(self._subject_key(subject))
+        if predicate is not None:
+            clauses.append("p = ?")
+            params.append(str(predicate))
+        if obj is not None:
+            clauses.append("o = ? AND kind = ? AND lang = ? AND datatype = ?")
+            params.extend(self._encode(obj))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._db.execute(f"SELECT s, p, o, kind, lang, datatype FROM triples {where} ORDER BY seq", params)
+        for s, p, o, kind, lang, datatype in rows:
+            term = BNode(s[2:]) if s.startswith("_:") else URIRef(s)
+            yield (term, URIRef(p), self._decode(o, kind, lang, datatype)), iter(())
+
+    def __len__(self, context=None) -> int:
+        self._ready()
+        return self._db.execute("SELECT COUNT(*) FROM triples").fetchone()[0]
+
+    def contexts(self, triple=None):
+        return iter(())
+
+    def add_graph(self, graph) -> None:
+        pass
+
+    def remove_graph(self, graph) -> None:
+        pass
+
+    def bind(self, prefix: str, namespace: URIRef, override: bool = True) -> None:
+        if override or prefix not in self._namespaces:
+            self._namespaces[prefix] = namespace
+
+    def namespace(self, prefix: str) -> Optional[URIRef]:
+        return self._namespaces.get(prefix)
+
+    def prefix(self, namespace: URIRef) -> Optional[str]:
+        return next((p for p, ns in self._namespaces.items() if ns == namespace), None)
+
+    def namespaces(self):
+        return iter(self._namespaces.items())
+
+    def close(self, commit_pending_transaction: bool = False) -> None:
+        self._pending.clear()
+        self._db.close()
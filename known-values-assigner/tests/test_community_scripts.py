@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Tests for the community Known Value scripts in .github/scripts.
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / ".github" / "scripts"))
+
+import assign_community_kv
+import validate_community_kv
+from known_value_index import BinaryRegistry, IndexedRegistry, KnownValueIndex
+
+COMMUNITY = "100000_community_registry"
+CORE = "0_blockchain_commons_registry"
+
+
+def _write_registry(json_dir: Path, registry: str, start: int, entries: list[dict]) -> Path:
+    json_dir.mkdir(parents=True, exist_ok=True)
+    path = json_dir / f"{registry}.json"
+    path.write_text(json.dumps({
+        "ontology": {"name": registry, "start_code_point": start},
+        "generated": {"tool": "test", "version": "1.0.0"},
+        "entries": entries,
+    }))
+    return path
+
+
+def _write_request(path: Path, entries: list[dict]) -> Path:
+    path.write_text(json.dumps({
+        "request": {"submitter": "Example", "description": "Example terms", "contact": "example@example.org"},
+        "entries": [
+            {"type": "class", "description": "An example term for tests", **entry} for entry in entries
+        ],
+    }))
+    return path
+
+
+@pytest.fixture
+def json_dir(tmp_path: Path) -> Path:
+    """A registry directory with a core registry and a community registry."""
+    json_dir = tmp_path / "json"
+    _write_registry(json_dir, CORE, 0, [
+        {"codepoint": 1, "name": "isA", "uri": "http://www.w3.org/1999/02/22-rdf-syntax-ns#type"},
+    ])
+    _write_registry(json_dir, COMMUNITY, 100000, [
+        {"codepoint": 100000, "name": "widget", "uri": "https://example.org/widget"},
+    ])
+    return json_dir
+
+
+class TestValidateCommunityRequests:
+    """Tests for validate_community_kv.py."""
+
+    def test_load_index_reads_only_the_community_registry(self, json_dir):
+        """Only the community registry file is parsed for the availability checks."""
+        with patch.object(IndexedRegistry, "of_registry", wraps=IndexedRegistry.of_registry) as of_registry:
+            index = validate_community_kv.load_index(json_dir / f"{COMMUNITY}.json")
+        assert [call.args[0] for call in of_registry.call_args_list] == [COMMUNITY]
+        assert list(index.registries) == [COMMUNITY]
+
+    def test_load_index_of_missing_registry(self, tmp_path):
+        """A community registry that does not exist yet has no values."""
+        assert len(validate_community_kv.load_index(tmp_path / f"{COMMUNITY}.json")) == 0
+
+    def test_availability_checks(self, json_dir, tmp_path):
+        """Code points, names and URIs taken in the community registry are rejected; core ones are not."""
+        request = _write_request(tmp_path / "_request.json", [
+            {"codepoint": 100000, "name": "gadget"},
+            {"codepoint": 100001, "name": "widget"},
+            {"codepoint": 100002, "name": "gizmo", "uri": "https://example.org/widget"},
+            {"codepoint": 100003, "name": "isA", "uri": "http://www.w3.org/1999/02/22-rdf-syntax-ns#type"},
+        ])
+        result = validate_community_kv.ValidationResult()
+        validate_community_kv.validate_request_file(
+            request, validate_community_kv.load_index(json_dir / f"{COMMUNITY}.json"), result
+        )
+
+        assert [(e.rule_id, e.entry_index, e.field) for e in result.errors] == [
+            ("V-102", 0, "codepoint"),
+            ("V-200", 1, "name"),
+            ("V-201", 2, "uri"),
+        ]
+        assert f"{COMMUNITY} as 100000 'widget'" in result.errors[0].message
+
+
+class TestAssignCommunityValues:
+    """Tests for assign_community_kv.py."""
+
+    def _main(self, json_dir: Path, *requests: Path) -> None:
+        argv = [
+            "assign_community_kv.py",
+            "--registry", str(json_dir / f"{COMMUNITY}.json"),
+            "--markdown", str(json_dir.parent / "markdown" / f"{COMMUNITY}.md"),
+            "--files", " ".join(str(request) for request in requests),
+            "--pr", "7",
+        ]
+        with patch.object(sys, "argv", argv):
+            assign_community_kv.main()
+
+    def test_assigns_entries(self, json_dir, tmp_path):
+        """Requested entries are added to the registry and exported with every other registry."""
+        (tmp_path / "markdown").mkdir()
+        self._main(json_dir, _write_request(tmp_path / "request.json", [{"codepoint": 100001, "name": "gadget"}]))
+
+        registry = json.loads((json_dir / f"{COMMUNITY}.json").read_text())
+        assert [entry["codepoint"] for entry in registry["entries"]] == [100000, 100001]
+        assert registry["entries"][1]["source"]["pr_number"] == 7
+        with BinaryRegistry(tmp_path / "binary" / BinaryRegistry.FILENAME) as binary:
+            assert binary.name(1) == "isA"
+            assert binary.name(100001) == "gadget"
+
+    def test_registry_is_parsed_once(self, json_dir, tmp_path):
+        """Every registry file, the community one included, is parsed once."""
+        (tmp_path / "markdown").mkdir()
+        request = _write_request(tmp_path / "request.json", [{"codepoint": 100001, "name": "gadget"}])
+        with patch("json.load", wraps=json.load) as load:
+            self._main(json_dir, request)
+        loaded = sorted(Path(call.args[0].name).name for call in load.call_args_list)
+        assert loaded == sorted([f"{CORE}.json", f"{COMMUNITY}.json", "request.json"])
+
+    def test_taken_codepoint_fails_without_writing(self, json_dir, tmp_path):
+        """A code point assigned since validation fails the run and leaves every output untouched."""
+        registry_file = json_dir / f"{COMMUNITY}.json"
+        before = registry_file.read_bytes()
+        free = _write_request(tmp_path / "free.json", [{"codepoint": 100001, "name": "gadget"}])
+        taken = _write_request(tmp_path / "taken.json", [{"codepoint": 100000, "name": "gizmo"}])
+
+        with pytest.raises(SystemExit) as exit_info:
+            self._main(json_dir, free, taken)
+
+        assert exit_info.value.code == 1
+        assert registry_file.read_bytes() == before
+        assert not (tmp_path / "markdown").exists()
+        assert not (tmp_path / "binary").exists()
+
+    def test_find_assigned_codepoints(self):
+        """Each requested code point that is already assigned is described."""
+        index = KnownValueIndex()
+        index.add_registry(COMMUNITY, {"entries": [{"codepoint": 100000, "name": "widget"}]})
+        assigned = {value.codepoint: value for value in index.values(COMMUNITY)}
+        request = {"entries": [{"codepoint": 100000, "name": "gizmo"}, {"codepoint": 100001, "name": "gadget"}]}
+
+        assert assign_community_kv.find_assigned_codepoints(request, assigned) == [
+            "codepoint 100000 for 'gizmo' is already assigned to 'widget'"
+        ]
@@ -6,6 +6,10 @@ These tests validate the end-to-end processing pipeline using real (mocked) data
 """
 
 import json
+import logging
+import os
+import re
+import subprocess
 import tempfile
 from pathlib import Path
 from unittest.mock import patch, Mock
@@ -20,11 +24,24 @@ from known_value_assigner import (
     OntologyConfig,
     DataFormat,
     ProcessingStrategy,
+    ProcessStatus,
     ONTOLOGY_CONFIGS,
     main,
 )
 
 
+def _mock_response(text: str) -> Mock:
+    """Build a mocked successful HTTP response with the given body."""
+    response = Mock()
+    response.text = text
+    response.content = text.encode("utf-8")
+    response.iter_content = lambda chunk_size=1, **kwargs: iter([response.content])
+    response.status_code = 200
+    response.headers = {}
+    response.raise_for_status = Mock()
+    return response
+
+
 class TestIntegrationEndToEnd:
     """Integration tests for the complete processing pipeline."""
 
@@ -60,12 +77,10 @@ class TestIntegrationEndToEnd:
     </rdf:RDF>
     """
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_full_pipeline_standard_rdf(self, mock_get):
         """Test complete pipeline for StandardRDF strategy."""
-        mock_response = Mock()
-        mock_response.text = self.SAMPLE_ONTOLOGY
-        mock_response.raise_for_status = Mock()
+        mock_response = _mock_response(self.SAMPLE_ONTOLOGY)
         mock_get.return_value = mock_response
 
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -132,12 +147,10 @@ class TestDeterministicAssignment:
     </rdf:RDF>
     """
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_multiple_runs_produce_same_results(self, mock_get):
         """Verify that multiple runs produce identical assignments."""
-        mock_response = Mock()
-        mock_response.text = self.SAMPLE_ONTOLOGY
-        mock_response.raise_for_status = Mock()
+        mock_response = _mock_response(self.SAMPLE_ONTOLOGY)
         mock_get.return_value = mock_response
 
         results = []
@@ -174,11 +187,10 @@ class TestDeterministicAssignment:
 class TestOutputValidation:
     """Tests validating the JSON output format."""
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_json_schema_compliance(self, mock_get):
         """Verify JSON output matches expected schema."""
-        mock_response = Mock()
-        mock_response.text = """<?xml version="1.0" encoding="utf-8"?>
+        mock_response = _mock_response("""<?xml version="1.0" encoding="utf-8"?>
         <rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
                  xmlns:rdfs="http://www.w3.org/2000/01/rdf-schema#">
             <rdfs:Class rdf:about="http://example.org/Thing">
@@ -186,8 +198,7 @@ class TestOutputValidation:
                 <rdfs:comment>A generic thing</rdfs:comment>
             </rdfs:Class>
         </rdf:RDF>
-        """
-        mock_response.raise_for_status = Mock()
+        """)
         mock_get.return_value = mock_response
 
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -266,6 +277,15 @@ class TestCLIInterface:
         result = get_ontology_by_id("nonexistent_ontology")
         assert result is None
 
+    def test_negative_jobs_rejected(self, capsys):
+        """Only 0 stands for every CPU core; negative job counts are usage errors."""
+        from known_value_assigner import parse_args
+        assert parse_args(["-j", "0"]).jobs == 0
+        with pytest.raises(SystemExit) as exc_info:
+            parse_args(["-j", "-2"])
+        assert exc_info.value.code == 2
+        assert "must be 0 or more" in capsys.readouterr().err
+
     def test_all_configs_processable(self):
         """Verify all configured ontologies have valid configurations."""
         for config in ONTOLOGY_CONFIGS:
@@ -277,15 +297,356 @@ class TestCLIInterface:
             assert config.strategy is not None, f"{config.name} missing strategy"
 
 
+class TestStartupTime:
+    """Import-time budget for the entry points hooks and scripts call often."""
+
+    MODULE_DIR = Path(__file__).parent.parent
+    # Cumulative import time allowed for known_value_assigner, as -X importtime reports it
+    IMPORT_BUDGET_US = 100_000
+    # Dependencies only the fetching and rdflib parsing paths may import
+    HEAVY_MODULES = ("rdflib", "requests", "urllib3", "sqlite3", "xml.etree", "known_value_stores")
+
+    def _import_times(self, pycache: Path, *args: str) -> dict[str, int]:
+        """Run Python with -X importtime and return each module's cumulative import time."""
+        # Measure a checkout with its bytecode in place, as hooks run it. The bytecode
+        # is kept under ``pycache`` rather than in the source tree; Python then looks
+        # for the standard library's there too, so a first run compiles everything
+        env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+        env["PYTHONPYCACHEPREFIX"] = str(pycache)
+        subprocess.run([sys.executable, *args], cwd=self.MODULE_DIR, env=env, capture_output=True, check=True)
+        result = subprocess.run([sys.executable, "-X", "importtime", *args], cwd=self.MODULE_DIR, env=env,
+                                capture_output=True, text=True, check=True)
+        times = {}
+        for line in result.stderr.splitlines():
+            match = re.match(r"import time:\s+\d+ \|\s+(\d+) \|\s+(\S+)", line)
+            if match:
+                times[match.group(2)] = int(match.group(1))
+        return times
+
+    LOOKUP = ("from pathlib import Path; import known_value_assigner as kva; "
+              "kva.get_ontology_by_id('rdf'); "
+              "kva.KnownValueAssigner(Path({out!r}), Path({cache!r}), use_cache=False)"
+              "._to_local_name('b', 'http://example.org/a#b')")
+
+    @pytest.mark.parametrize("args", [
+        ("known_value_assigner.py", "--list"),
+        ("known_value_assigner.py", "--help"),
+        ("known_value_assigner.py", "--ranges", "-d", "{out}"),
+        ("-c", LOOKUP),
+    ])
+    def test_fast_paths_skip_heavy_imports(self, args, tmp_path):
+        """Listing, help, range reports and lookups never import rdflib, requests or the graph stores."""
+        args = tuple(arg.format(out=str(tmp_path / "out"), cache=str(tmp_path / "cache")) for arg in args)
+        times = self._import_times(tmp_path / "pycache", *args)
+        heavy = [name for name in times
+                 if any(name == module or name.startswith(module + ".") for module in self.HEAVY_MODULES)]
+        assert heavy == []
+
+    def test_import_within_budget(self, tmp_path):
+        """Importing the module stays within the cold-start budget."""
+        times = self._import_times(tmp_path / "pycache", "-c", "import known_value_assigner")
+        assert times["known_value_assigner"] <= self.IMPORT_BUDGET_US
+
+
+class TestParallelProcessing:
+    """Tests for --jobs parallel processing."""
+
+    ONTOLOGY_TEMPLATE = """<?xml version="1.0" encoding="utf-8"?>
+    <rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+             xmlns:rdfs="http://www.w3.org/2000/01/rdf-schema#">
+        <rdfs:Class rdf:about="http://example.org/{name}#Thing">
+            <rdfs:label>Thing</rdfs:label>
+            <rdfs:comment>A thing in {name}</rdfs:comment>
+        </rdfs:Class>
+        <rdf:Property rdf:about="http://example.org/{name}#name">
+            <rdfs:label>name</rdfs:label>
+        </rdf:Property>
+    </rdf:RDF>
+    """
+
+    def _make_configs(self, cache_dir: Path) -> list:
+        """Build test configs whose sources are already present in the cache."""
+        from known_value_assigner import OntologyFetcher
+
+        fetcher = OntologyFetcher(cache_dir, use_cache=True)
+        configs = []
+        for i, name in enumerate(["alpha", "beta", "gamma"]):
+            config = OntologyConfig(
+                name=name,
+                source_url=f"http://example.org/{name}.rdf",
+                start_code_point=5000 + i * 100,
+                data_format=DataFormat.RDF_XML,
+                strategy=ProcessingStrategy.STANDARD_RDF,
+            )
+            fetcher.cache.store(config.source_url, self.ONTOLOGY_TEMPLATE.format(name=name).encode("utf-8"))
+            configs.append(config)
+        return configs
+
+    def test_parallel_output_matches_serial(self):
+        """A --jobs run writes byte-identical registries to a serial run."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_dir = Path(tmpdir) / "cache"
+            configs = self._make_configs(cache_dir)
+            serial_dir = Path(tmpdir) / "serial"
+            parallel_dir = Path(tmpdir) / "parallel"
+
+            with patch("known_value_assigner.ONTOLOGY_CONFIGS", configs):
+                assert main(["-d", str(serial_dir), "--cache-dir", str(cache_dir)]) == 0
+                assert main(["-d", str(parallel_dir), "--cache-dir", str(cache_dir), "-j", "3"]) == 0
+
+            serial_files = sorted(p.relative_to(serial_dir) for p in serial_dir.rglob("*") if p.is_file())
+            parallel_files = sorted(p.relative_to(parallel_dir) for p in parallel_dir.rglob("*") if p.is_file())
+            assert serial_files == parallel_files
+            assert len(serial_files) == 7  # JSON + Markdown per ontology, and the binary registry
+            for rel in serial_files:
+                assert (serial_dir / rel).read_bytes() == (parallel_dir / rel).read_bytes()
+
+    def test_workers_parse_in_one_process(self, tmp_path):
+        """Parsers in a --jobs worker do not start process pools of their own."""
+        from known_value_assigner import KnownValueAssigner, _process_ontology_job
+
+        config = self._make_configs(tmp_path / "cache")[0]
+        parser_workers = []
+
+        def process_and_write(assigner, config):
+            parser_workers.append(assigner.parser_for(config).max_workers)
+            return ProcessStatus.UP_TO_DATE
+
+        with patch.object(KnownValueAssigner, "process_and_write", process_and_write):
+            _process_ontology_job(config, tmp_path / "out", tmp_path / "cache", {}, {})
+        assert parser_workers == [1]
+
+    def test_parallel_failures_are_counted(self):
+        """A failing ontology in one worker fails the run without affecting the others."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_dir = Path(tmpdir) / "cache"
+            configs = self._make_configs(cache_dir)
+            broken = OntologyConfig(
+                name="broken",
+                source_url="http://example.org/broken.rdf",
+                start_code_point=9000,
+                data_format=DataFormat.RDF_XML,
+                strategy=ProcessingStrategy.STANDARD_RDF,
+            )
+            from known_value_assigner import run_parallel, OntologyFetcher
+            OntologyFetcher(cache_dir).cache.store(broken.source_url, b"not RDF")
+
+            results = run_parallel(configs + [broken], 2, Path(tmpdir) / "out", cache_dir)
+
+            assert results == [
+                ("alpha", ProcessStatus.WRITTEN),
+                ("beta", ProcessStatus.WRITTEN),
+                ("gamma", ProcessStatus.WRITTEN),
+                ("broken", ProcessStatus.FAILED),
+            ]
+
+
+class TestRunReport:
+    """Tests for --report and --profile."""
+
+    @pytest.mark.parametrize("jobs", ["1", "2"])
+    def test_report_and_profile(self, tmp_path, jobs):
+        """Every stage of every ontology is timed and counted, serially and in workers."""
+        import pstats
+
+        cache_dir = tmp_path / "cache"
+        configs = TestParallelProcessing()._make_configs(cache_dir)
+        report_file = tmp_path / "run.json"
+        profile_dir = tmp_path / "profile"
+        args = ["-d", str(tmp_path / "out"), "--cache-dir", str(cache_dir), "-j", jobs,
+                "--report", str(report_file), "--profile", str(profile_dir)]
+        with patch("known_value_assigner.ONTOLOGY_CONFIGS", configs):
+            assert main(args) == 0
+
+        report = json.loads(report_file.read_text())
+        assert report["jobs"] == int(jobs)
+        assert set(report["ontologies"]) == {"alpha", "beta", "gamma"}
+        for name, ontology in report["ontologies"].items():
+            assert ontology["status"] == "written"
+            stages = ontology["stages"]
+            assert list(stages) == ["fetch", "extract", "assign", "collision-check", "write"]
+            assert stages["fetch"]["bytes"] > 0
+            assert stages["extract"]["concepts"] == 2
+            assert stages["assign"]["entries"] == 2
+            assert stages["write"]["bytes"] == sum(
+                path.stat().st_size for path in (tmp_path / "out").rglob(f"*_{name}_registry.*")
+            )
+            assert all(stage["seconds"] >= 0 for stage in stages.values())
+
+            assert pstats.Stats(str(profile_dir / f"{name}.pstats")).total_calls > 0
+            trace = json.loads((profile_dir / f"{name}.trace.json").read_text())
+            events = trace["traceEvents"]
+            assert {event["name"] for event in events} == set(stages)
+            assert all(event["ph"] == "X" and event["args"]["ontology"] == name for event in events)
+        assert report["stages"]["extract"]["concepts"] == 6
+
+    def test_rdflib_parse_is_counted(self, tmp_path):
+        """Sources parsed with rdflib report the triples they contained."""
+        from known_value_assigner import OntologyFetcher, StageTimer, StandardRDFParser
+
+        config = OntologyConfig(
+            name="graph",
+            source_url="http://example.org/graph.rdf",
+            start_code_point=5000,
+            data_format=DataFormat.RDF_XML,
+            strategy=ProcessingStrategy.STANDARD_RDF,
+        )
+        stages = StageTimer()
+        fetcher = OntologyFetcher(tmp_path, stages=stages)
+        fetcher.cache.store(config.source_url, TestParallelProcessing.ONTOLOGY_TEMPLATE.format(name="g").encode())
+        source = fetcher.fetch_source(config.source_url, config.data_format, config.name)
+        assert len(StandardRDFParser(fetcher)._extract_rdflib(source, config)) == 2
+
+        summary = stages.summary("graph")
+        assert summary["parse"]["triples"] == 5
+        assert summary["parse"]["kept_triples"] == 5
+        assert summary["fetch"]["bytes"] == source.size
+
+
+class TestIncrementalRebuild:
+    """Tests for skipping registries whose inputs are unchanged."""
+
+    SOURCE = TestParallelProcessing.ONTOLOGY_TEMPLATE.format(name="inc")
+
+    def _setup(self, tmpdir: str, source: str = SOURCE) -> tuple[OntologyConfig, Path, Path]:
+        from known_value_assigner import OntologyFetcher
+
+        output_dir = Path(tmpdir) / "output"
+        cache_dir = Path(tmpdir) / "cache"
+        config = OntologyConfig(
+            name="inc",
+            source_url="http://example.org/inc.rdf",
+            start_code_point=7000,
+            data_format=DataFormat.RDF_XML,
+            strategy=ProcessingStrategy.STANDARD_RDF,
+        )
+        OntologyFetcher(cache_dir).cache.store(config.source_url, source.encode("utf-8"))
+        return config, output_dir, cache_dir
+
+    def _write_bc_registry(self, output_dir: Path, entries: list[dict]) -> None:
+        json_dir = output_dir / "json"
+        json_dir.mkdir(parents=True, exist_ok=True)
+        (json_dir / "0_blockchain_commons_registry.json").write_text(json.dumps({"entries": entries}))
+
+    def _run(self, config, output_dir, cache_dir, **options):
+        assigner = KnownValueAssigner(output_dir=output_dir, cache_dir=cache_dir, **options)
+        return assigner.process_and_write(config)
+
+    def test_unchanged_inputs_are_skipped(self):
+        """A second run with identical inputs reports the registry as up to date."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config, output_dir, cache_dir = self._setup(tmpdir)
+            assert self._run(config, output_dir, cache_dir) == ProcessStatus.WRITTEN
+            with patch.object(KnownValueAssigner, "process_ontology", side_effect=AssertionError("rebuilt")):
+                assert self._run(config, output_dir, cache_dir) == ProcessStatus.UP_TO_DATE
+
+    def test_force_rebuilds(self):
+        """Incremental mode can be turned off."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config, output_dir, cache_dir = self._setup(tmpdir)
+            self._run(config, output_dir, cache_dir)
+            assert self._run(config, output_dir, cache_dir, incremental=False) == ProcessStatus.WRITTEN
+
+    def test_source_change_rebuilds(self):
+        """New source content invalidates the registry."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config, output_dir, cache_dir = self._setup(tmpdir)
+            self._run(config, output_dir, cache_dir)
+            self._setup(tmpdir, self.SOURCE.replace("A thing in inc", "Something else"))
+            assert self._run(config, output_dir, cache_dir) == ProcessStatus.WRITTEN
+
+    def test_config_change_rebuilds(self):
+        """A changed OntologyConfig field invalidates the registry."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config, output_dir, cache_dir = self._setup(tmpdir)
+            self._run(config, output_dir, cache_dir)
+            config.uri_filter = "http://example.org/"
+            assert self._run(config, output_dir, cache_dir) == ProcessStatus.WRITTEN
+
+    def test_edited_output_rebuilds(self):
+        """A registry edited or deleted on disk is regenerated."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config, output_dir, cache_dir = self._setup(tmpdir)
+            self._run(config, output_dir, cache_dir)
+            md_file = output_dir / "markdown" / "7000_inc_registry.md"
+            md_file.write_text("edited")
+            assert self._run(config, output_dir, cache_dir) == ProcessStatus.WRITTEN
+            (output_dir / "json" / "7000_inc_registry.json").unlink()
+            assert self._run(config, output_dir, cache_dir) == ProcessStatus.WRITTEN
+
+    def test_core_registry_change_only_invalidates_overlapping(self):
+        """Only core registry changes to URIs an ontology uses invalidate it."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config, output_dir, cache_dir = self._setup(tmpdir)
+            self._write_bc_registry(output_dir, [])
+            self._run(config, output_dir, cache_dir)
+
+            self._write_bc_registry(output_dir, [
+                {"codepoint": 900, "name": "unrelated", "uri": "http://example.org/other#thing"},
+            ])
+            assert self._run(config, output_dir, cache_dir) == ProcessStatus.UP_TO_DATE
+
+            self._write_bc_registry(output_dir, [
+                {"codepoint": 900, "name": "unrelated", "uri": "http://example.org/other#thing"},
+                {"codepoint": 901, "name": "thing", "uri": "http://example.org/inc#Thing"},
+            ])
+            assert self._run(config, output_dir, cache_dir) == ProcessStatus.WRITTEN
+            registry = json.loads((output_dir / "json" / "7000_inc_registry.json").read_text())
+            assert registry["entries"][0]["codepoint"] == 901
+
+    def test_imported_context_change_rebuilds(self):
+        """New content of a context the source imports invalidates the registry."""
+        from known_value_assigner import OntologyFetcher
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir) / "output"
+            cache_dir = Path(tmpdir) / "cache"
+            config = OntologyConfig(
+                name="vc",
+                source_url="http://example.org/vc.jsonld",
+                start_code_point=7000,
+                data_format=DataFormat.JSON_LD,
+                strategy=ProcessingStrategy.CONTEXT_MAP,
+            )
+            cache = OntologyFetcher(cache_dir).cache
+            cache.store(config.source_url, json.dumps(
+                {"@context": ["base.jsonld", {"issuer": "ex:issuer"}]}).encode("utf-8"))
+
+            def store_import(terms: dict) -> None:
+                cache.store("http://example.org/base.jsonld", json.dumps(
+                    {"@context": {"ex": "http://example.org/terms#", **terms}}).encode("utf-8"))
+
+            store_import({})
+            assigner = KnownValueAssigner(output_dir=output_dir, cache_dir=cache_dir)
+            assert assigner.process_and_write(config) == ProcessStatus.WRITTEN
+            assert {span["ontology"] for span in assigner.stages.spans} == {"vc"}
+            assert self._run(config, output_dir, cache_dir) == ProcessStatus.UP_TO_DATE
+
+            store_import({"holder": "ex:holder"})
+            assert self._run(config, output_dir, cache_dir) == ProcessStatus.WRITTEN
+            registry = json.loads((output_dir / "json" / "7000_vc_registry.json").read_text())
+            assert "http://example.org/terms#holder" in {entry["uri"] for entry in registry["entries"]}
+
+    def test_main_reports_up_to_date(self, caplog):
+        """The run summary lists ontologies that were up to date."""
+        caplog.set_level(logging.INFO)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config, output_dir, cache_dir = self._setup(tmpdir)
+            args = ["-d", str(output_dir), "--cache-dir", str(cache_dir)]
+            with patch("known_value_assigner.ONTOLOGY_CONFIGS", [config]):
+                assert main(args) == 0
+                caplog.clear()
+                assert main(args) == 0
+            assert any("Up to date: inc" in record.message for record in caplog.records)
+
+
 class TestErrorHandling:
     """Tests for error handling and edge cases."""
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_malformed_rdf_graceful_failure(self, mock_get):
         """Test that malformed RDF is handled gracefully."""
-        mock_response = Mock()
-        mock_response.text = "This is not valid RDF/XML content"
-        mock_response.raise_for_status = Mock()
+        mock_response = _mock_response("This is not valid RDF/XML content")
         mock_get.return_value = mock_response
 
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -306,15 +667,13 @@ class TestErrorHandling:
             entries = assigner.process_ontology(config)
             assert entries is None
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_empty_ontology(self, mock_get):
         """Test handling of empty ontology."""
-        mock_response = Mock()
-        mock_response.text = """<?xml version="1.0" encoding="utf-8"?>
+        mock_response = _mock_response("""<?xml version="1.0" encoding="utf-8"?>
         <rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#">
         </rdf:RDF>
-        """
-        mock_response.raise_for_status = Mock()
+        """)
         mock_get.return_value = mock_response
 
         with tempfile.TemporaryDirectory() as tmpdir:
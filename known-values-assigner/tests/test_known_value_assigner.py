@@ -3,12 +3,20 @@
 Unit tests for Known Value Assigner.
 """
 
+import hashlib
 import json
 import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from typing import Optional
 from unittest.mock import Mock, patch
 
 import pytest
+import requests
+from rdflib import Graph
+from rdflib.namespace import RDF
 
 # Import the module under test
 import sys
@@ -19,15 +27,45 @@ from known_value_assigner import (
     KnownValueEntry,
     OntologyConfig,
     DataFormat,
+    GraphStore,
     ProcessingStrategy,
+    OntologyCache,
     OntologyFetcher,
+    ConceptCache,
+    SourceDocument,
     StandardRDFParser,
+    TurtleStreamReader,
+    ConceptCollector,
+    FilteringStore,
+    SQLiteStore,
+    sniff_format,
+    merge_concepts,
     SchemaOrgParser,
     ContextMapParser,
+    ContextCycleError,
     KnownValueAssigner,
+    OntologyParser,
+    CodepointOverlapError,
+    CodepointRange,
+    CodepointRangeMap,
+    register_strategy,
+    get_parser_class,
     get_ontology_by_id,
     ONTOLOGY_CONFIGS,
 )
+from known_value_index import BinaryRegistry, KnownValueIndex
+
+
+def _mock_response(text: str) -> Mock:
+    """Build a mocked successful HTTP response with the given body."""
+    response = Mock()
+    response.text = text
+    response.content = text.encode("utf-8")
+    response.iter_content = lambda chunk_size=1, **kwargs: iter([response.content])
+    response.status_code = 200
+    response.headers = {}
+    response.raise_for_status = Mock()
+    return response
 
 
 class TestConcept:
@@ -155,12 +193,10 @@ class TestOntologyFetcher:
             fetcher = OntologyFetcher(cache_dir, use_cache=True)
             assert cache_dir.exists()
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_fetch_with_caching(self, mock_get):
         """Test that content is cached after fetching."""
-        mock_response = Mock()
-        mock_response.text = "<rdf>test content</rdf>"
-        mock_response.raise_for_status = Mock()
+        mock_response = _mock_response("<rdf>test content</rdf>")
         mock_get.return_value = mock_response
 
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -184,12 +220,10 @@ class TestOntologyFetcher:
             assert mock_get.call_count == 1  # No additional call
             assert content2 == content1
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_fetch_no_cache(self, mock_get):
         """Test fetching without caching."""
-        mock_response = Mock()
-        mock_response.text = "<rdf>test content</rdf>"
-        mock_response.raise_for_status = Mock()
+        mock_response = _mock_response("<rdf>test content</rdf>")
         mock_get.return_value = mock_response
 
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -201,6 +235,446 @@ class TestOntologyFetcher:
             assert mock_get.call_count == 2  # Both should hit network
 
 
+class TestOntologyCache:
+    """Tests for the content-addressed ontology cache store."""
+
+    def test_store_and_read_roundtrip(self):
+        """Stored content reads back identically, for every codec."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for codec in ["gzip", "none"]:
+                cache = OntologyCache(Path(tmpdir) / codec, compression=codec)
+                entry = cache.store("http://example.org/a", b"<rdf>content</rdf>", etag='"x"')
+                assert entry["sha256"] == hashlib.sha256(b"<rdf>content</rdf>").hexdigest()
+                assert entry["compression"] == codec
+                assert cache.read("http://example.org/a") == b"<rdf>content</rdf>"
+                assert cache.lookup("http://example.org/a")["etag"] == '"x"'
+
+    def test_zstd_roundtrip(self):
+        """zstd-compressed blobs round-trip when zstandard is installed."""
+        pytest.importorskip("zstandard")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = OntologyCache(Path(tmpdir), compression="zstd")
+            entry = cache.store("http://example.org/a", b"<rdf>content</rdf>")
+            assert cache._blob_path(entry["sha256"], "zstd").suffix == ".zst"
+            assert cache.read("http://example.org/a") == b"<rdf>content</rdf>"
+
+    def test_blobs_are_compressed(self):
+        """Compressible sources take less space on disk than their content."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = OntologyCache(Path(tmpdir), compression="gzip")
+            data = b"<rdfs:Class rdf:about='http://example.org/Thing'/>\n" * 1000
+            entry = cache.store("http://example.org/a", data)
+            blob = cache._blob_path(entry["sha256"], "gzip")
+            assert blob.suffix == ".gz"
+            assert blob.stat().st_size < len(data) // 10
+
+    def test_identical_content_shares_blob(self):
+        """Two URLs with the same content share one blob."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = OntologyCache(Path(tmpdir), compression="gzip")
+            cache.store("http://example.org/a", b"same")
+            cache.store("http://example.org/b", b"same")
+            blobs = [p for p in (Path(tmpdir) / "blobs").rglob("*") if p.is_file()]
+            assert len(blobs) == 1
+
+            # Removing one URL keeps the blob for the other
+            cache.remove("http://example.org/a")
+            assert cache.read("http://example.org/b") == b"same"
+            cache.remove("http://example.org/b")
+            assert not any(p.is_file() for p in (Path(tmpdir) / "blobs").rglob("*"))
+
+    def test_corrupted_blob_is_discarded(self):
+        """A blob that fails its checksum is dropped instead of returned."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = OntologyCache(Path(tmpdir), compression="none")
+            entry = cache.store("http://example.org/a", b"<rdf>complete</rdf>")
+            cache._blob_path(entry["sha256"], "none").write_bytes(b"<rdf>compl")
+
+            assert cache.read("http://example.org/a") is None
+            assert cache.lookup("http://example.org/a") is None
+
+    def test_truncated_compressed_blob_is_discarded(self):
+        """A truncated compressed blob is dropped instead of raising."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = OntologyCache(Path(tmpdir), compression="gzip")
+            entry = cache.store("http://example.org/a", b"<rdf>complete</rdf>" * 100)
+            blob = cache._blob_path(entry["sha256"], "gzip")
+            blob.write_bytes(blob.read_bytes()[:20])
+
+            assert cache.read("http://example.org/a") is None
+
+    def test_index_persists_across_instances(self):
+        """Entries written by one instance are visible to the next."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            OntologyCache(Path(tmpdir)).store("http://example.org/a", b"data")
+            assert OntologyCache(Path(tmpdir)).read("http://example.org/a") == b"data"
+
+    @patch('requests.Session.get')
+    def test_fetch_refetches_corrupted_entry(self, mock_get):
+        """The fetcher downloads again when the cached blob is corrupted."""
+        mock_get.return_value = _mock_response("<rdf>fresh</rdf>")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fetcher = OntologyFetcher(Path(tmpdir), compression="none")
+            entry = fetcher.cache.store("http://example.org/test.rdf", b"<rdf>fresh</rdf>")
+            fetcher.cache._blob_path(entry["sha256"], "none").write_bytes(b"<rdf>fr")
+
+            content = fetcher.fetch("http://example.org/test.rdf", DataFormat.RDF_XML, "test")
+
+            assert content == "<rdf>fresh</rdf>"
+            assert mock_get.call_count == 1
+
+    def test_legacy_cache_file_is_migrated(self):
+        """A cache file from the old flat layout is imported into the store."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fetcher = OntologyFetcher(Path(tmpdir))
+            legacy = fetcher._get_cache_filename("http://example.org/test.rdf", "test")
+            legacy.write_text("<rdf>legacy</rdf>", encoding="utf-8")
+
+            content = fetcher.fetch("http://example.org/test.rdf", DataFormat.RDF_XML, "test")
+
+            assert content == "<rdf>legacy</rdf>"
+            assert not legacy.exists()
+            assert fetcher.cache.lookup("http://example.org/test.rdf") is not None
+
+
+class _OntologyServer:
+    """Local HTTP stand-in for ontology hosts, recording requests and concurrency."""
+
+    def __init__(self, documents: dict[str, str], delay: float = 0.0):
+        self.documents = documents
+        self.delay = delay
+        # Paths whose next response is cut off after this many body bytes
+        self.truncate: dict[str, int] = {}
+        self.ranges: list[Optional[str]] = []
+        self.requests: list[str] = []
+        self.statuses: list[int] = []
+        self.conditional_headers: list[dict] = []
+        self.connections: set[int] = set()
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                with server._lock:
+                    server.requests.append(self.path)
+                    server.connections.add(self.client_address[1])
+                    server.active += 1
+                    server.max_active = max(server.max_active, server.active)
+                try:
+                    time.sleep(server.delay)
+                    body = server.documents.get(self.path)
+                    if body is None:
+                        self.send_response(404)
+                        self.send_header("Content-Length", "0")
+                        self.end_headers()
+                        return
+                    data = body.encode("utf-8")
+                    etag = '"' + hashlib.sha1(data).hexdigest()[:16] + '"'
+                    with server._lock:
+                        server.conditional_headers.append({
+                            "If-None-Match": self.headers.get("If-None-Match"),
+                            "If-Modified-Since": self.headers.get("If-Modified-Since"),
+                        })
+                    if self.headers.get("If-None-Match") == etag:
+                        server.statuses.append(304)
+                        self.send_response(304)
+                        self.send_header("ETag", etag)
+                        self.end_headers()
+                        return
+                    status, start = 200, 0
+                    byte_range = self.headers.get("Range")
+                    server.ranges.append(byte_range)
+                    if byte_range and self.headers.get("If-Range") == etag:
+                        status, start = 206, int(byte_range[len("bytes="):].rstrip("-"))
+                    server.statuses.append(status)
+                    self.send_response(status)
+                    self.send_header("Content-Type", "application/rdf+xml; charset=utf-8")
+                    self.send_header("Content-Length", str(len(data) - start))
+                    if status == 206:
+                        self.send_header("Content-Range", f"bytes {start}-{len(data) - 1}/{len(data)}")
+                    self.send_header("ETag", etag)
+                    self.send_header("Last-Modified", "Wed, 01 Jan 2025 00:00:00 GMT")
+                    self.end_headers()
+                    cut = server.truncate.pop(self.path, None)
+                    if cut is not None:
+                        self.wfile.write(data[start:start + cut])
+                        self.close_connection = True
+                        return
+                    self.wfile.write(data[start:])
+                finally:
+                    with server._lock:
+                        server.active -= 1
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def __enter__(self):
+        threading.Thread(target=self.httpd.serve_forever, args=(0.01,), daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class TestOntologyFetcherPooled:
+    """Tests for pooled and concurrent fetching against a local HTTP server."""
+
+    def _configs(self, base_url: str, count: int) -> list[OntologyConfig]:
+        return [
+            OntologyConfig(
+                name=f"ont{i}",
+                source_url=f"{base_url}/ont{i}.rdf",
+                start_code_point=1000 + i * 100,
+                data_format=DataFormat.RDF_XML,
+                strategy=ProcessingStrategy.STANDARD_RDF,
+            )
+            for i in range(count)
+        ]
+
+    def test_prefetch_downloads_everything_once(self):
+        """Prefetched sources are served from the cache afterwards."""
+        docs = {f"/ont{i}.rdf": f"<rdf>{i}</rdf>" for i in range(5)}
+        with _OntologyServer(docs) as server, tempfile.TemporaryDirectory() as tmpdir:
+            fetcher = OntologyFetcher(Path(tmpdir), use_cache=True)
+            configs = self._configs(server.url, 5)
+
+            results = fetcher.prefetch(configs)
+
+            assert results == {f"ont{i}": True for i in range(5)}
+            assert sorted(server.requests) == sorted(docs)
+            for i, config in enumerate(configs):
+                content = fetcher.fetch(config.source_url, config.data_format, config.name)
+                assert content == f"<rdf>{i}</rdf>"
+            assert len(server.requests) == 5
+
+            # Nothing left to download on a second prefetch
+            fetcher.prefetch(configs)
+            assert len(server.requests) == 5
+
+    def test_prefetch_respects_per_host_limit(self):
+        """No more than per_host_limit downloads hit one host at a time."""
+        docs = {f"/ont{i}.rdf": "<rdf/>" for i in range(8)}
+        with _OntologyServer(docs, delay=0.05) as server, tempfile.TemporaryDirectory() as tmpdir:
+            fetcher = OntologyFetcher(Path(tmpdir), use_cache=True)
+            fetcher.prefetch(self._configs(server.url, 8), max_workers=8, per_host_limit=2)
+
+            assert len(server.requests) == 8
+            assert server.max_active <= 2
+
+    def test_prefetch_without_cache_keeps_content_in_memory(self):
+        """With caching disabled, prefetched content is handed to the next fetch."""
+        docs = {"/ont0.rdf": "<rdf>0</rdf>"}
+        with _OntologyServer(docs) as server, tempfile.TemporaryDirectory() as tmpdir:
+            fetcher = OntologyFetcher(Path(tmpdir) / "cache", use_cache=False)
+            config = self._configs(server.url, 1)[0]
+
+            fetcher.prefetch([config])
+            content = fetcher.fetch(config.source_url, config.data_format, config.name)
+
+            assert content == "<rdf>0</rdf>"
+            assert len(server.requests) == 1
+            assert not (Path(tmpdir) / "cache").exists()
+
+    def test_prefetch_failure_is_reported_once(self):
+        """A failed prefetch is reported and re-raised by fetch without a second request."""
+        with _OntologyServer({}) as server, tempfile.TemporaryDirectory() as tmpdir:
+            fetcher = OntologyFetcher(Path(tmpdir), use_cache=True)
+            config = self._configs(server.url, 1)[0]
+
+            assert fetcher.prefetch([config]) == {"ont0": False}
+            with pytest.raises(Exception):
+                fetcher.fetch(config.source_url, config.data_format, config.name)
+            assert len(server.requests) == 1
+
+    def test_connections_are_reused(self):
+        """Sequential fetches from one host share a keep-alive connection."""
+        docs = {f"/ont{i}.rdf": "<rdf/>" for i in range(4)}
+        with _OntologyServer(docs) as server, tempfile.TemporaryDirectory() as tmpdir:
+            fetcher = OntologyFetcher(Path(tmpdir), use_cache=False)
+            for config in self._configs(server.url, 4):
+                fetcher.fetch(config.source_url, config.data_format, config.name)
+            fetcher.close()
+
+            assert len(server.requests) == 4
+            assert len(server.connections) == 1
+
+
+class TestOntologyFetcherRevalidation:
+    """Tests for cache metadata, TTLs and conditional GET revalidation."""
+
+    URL_PATH = "/ont.rdf"
+
+    def _fetch(self, fetcher: OntologyFetcher, base_url: str, ttl=None) -> str:
+        return fetcher.fetch(base_url + self.URL_PATH, DataFormat.RDF_XML, "ont", ttl=ttl)
+
+    def test_cache_metadata_recorded(self):
+        """A download records ETag, Last-Modified, fetch time and content hash."""
+        docs = {self.URL_PATH: "<rdf>v1</rdf>"}
+        with _OntologyServer(docs) as server, tempfile.TemporaryDirectory() as tmpdir:
+            fetcher = OntologyFetcher(Path(tmpdir), use_cache=True)
+            self._fetch(fetcher, server.url)
+
+            metadata = fetcher.cache.lookup(server.url + self.URL_PATH)
+            assert metadata["etag"].startswith('"')
+            assert metadata["last_modified"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+            assert metadata["fetched_at"] <= time.time()
+            assert metadata["sha256"] == hashlib.sha256(b"<rdf>v1</rdf>").hexdigest()
+
+    def test_no_ttl_uses_cache_forever(self):
+        """Without a TTL, a cached source is used without any request."""
+        docs = {self.URL_PATH: "<rdf>v1</rdf>"}
+        with _OntologyServer(docs) as server, tempfile.TemporaryDirectory() as tmpdir:
+            self._fetch(OntologyFetcher(Path(tmpdir)), server.url)
+            self._fetch(OntologyFetcher(Path(tmpdir)), server.url)
+
+            assert server.statuses == [200]
+
+    def test_expired_ttl_revalidates_with_304(self):
+        """An expired entry is revalidated and a 304 avoids the download."""
+        docs = {self.URL_PATH: "<rdf>v1</rdf>"}
+        with _OntologyServer(docs) as server, tempfile.TemporaryDirectory() as tmpdir:
+            self._fetch(OntologyFetcher(Path(tmpdir)), server.url)
+            fetcher = OntologyFetcher(Path(tmpdir))
+            before = fetcher.cache.lookup(server.url + self.URL_PATH)["fetched_at"]
+
+            content = self._fetch(fetcher, server.url, ttl=0)
+
+            assert content == "<rdf>v1</rdf>"
+            assert server.statuses == [200, 304]
+            assert server.conditional_headers[-1]["If-None-Match"] is not None
+            assert server.conditional_headers[-1]["If-Modified-Since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+            assert fetcher.cache.lookup(server.url + self.URL_PATH)["fetched_at"] >= before
+
+            # Revalidated once per run, not once per fetch
+            self._fetch(fetcher, server.url, ttl=0)
+            assert server.statuses == [200, 304]
+
+    def test_changed_source_is_downloaded(self):
+        """A modified upstream source replaces the cached copy."""
+        docs = {self.URL_PATH: "<rdf>v1</rdf>"}
+        with _OntologyServer(docs) as server, tempfile.TemporaryDirectory() as tmpdir:
+            self._fetch(OntologyFetcher(Path(tmpdir)), server.url)
+            docs[self.URL_PATH] = "<rdf>v2</rdf>"
+
+            content = self._fetch(OntologyFetcher(Path(tmpdir), revalidate=True), server.url)
+
+            assert content == "<rdf>v2</rdf>"
+            assert server.statuses == [200, 200]
+            assert self._fetch(OntologyFetcher(Path(tmpdir)), server.url) == "<rdf>v2</rdf>"
+
+    def test_fresh_entry_within_ttl(self):
+        """An entry younger than its TTL is used without a request."""
+        docs = {self.URL_PATH: "<rdf>v1</rdf>"}
+        with _OntologyServer(docs) as server, tempfile.TemporaryDirectory() as tmpdir:
+            self._fetch(OntologyFetcher(Path(tmpdir)), server.url)
+            fetcher = OntologyFetcher(Path(tmpdir))
+
+            assert fetcher.is_cached(server.url + self.URL_PATH, "ont", ttl=3600)
+            self._fetch(fetcher, server.url, ttl=3600)
+            assert server.statuses == [200]
+
+    def test_stale_cache_used_when_network_fails(self):
+        """If revalidation fails, the stale cached copy is still used."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fetcher = OntologyFetcher(Path(tmpdir), revalidate=True)
+            url = "http://127.0.0.1:9/ont.rdf"
+            fetcher.cache.store(url, b"<rdf>old</rdf>")
+
+            assert fetcher.fetch(url, DataFormat.RDF_XML, "ont") == "<rdf>old</rdf>"
+
+
+class TestStreamingSources:
+    """Tests for streamed downloads and file-backed source documents."""
+
+    URL_PATH = "/big.rdf"
+    BODY = "<rdf>" + "x" * 200_000 + "</rdf>"
+
+    def test_download_is_streamed_into_store(self):
+        """A download lands in the content store without leaving partial files."""
+        docs = {self.URL_PATH: self.BODY}
+        with _OntologyServer(docs) as server, tempfile.TemporaryDirectory() as tmpdir:
+            fetcher = OntologyFetcher(Path(tmpdir), compression="none")
+            source = fetcher.fetch_source(server.url + self.URL_PATH, DataFormat.RDF_XML, "big")
+
+            assert source.path is not None and source.data is None
+            assert source.sha256 == hashlib.sha256(self.BODY.encode("utf-8")).hexdigest()
+            assert source.read_text() == self.BODY
+            assert not any((Path(tmpdir) / "partial").iterdir())
+
+    def test_content_type_is_kept_with_cached_source(self):
+        """The server's media type is recorded and restored with the cached source."""
+        docs = {self.URL_PATH: self.BODY}
+        with _OntologyServer(docs) as server, tempfile.TemporaryDirectory() as tmpdir:
+            url = server.url + self.URL_PATH
+            source = OntologyFetcher(Path(tmpdir)).fetch_source(url, DataFormat.RDF_XML, "big")
+            assert source.content_type == "application/rdf+xml"
+            assert OntologyCache(Path(tmpdir)).open_source(url).content_type == "application/rdf+xml"
+
+    def test_interrupted_download_resumes_with_range(self):
+        """A cut-off download is resumed from where it stopped."""
+        docs = {self.URL_PATH: self.BODY}
+        with _OntologyServer(docs) as server, tempfile.TemporaryDirectory() as tmpdir:
+            server.truncate[self.URL_PATH] = 100_000
+            url = server.url + self.URL_PATH
+            with pytest.raises(requests.RequestException):
+                OntologyFetcher(Path(tmpdir)).fetch_source(url, DataFormat.RDF_XML, "big")
+
+            source = OntologyFetcher(Path(tmpdir)).fetch_source(url, DataFormat.RDF_XML, "big")
+
+            assert server.statuses == [200, 206]
+            # Everything received in whole chunks before the cut is kept
+            resumed_at = int(server.ranges[-1][len("bytes="):].rstrip("-"))
+            assert 0 < resumed_at <= 100_000
+            assert source.read_text() == self.BODY
+            assert source.sha256 == hashlib.sha256(self.BODY.encode("utf-8")).hexdigest()
+
+    def test_uncompressed_blob_is_memory_mapped(self):
+        """Uncompressed cache blobs are opened as memory maps."""
+        import mmap
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = OntologyCache(Path(tmpdir), compression="none")
+            cache.store("http://example.org/a", b"<rdf>content</rdf>")
+            with cache.open_source("http://example.org/a").open() as stream:
+                assert isinstance(stream, mmap.mmap)
+                assert stream.read() == b"<rdf>content</rdf>"
+
+    def test_compressed_stream_hides_blob_name(self):
+        """Compressed blobs stream without exposing a file name to parsers."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = OntologyCache(Path(tmpdir), compression="gzip")
+            cache.store("http://example.org/a", b"<rdf>content</rdf>")
+            with cache.open_source("http://example.org/a").open() as stream:
+                assert not hasattr(stream, "name")
+                assert stream.read() == b"<rdf>content</rdf>"
+
+    def test_parser_reads_cached_blob(self):
+        """Parsing a compressed cached blob matches parsing the text directly."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fetcher = OntologyFetcher(Path(tmpdir), compression="gzip")
+            config = OntologyConfig(
+                name="test",
+                source_url="http://example.org/test.rdf",
+                start_code_point=1000,
+                data_format=DataFormat.RDF_XML,
+                strategy=ProcessingStrategy.STANDARD_RDF,
+            )
+            fetcher.cache.store(config.source_url, TestStandardRDFParser.SAMPLE_RDF.encode("utf-8"))
+            source = fetcher.fetch_source(config.source_url, config.data_format, config.name)
+            in_memory = SourceDocument.from_text(config.source_url, TestStandardRDFParser.SAMPLE_RDF)
+
+            parser = StandardRDFParser(fetcher)
+            assert parser.extract(source, config) == parser.extract(in_memory, config)
+
+
 class TestStandardRDFParser:
     """Tests for StandardRDFParser."""
 
@@ -234,10 +708,10 @@ class TestStandardRDFParser:
             name = parser._extract_local_name("http://example.org/vocab/Thing")
             assert name == "Thing"
 
-    @patch.object(OntologyFetcher, 'fetch')
+    @patch.object(OntologyFetcher, 'fetch_source')
     def test_parse_rdf_concepts(self, mock_fetch):
         """Test parsing RDF content extracts concepts."""
-        mock_fetch.return_value = self.SAMPLE_RDF
+        mock_fetch.return_value = SourceDocument.from_text("http://example.org/", self.SAMPLE_RDF)
 
         with tempfile.TemporaryDirectory() as tmpdir:
             fetcher = OntologyFetcher(Path(tmpdir), use_cache=False)
@@ -265,6 +739,493 @@ class TestStandardRDFParser:
             assert person.concept_type == "Class"
             assert "human" in person.description.lower()
 
+    EDGE_CASE_RDF = """<?xml version="1.0" encoding="utf-8"?>
+    <!DOCTYPE rdf:RDF [<!ENTITY ex "http://example.org/ns#">]>
+    <rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+             xmlns:rdfs="http://www.w3.org/2000/01/rdf-schema#"
+             xmlns:owl="http://www.w3.org/2002/07/owl#"
+             xmlns:skos="http://www.w3.org/2004/02/skos/core#"
+             xmlns:dcterms="http://purl.org/dc/terms/"
+             xml:base="http://example.org/ns" xml:lang="fr">
+        <owl:Class rdf:ID="Person">
+            <rdfs:label>Personne</rdfs:label>
+            <rdfs:label xml:lang="en">Person</rdfs:label>
+            <rdfs:comment xml:lang="EN">Upper-case tag is not English</rdfs:comment>
+            <dcterms:description>Described</dcterms:description>
+            <rdfs:subClassOf>
+                <owl:Class rdf:about="&ex;Agent" rdfs:label="Agent">
+                    <owl:unionOf rdf:parseType="Collection">
+                        <owl:Class rdf:about="#Org"/>
+                        <rdf:Description rdf:about="&ex;Group">
+                            <rdf:type rdf:resource="http://www.w3.org/2000/01/rdf-schema#Class"/>
+                        </rdf:Description>
+                    </owl:unionOf>
+                </owl:Class>
+            </rdfs:subClassOf>
+        </owl:Class>
+        <rdf:Description rdf:about="#Org" xml:lang="">
+            <rdfs:label>Organisation</rdfs:label>
+            <skos:definition xml:lang="en">An organisation</skos:definition>
+        </rdf:Description>
+        <rdf:Property rdf:about="&ex;name" rdfs:comment="From an attribute">
+            <rdfs:label rdf:datatype="http://www.w3.org/2001/XMLSchema#string">name</rdfs:label>
+            <rdfs:seeAlso rdf:resource="http://example.org/see" rdfs:label="Not the property's label"/>
+        </rdf:Property>
+        <owl:ObjectProperty rdf:about="knows" xml:base="http://other.org/dir/">
+            <skos:prefLabel xml:lang="en">knows</skos:prefLabel>
+            <rdfs:label xml:lang="de">kennt</rdfs:label>
+            <rdfs:comment rdf:resource="http://example.org/doc"/>
+        </owl:ObjectProperty>
+        <rdf:Bag rdf:about="#bag"><rdf:li>one</rdf:li></rdf:Bag>
+        <owl:AnnotationProperty rdf:about="&ex;note"><rdfs:label></rdfs:label></owl:AnnotationProperty>
+    </rdf:RDF>"""
+
+    EDGE_CASE_TURTLE = """@prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
+    @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+    @prefix owl: <http://www.w3.org/2002/07/owl#> .
+    @prefix skos: <http://www.w3.org/2004/02/skos/core#> .
+    @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+    PREFIX ex: <http://example.org/ns#>
+    # A comment with "quotes" and <brackets>
+    ex:Person a owl:Class, rdfs:Class ;
+        rdfs:label "Personne"@fr, "Person"@en ;
+        rdfs:comment \"\"\"A human
+    being, "quoted" \"\"\"@en ;
+        rdfs:subClassOf [ a owl:Restriction ; owl:onProperty ex:name ] ;
+        owl:unionOf ( ex:A ex:B ) .  # trailing comment
+    ex:name a rdf:Property;
+        rdfs:label "name"^^xsd:string;
+        rdfs:comment 'Escaped \\'quote\\' \\u00e9'@EN;;
+        owl:deprecated true .
+    ex:with.dots a rdfs:Class; rdfs:label "dots".
+    @base <http://other.org/dir/> .
+    <knows> a owl:ObjectProperty ; skos:prefLabel "knows"@en ; rdfs:comment <http://example.org/doc> .
+    _:b1 a rdfs:Class ; rdfs:label "blank" .
+    [ a rdfs:Class ] rdfs:label "anonymous" .
+    ex:note a owl:AnnotationProperty ; rdfs:label "" ; ex:value 1.5e3, -2, .5 .
+    """
+
+    def _extract_both(self, content: bytes, uri_filter=None, data_format=DataFormat.RDF_XML):
+        config = OntologyConfig(
+            name="test",
+            source_url="http://example.org/ns",
+            start_code_point=1000,
+            data_format=data_format,
+            strategy=ProcessingStrategy.STANDARD_RDF,
+            uri_filter=uri_filter,
+        )
+        source = SourceDocument.from_bytes(config.source_url, content)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            parser = StandardRDFParser(OntologyFetcher(Path(tmpdir), use_cache=False))
+            with patch.object(StandardRDFParser, "_extract_rdflib", side_effect=AssertionError("rdflib used")):
+                streamed = parser.extract(source, config)
+            return streamed, parser._extract_rdflib(source, config)
+
+    def test_streaming_reader_matches_rdflib(self):
+        """The streaming RDF/XML reader yields the same concepts, in the same order, as rdflib."""
+        streamed, graph = self._extract_both(self.EDGE_CASE_RDF.encode("utf-8"))
+        assert streamed == graph
+        by_uri = {c.uri: c for c in streamed}
+        assert by_uri["http://example.org/ns#Person"].label == "Person"
+        assert by_uri["http://example.org/ns#Person"].description == "Described"
+        assert by_uri["http://other.org/dir/knows"].label == "knows"
+        assert by_uri["http://example.org/ns#note"].label == ""
+
+    def test_streaming_reader_matches_rdflib_on_foaf(self):
+        """The bundled FOAF ontology extracts identically through both paths."""
+        content = (Path(__file__).parent.parent / "bundled" / "foaf.rdf").read_bytes()
+        streamed, graph = self._extract_both(content, uri_filter="http://xmlns.com/foaf/0.1/")
+        assert len(streamed) > 50
+        assert streamed == graph
+
+    def test_turtle_reader_matches_rdflib(self):
+        """The streaming Turtle reader yields the same concepts, in the same order, as rdflib."""
+        content = self.EDGE_CASE_TURTLE.encode("utf-8")
+        streamed, graph = self._extract_both(content, data_format=DataFormat.TURTLE)
+        assert streamed == graph
+        by_uri = {c.uri: c for c in streamed}
+        assert by_uri["http://example.org/ns#Person"].label == "Person"
+        assert by_uri["http://example.org/ns#name"].description == "Escaped 'quote' \u00e9"
+        assert by_uri["http://other.org/dir/knows"].label == "knows"
+        assert by_uri["http://example.org/ns#with.dots"].label == "dots"
+
+        filtered, graph = self._extract_both(content, uri_filter="http://example.org/ns#",
+                                             data_format=DataFormat.TURTLE)
+        assert filtered == graph
+        assert "http://other.org/dir/knows" not in {c.uri for c in filtered}
+
+    def test_rdflib_path_keeps_label_order_for_shared_literals(self):
+        """A label text another subject used first does not change which label is chosen."""
+        content = (
+            "@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .\n"
+            "<http://example.org/ns#Other> rdfs:label \"Second\" .\n"
+            "<http://example.org/ns#Thing> a rdfs:Class ; rdfs:label \"First\", \"Second\" ;\n"
+            "    rdfs:comment \"Kommentar\"@de, \"Comment\"@en .\n"
+        ).encode("utf-8")
+        streamed, graph = self._extract_both(content, data_format=DataFormat.TURTLE)
+        assert streamed == graph
+        assert [(c.label, c.description) for c in graph] == [("First", "Comment")]
+
+    def test_rdflib_path_stores_only_needed_triples(self):
+        """Triples extraction never reads are dropped before they reach the graph."""
+        config = OntologyConfig(
+            name="test",
+            source_url="http://example.org/ns",
+            start_code_point=1000,
+            data_format=DataFormat.RDF_XML,
+            strategy=ProcessingStrategy.STANDARD_RDF,
+            uri_filter="http://example.org/ns#",
+        )
+        source = SourceDocument.from_text(config.source_url, self.EDGE_CASE_RDF)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            parser = StandardRDFParser(OntologyFetcher(Path(tmpdir), use_cache=False))
+            full = Graph()
+            full.parse(data=self.EDGE_CASE_RDF, format="xml")
+            with parser._parse_graph(source, "xml", config, parser.CONCEPT_TYPES,
+                                     ConceptCollector.RULES) as graph:
+                assert isinstance(graph.store, FilteringStore)
+                assert 0 < len(graph) < len(full)
+                for subject, predicate, obj in graph:
+                    assert subject.startswith(config.uri_filter)
+                    if predicate == RDF.type:
+                        assert str(obj) in parser.CONCEPT_TYPES
+                    else:
+                        assert str(predicate) in ConceptCollector.RULES
+                triple_filter = graph.store.triple_filter
+                assert triple_filter.kept == len(graph)
+                assert triple_filter.kept + triple_filter.dropped >= len(full)
+
+    def test_sqlite_graph_store_matches_memory(self):
+        """Extraction through the disk-backed store selects the same concepts, then removes it."""
+        content = (Path(__file__).parent.parent / "bundled" / "foaf.rdf").read_bytes()
+        config = OntologyConfig(
+            name="test",
+            source_url="http://xmlns.com/foaf/0.1/",
+            start_code_point=1000,
+            data_format=DataFormat.RDF_XML,
+            strategy=ProcessingStrategy.STANDARD_RDF,
+            uri_filter="http://xmlns.com/foaf/0.1/",
+        )
+        source = SourceDocument.from_bytes(config.source_url, content)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            parser = StandardRDFParser(OntologyFetcher(Path(tmpdir), use_cache=False))
+            in_memory = parser._extract_rdflib(source, config)
+            config.graph_store = GraphStore.SQLITE
+            with patch.object(SQLiteStore, "BATCH_SIZE", 7):
+                on_disk = parser._extract_rdflib(source, config)
+            assert not any((Path(tmpdir) / "graphs").iterdir())
+
+        assert len(on_disk) > 50
+        assert on_disk == in_memory
+
+    def test_turtle_reader_reads_n_triples(self):
+        """N-Triples, being a subset of Turtle, is read by the same reader."""
+        content = (
+            '<http://example.org/ns#Thing> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> '
+            '<http://www.w3.org/2000/01/rdf-schema#Class> .\n'
+            '<http://example.org/ns#Thing> <http://www.w3.org/2000/01/rdf-schema#label> "Thing"@en .\n'
+            '<http://example.org/ns#Thing> <http://www.w3.org/2000/01/rdf-schema#comment> "A \\"thing\\"" .\n'
+        ).encode("utf-8")
+        streamed, graph = self._extract_both(content, data_format=DataFormat.TURTLE)
+        assert streamed == graph
+        assert [(c.label, c.description) for c in streamed] == [("Thing", 'A "thing"')]
+
+    def test_turtle_reader_handles_chunk_boundaries(self):
+        """Tokens split across decoded chunks, including multi-byte characters, are reassembled."""
+        content = self.EDGE_CASE_TURTLE.encode("utf-8")
+        _, graph = self._extract_both(content, data_format=DataFormat.TURTLE)
+        with patch.object(TurtleStreamReader, "CHUNK_SIZE", 7), patch.object(TurtleStreamReader, "LOOKAHEAD", 80):
+            streamed, _ = self._extract_both(content, data_format=DataFormat.TURTLE)
+        assert streamed == graph
+
+    EDGE_CASE_N_TRIPLES = "".join(
+        f"<http://example.org/ns#Thing{i}> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> "
+        f"<http://www.w3.org/2002/07/owl#Class> .\n"
+        f"<http://example.org/ns#Thing{i}> <http://www.w3.org/2000/01/rdf-schema#label> \"Ding {i}\"@de .\n"
+        f"# comment {i}\n\n"
+        f"<http://example.org/ns#Thing{i // 2}> <http://www.w3.org/2000/01/rdf-schema#label> "
+        f"\"Thing \\\"{i // 2}\\\" \\u00e9\"@en .\n"
+        f"_:b{i} <http://www.w3.org/2000/01/rdf-schema#label> \"blank\" .\n"
+        f"<http://example.org/ns#Thing{i}> <http://www.w3.org/2000/01/rdf-schema#comment> "
+        f"\"Comment {i}\"^^<http://www.w3.org/2001/XMLSchema#string> . # trailing\n"
+        for i in range(40)
+    )
+
+    def test_line_readers_match_rdflib(self):
+        """The N-Triples and N-Quads readers yield the same concepts, in the same order, as rdflib."""
+        content = self.EDGE_CASE_N_TRIPLES
+        streamed, graph = self._extract_both(content.encode("utf-8"), data_format=DataFormat.N_TRIPLES)
+        assert streamed == graph
+        assert streamed[0].label == 'Thing "0" é'
+
+        quads = "".join(
+            line[:-2] + (f"<http://example.org/graph{i % 3}> .\n" if i % 2 else "_:g .\n")
+            if line.endswith(" .\n") else line
+            for i, line in enumerate(content.splitlines(keepends=True))
+        )
+        streamed_quads, graph_quads = self._extract_both(quads.encode("utf-8"), data_format=DataFormat.N_QUADS)
+        assert streamed_quads == graph_quads == streamed
+
+    def test_line_ranges_match_single_reader(self):
+        """N-Triples read in line ranges by worker processes yields exactly the single-reader result."""
+        content = self.EDGE_CASE_N_TRIPLES.encode("utf-8")
+        config = OntologyConfig(
+            name="test",
+            source_url="http://example.org/ns",
+            start_code_point=1000,
+            data_format=DataFormat.N_TRIPLES,
+            strategy=ProcessingStrategy.STANDARD_RDF,
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fetcher = OntologyFetcher(Path(tmpdir), use_cache=False)
+            in_memory = SourceDocument.from_bytes(config.source_url, content)
+            single = StandardRDFParser(fetcher, max_workers=1).extract(in_memory, config)
+
+            parser = StandardRDFParser(fetcher, max_workers=2)
+            cached = []
+            for compression in ("none", "gzip"):
+                cache = OntologyCache(Path(tmpdir) / compression, compression)
+                cache.store(config.source_url, content)
+                cached.append(cache.open_source(config.source_url))
+            with patch.object(StandardRDFParser, "LINE_RANGE_SIZE", 300), \
+                    patch.object(StandardRDFParser, "_extract_rdflib", side_effect=AssertionError("rdflib used")):
+                for source in [in_memory, *cached]:
+                    assert parser.extract(source, config) == single
+
+    def test_sniffed_format_is_parsed_once(self):
+        """A source in another format than configured goes straight to the matching parser."""
+        config = OntologyConfig(
+            name="test",
+            source_url="http://example.org/ns",
+            start_code_point=1000,
+            data_format=DataFormat.RDF_XML,
+            strategy=ProcessingStrategy.STANDARD_RDF,
+        )
+        turtle = SourceDocument.from_text(config.source_url, (
+            "@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .\n"
+            "<http://example.org/ns#Thing> a rdfs:Class ; rdfs:label \"Thing\" .\n"
+        ))
+        json_ld = SourceDocument.from_text(config.source_url, json.dumps({
+            "@id": "http://example.org/ns#Thing",
+            "@type": "http://www.w3.org/2000/01/rdf-schema#Class",
+            "http://www.w3.org/2000/01/rdf-schema#label": "Thing",
+        }))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            parser = StandardRDFParser(OntologyFetcher(Path(tmpdir), use_cache=False))
+            with patch.object(StandardRDFParser, "_extract_rdflib", side_effect=AssertionError("rdflib used")):
+                assert [c.label for c in parser.extract(turtle, config)] == ["Thing"]
+            with patch("rdflib.Graph.parse", autospec=True, side_effect=Graph.parse) as graph_parse:
+                assert [c.label for c in parser.extract(json_ld, config)] == ["Thing"]
+            assert [call.kwargs["format"] for call in graph_parse.call_args_list] == ["json-ld"]
+
+    def test_format_detection(self):
+        """The byte signature decides the format, then the Content-Type, then the configuration."""
+        def detect(text: str, content_type=None, declared=DataFormat.RDF_XML) -> DataFormat:
+            source = SourceDocument.from_bytes("http://example.org/ns", text.encode("utf-8"), content_type)
+            return sniff_format(source, declared)
+
+        assert detect('\ufeff<?xml version="1.0"?>\n<rdf:RDF/>', "text/turtle") == DataFormat.RDF_XML
+        assert detect('<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#">') == DataFormat.RDF_XML
+        assert detect("# comment\n<Thing> a <Class> .") == DataFormat.TURTLE
+        assert detect("PREFIX ex: <http://example.org/>") == DataFormat.TURTLE
+        assert detect("<http://example.org/a> <http://example.org/b> <http://example.org/c> .") \
+            == DataFormat.TURTLE
+        assert detect('  [{"@id": "http://example.org/a"}]') == DataFormat.JSON_LD
+        assert detect("<Thing> a <Class> .", "text/turtle") == DataFormat.TURTLE
+        assert detect("<Thing> a <Class> .", declared=DataFormat.TURTLE) == DataFormat.TURTLE
+        assert detect("<Thing> a <Class> .") == DataFormat.RDF_XML
+        assert detect("<http://example.org/a> <http://example.org/b> <http://example.org/c> .",
+                      "application/n-triples", DataFormat.TURTLE) == DataFormat.N_TRIPLES
+        assert detect("<http://example.org/a> <http://example.org/b> <http://example.org/c> .",
+                      declared=DataFormat.N_QUADS) == DataFormat.N_QUADS
+
+    def test_unsupported_input_falls_back_to_rdflib(self):
+        """Turtle and RDF/XML the readers cannot mirror exactly are parsed by rdflib."""
+        config = OntologyConfig(
+            name="test",
+            source_url="http://example.org/ns",
+            start_code_point=1000,
+            data_format=DataFormat.TURTLE,
+            strategy=ProcessingStrategy.STANDARD_RDF,
+        )
+        xml_literal = SourceDocument.from_text(config.source_url, self.SAMPLE_RDF.replace(
+            "<rdfs:comment>A human being</rdfs:comment>",
+            '<rdfs:comment rdf:parseType="Literal"><b>A human being</b></rdfs:comment>',
+        ))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            parser = StandardRDFParser(OntologyFetcher(Path(tmpdir), use_cache=False))
+            relative = SourceDocument.from_text(config.source_url, (
+                "@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .\n"
+                "<Thing> a rdfs:Class ; rdfs:label \"Relative\" .\n"
+            ))
+            assert [c.label for c in parser.extract(relative, config)] == ["Relative"]
+            person = next(c for c in parser.extract(xml_literal, config) if c.uri.endswith("Person"))
+            assert "A human being" in person.description
+
+
+class TestConceptCache:
+    """Tests for the extracted-concept cache tier."""
+
+    def _config(self, uri_filter=None) -> OntologyConfig:
+        return OntologyConfig(
+            name="test",
+            source_url="http://example.org/test.rdf",
+            start_code_point=1000,
+            data_format=DataFormat.RDF_XML,
+            strategy=ProcessingStrategy.STANDARD_RDF,
+            uri_filter=uri_filter,
+        )
+
+    def test_save_and_load_roundtrip(self):
+        """Concepts round-trip through the cache unchanged."""
+        concepts = [
+            Concept("http://example.org/Thing", "Thing", "A thing | with \"quotes\"", "Class"),
+            Concept("http://example.org/naïve", "naïve", "", "Property"),
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = ConceptCache(Path(tmpdir))
+            key = ConceptCache.make_key("abc", "StandardRDFParser", "StandardRDF", None)
+            assert cache.load(key) is None
+            cache.save(key, concepts)
+            assert cache.load(key) == concepts
+
+    def test_key_covers_all_inputs(self):
+        """Source hash, parser, strategy and uri_filter all change the key."""
+        base = ConceptCache.make_key("abc", "StandardRDFParser", "StandardRDF", None)
+        assert ConceptCache.make_key("abd", "StandardRDFParser", "StandardRDF", None) != base
+        assert ConceptCache.make_key("abc", "SchemaOrgParser", "StandardRDF", None) != base
+        assert ConceptCache.make_key("abc", "StandardRDFParser", "SchemaOrgLD", None) != base
+        assert ConceptCache.make_key("abc", "StandardRDFParser", "StandardRDF", "http://x/") != base
+
+    @patch.object(OntologyFetcher, 'fetch_source')
+    def test_unchanged_source_skips_parsing(self, mock_fetch):
+        """A second parse of identical content is served from the concept cache."""
+        mock_fetch.return_value = SourceDocument.from_text("http://example.org/", TestStandardRDFParser.SAMPLE_RDF)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            parser = StandardRDFParser(OntologyFetcher(Path(tmpdir), use_cache=True))
+            first = parser.parse(self._config())
+
+            with patch.object(StandardRDFParser, 'extract', side_effect=AssertionError("re-parsed")):
+                second = parser.parse(self._config())
+
+            assert second == first
+            assert len(second) == 2
+
+    @patch.object(OntologyFetcher, 'fetch_source')
+    def test_changed_inputs_reparse(self, mock_fetch):
+        """Changing the source content or uri_filter misses the concept cache."""
+        mock_fetch.return_value = SourceDocument.from_text("http://example.org/", TestStandardRDFParser.SAMPLE_RDF)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            parser = StandardRDFParser(OntologyFetcher(Path(tmpdir), use_cache=True))
+            parser.parse(self._config())
+
+            filtered = parser.parse(self._config(uri_filter="http://example.org/P"))
+            assert [c.uri for c in filtered] == ["http://example.org/Person"]
+
+            changed = TestStandardRDFParser.SAMPLE_RDF.replace("A human being", "A person")
+            mock_fetch.return_value = SourceDocument.from_text("http://example.org/", changed)
+            changed = parser.parse(self._config())
+            person = next(c for c in changed if c.uri.endswith("Person"))
+            assert person.description == "A person"
+
+    def test_disabled_without_source_cache(self):
+        """No concept cache is used when source caching is disabled."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            parser = StandardRDFParser(OntologyFetcher(Path(tmpdir), use_cache=False))
+            assert parser.concept_cache is None
+
+
+class TestMultiSourceOntologies:
+    """Tests for ontologies assembled from several source documents."""
+
+    EXTENSION_RDF = """<?xml version="1.0"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+         xmlns:rdfs="http://www.w3.org/2000/01/rdf-schema#">
+    <rdfs:Class rdf:about="http://example.org/Person">
+        <rdfs:label>Human</rdfs:label>
+        <rdfs:comment>Overridden description</rdfs:comment>
+    </rdfs:Class>
+    <rdf:Property rdf:about="http://example.org/nickname">
+        <rdfs:label>nickname</rdfs:label>
+    </rdf:Property>
+</rdf:RDF>"""
+
+    def test_merge_rules(self):
+        """The first source wins labels and types; empty descriptions are filled in later."""
+        first = [
+            Concept("http://example.org/b", "b", "", "Class"),
+            Concept("http://example.org/a", "a", "First", "Class"),
+        ]
+        second = [
+            Concept("http://example.org/c", "c", "", "Property"),
+            Concept("http://example.org/b", "B", "Second", "Property"),
+            Concept("http://example.org/a", "A", "Second", "Class"),
+        ]
+
+        merged = merge_concepts([first, second])
+
+        assert merged == [
+            Concept("http://example.org/b", "b", "Second", "Class"),
+            Concept("http://example.org/a", "a", "First", "Class"),
+            Concept("http://example.org/c", "c", "", "Property"),
+        ]
+        assert merge_concepts([first, second]) == merged
+
+    def test_sources_are_fetched_parsed_and_merged(self):
+        """Every source is prefetched, extracted in worker processes and merged."""
+        docs = {"/core.rdf": TestStandardRDFParser.SAMPLE_RDF, "/extension.rdf": self.EXTENSION_RDF}
+        with _OntologyServer(docs) as server, tempfile.TemporaryDirectory() as tmpdir:
+            config = OntologyConfig(
+                name="multi",
+                source_url=f"{server.url}/core.rdf",
+                start_code_point=1000,
+                data_format=DataFormat.RDF_XML,
+                strategy=ProcessingStrategy.STANDARD_RDF,
+                sources=[f"{server.url}/extension.rdf"],
+            )
+            fetcher = OntologyFetcher(Path(tmpdir), use_cache=True)
+            assert fetcher.prefetch([config]) == {"multi": True}
+            assert sorted(server.requests) == sorted(docs)
+
+            parser = StandardRDFParser(fetcher, max_workers=2)
+            concepts = parser.parse(config)
+
+            assert [c.uri for c in concepts] == [
+                "http://example.org/Person",
+                "http://example.org/name",
+                "http://example.org/nickname",
+            ]
+            assert concepts[0].label == "Person"
+            assert concepts[0].description == "A human being"
+
+            # Both sources are now in the concept cache
+            with patch.object(StandardRDFParser, 'extract', side_effect=AssertionError("re-parsed")):
+                assert parser.parse(config) == concepts
+
+
+    def test_source_workers_parse_in_one_process(self, tmp_path):
+        """A source worker reads a large N-Triples document itself instead of starting a nested pool."""
+        from known_value_assigner import _extract_source_job
+
+        config = OntologyConfig(
+            name="multi",
+            source_url="http://example.org/core.nt",
+            start_code_point=1000,
+            data_format=DataFormat.N_TRIPLES,
+            strategy=ProcessingStrategy.STANDARD_RDF,
+        )
+        lines = "".join(
+            f"<http://example.org/C{i}> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> "
+            f"<http://www.w3.org/2000/01/rdf-schema#Class> .\n"
+            for i in range(50)
+        )
+        source = SourceDocument.from_text(config.source_url, lines)
+
+        with patch.object(StandardRDFParser, "LINE_RANGE_SIZE", 256), patch("os.cpu_count", return_value=4), \
+                patch("concurrent.futures.ProcessPoolExecutor", side_effect=AssertionError("nested pool")):
+            concepts = _extract_source_job(StandardRDFParser, tmp_path, source, config)
+        assert len(concepts) == 50
+
 
 class TestContextMapParser:
     """Tests for ContextMapParser."""
@@ -289,10 +1250,10 @@ class TestContextMapParser:
             assert parser._camel_case_to_words("SimpleWord") == "Simple Word"
             assert parser._camel_case_to_words("ABC") == "ABC"
 
-    @patch.object(OntologyFetcher, 'fetch')
+    @patch.object(OntologyFetcher, 'fetch_source')
     def test_parse_context(self, mock_fetch):
         """Test parsing JSON-LD context."""
-        mock_fetch.return_value = self.SAMPLE_CONTEXT
+        mock_fetch.return_value = SourceDocument.from_text("http://example.org/", self.SAMPLE_CONTEXT)
 
         with tempfile.TemporaryDirectory() as tmpdir:
             fetcher = OntologyFetcher(Path(tmpdir), use_cache=False)
@@ -313,6 +1274,105 @@ class TestContextMapParser:
             assert any("issuer" in u for u in uris)
             assert any("credentialSubject" in u for u in uris)
 
+    SHARED_CONTEXTS = {
+        "http://example.org/contexts/shared.jsonld": {"@context": {
+            "ex": "http://example.org/terms#",
+            "sec": {"@id": "https://w3id.org/security#"},
+            "proof": "sec:proof",
+        }},
+        "http://example.org/contexts/extra.jsonld": {"@context": [
+            "shared.jsonld",
+            {"nickname": "ex:nickname"},
+        ]},
+    }
+
+    @staticmethod
+    def _context_config(name: str, url: str) -> OntologyConfig:
+        return OntologyConfig(
+            name=name,
+            source_url=url,
+            start_code_point=20000,
+            data_format=DataFormat.JSON_LD,
+            strategy=ProcessingStrategy.CONTEXT_MAP,
+        )
+
+    def test_imported_contexts_are_resolved_once(self):
+        """Remote contexts are loaded once per run and their terms expand imported prefixes."""
+        documents = {
+            **self.SHARED_CONTEXTS,
+            "http://example.org/a.jsonld": {"@context": [
+                "http://example.org/contexts/extra.jsonld",
+                {"homepage": "ex:homepage", "proof": {"@id": "ex:proof"}},
+            ]},
+            "http://example.org/b.jsonld": {"@context": {
+                "@import": "contexts/shared.jsonld",
+                "signature": "sec:signature",
+            }},
+        }
+        fetched = []
+
+        def fetch_source(url, *args, **kwargs):
+            fetched.append(url)
+            return SourceDocument.from_text(url, json.dumps(documents[url]))
+
+        with tempfile.TemporaryDirectory() as tmpdir, \
+                patch.object(OntologyFetcher, 'fetch_source', side_effect=fetch_source):
+            parser = ContextMapParser(OntologyFetcher(Path(tmpdir), use_cache=False))
+            a = {c.label: c.uri for c in parser.parse(self._context_config("a", "http://example.org/a.jsonld"))}
+            b = {c.label: c.uri for c in parser.parse(self._context_config("b", "http://example.org/b.jsonld"))}
+
+        assert a == {
+            "ex": "http://example.org/terms#",
+            "sec": "https://w3id.org/security#",
+            "proof": "http://example.org/terms#proof",
+            "nickname": "http://example.org/terms#nickname",
+            "homepage": "http://example.org/terms#homepage",
+        }
+        assert b["proof"] == "https://w3id.org/security#proof"
+        assert b["signature"] == "https://w3id.org/security#signature"
+        assert sorted(fetched) == sorted(documents)
+
+    def test_imports_are_attributed_to_their_ontology(self):
+        """Imported contexts are fetched for the ontology that imports them and recorded under it."""
+        documents = {
+            **self.SHARED_CONTEXTS,
+            "http://example.org/a.jsonld": {"@context": ["contexts/extra.jsonld", {"homepage": "ex:homepage"}]},
+            "http://example.org/b.jsonld": {"@context": {"@import": "contexts/extra.jsonld#v1"}},
+        }
+        fetched = []
+
+        def fetch_source(url, data_format, ontology_name, **kwargs):
+            fetched.append((url, ontology_name))
+            return SourceDocument.from_text(url, json.dumps(documents[url]))
+
+        with tempfile.TemporaryDirectory() as tmpdir, \
+                patch.object(OntologyFetcher, 'fetch_source', side_effect=fetch_source):
+            parser = ContextMapParser(OntologyFetcher(Path(tmpdir), use_cache=False))
+            a = self._context_config("a", "http://example.org/a.jsonld")
+            b = self._context_config("b", "http://example.org/b.jsonld")
+            parser.parse(a)
+            parser.parse(b)
+
+        assert {name for _, name in fetched} == {"a", "b"}
+        assert ("http://example.org/contexts/shared.jsonld", "a") in fetched
+        imports = ["http://example.org/contexts/extra.jsonld", "http://example.org/contexts/shared.jsonld"]
+        assert parser.imported_sources(a) == imports
+        assert parser.imported_sources(b) == imports
+
+    @patch.object(OntologyFetcher, 'fetch_source')
+    def test_import_cycle(self, mock_fetch):
+        """Contexts that import each other are rejected."""
+        documents = {
+            "http://example.org/a.jsonld": {"@context": ["b.jsonld", {"a": "http://example.org/a"}]},
+            "http://example.org/b.jsonld": {"@context": {"@import": "a.jsonld"}},
+        }
+        mock_fetch.side_effect = lambda url, *args, **kwargs: SourceDocument.from_text(url, json.dumps(documents[url]))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            parser = ContextMapParser(OntologyFetcher(Path(tmpdir), use_cache=False))
+            with pytest.raises(ContextCycleError, match="b.jsonld -> http://example.org/a.jsonld -> http://example.org/b.jsonld"):
+                parser.parse(self._context_config("a", "http://example.org/a.jsonld"))
+
 
 class TestKnownValueAssigner:
     """Tests for KnownValueAssigner."""
@@ -440,6 +1500,413 @@ class TestKnownValueAssigner:
             assert data["statistics"]["code_point_range"]["end"] == 1001
 
 
+class TestStrategyRegistry:
+    """Tests for processing strategies registered by plugins."""
+
+    PLUGIN = """
+from known_value_assigner import Concept, OntologyParser
+
+
+class WordListParser(OntologyParser):
+    def extract(self, source, config):
+        return [Concept(config.uri_filter + word, word, "", "Class") for word in source.read_text().split()]
+"""
+
+    @pytest.fixture
+    def plugin(self, tmp_path, monkeypatch):
+        """Put an unimported plugin module on the path and restore the registry afterwards."""
+        (tmp_path / "kv_word_list_plugin.py").write_text(self.PLUGIN)
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.delitem(sys.modules, "kv_word_list_plugin", raising=False)
+        with patch.dict("known_value_assigner._STRATEGY_PARSERS"):
+            yield "kv_word_list_plugin:WordListParser"
+
+    def _config(self, strategy) -> OntologyConfig:
+        return OntologyConfig(
+            name="words",
+            source_url="http://example.org/words.txt",
+            start_code_point=1000,
+            data_format=DataFormat.TURTLE,
+            strategy=strategy,
+            uri_filter="http://example.org/words#",
+        )
+
+    def test_parsers_are_built_on_demand(self, tmp_path):
+        """Only the parser for a processed ontology's strategy is built."""
+        assigner = KnownValueAssigner(output_dir=tmp_path, cache_dir=tmp_path / "cache")
+        assert assigner._parsers == {}
+
+        config = self._config(ProcessingStrategy.SCHEMA_ORG_LD)
+        parser = assigner.parser_for(config)
+        assert isinstance(parser, SchemaOrgParser)
+        assert assigner.parser_for(config) is parser
+        assert list(assigner._parsers) == ["SchemaOrgLD"]
+
+    @patch.object(OntologyFetcher, 'fetch_source')
+    def test_plugin_is_imported_on_first_use(self, mock_fetch, plugin, tmp_path):
+        """A plugin registered by reference is imported when an ontology uses it."""
+        mock_fetch.return_value = SourceDocument.from_text("http://example.org/words.txt", "gamma alpha beta")
+        register_strategy("WordList", plugin)
+        assigner = KnownValueAssigner(output_dir=tmp_path, cache_dir=tmp_path / "cache", use_cache=False)
+        assert "kv_word_list_plugin" not in sys.modules
+
+        config = self._config("WordList")
+        entries = assigner.process_ontology(config)
+        assert "kv_word_list_plugin" in sys.modules
+        assert [(e.codepoint, e.name) for e in entries] == [
+            (1000, "words:alpha"), (1001, "words:beta"), (1002, "words:gamma"),
+        ]
+
+        json_file, _ = assigner.write_registry(config, entries)
+        data = json.loads(json_file.read_text())
+        assert data["ontology"]["processing_strategy"] == "WordList"
+
+    def test_entry_point_plugins(self, plugin):
+        """Installed entry points provide strategies that were not registered."""
+        from importlib.metadata import EntryPoint
+
+        entry_point = EntryPoint("WordList", plugin, "known_value_assigner.strategies")
+        with patch("importlib.metadata.entry_points", return_value=[entry_point]) as mock_entry_points, \
+                patch("known_value_assigner._strategy_entry_points_loaded", False):
+            parser_class = get_parser_class("WordList")
+            assert parser_class.__name__ == "WordListParser"
+            assert get_parser_class("Missing") is None
+            mock_entry_points.assert_called_once_with(group="known_value_assigner.strategies")
+
+    def test_unknown_strategy(self, tmp_path):
+        """An ontology with an unregistered strategy is not processed."""
+        assigner = KnownValueAssigner(output_dir=tmp_path, cache_dir=tmp_path / "cache")
+        assert assigner.process_ontology(self._config("Missing")) is None
+
+    def test_incomplete_plugin_cannot_be_built(self, tmp_path):
+        """A parser without ``extract`` fails when it is built, not when it first parses."""
+        class Incomplete(OntologyParser):
+            pass
+
+        with patch.dict("known_value_assigner._STRATEGY_PARSERS"):
+            register_strategy("Incomplete", Incomplete)
+            assigner = KnownValueAssigner(output_dir=tmp_path, cache_dir=tmp_path / "cache")
+            with pytest.raises(TypeError, match="abstract method"):
+                assigner.parser_for(self._config("Incomplete"))
+
+    def test_invalid_reference(self):
+        """A parser reference must name a module and a class."""
+        with pytest.raises(ValueError):
+            register_strategy("WordList", "kv_word_list_plugin")
+
+
+class TestStableAssignment:
+    """Tests for stable, append-only codepoint assignment."""
+
+    CONFIG = OntologyConfig(
+        name="zoo",
+        source_url="http://example.org/zoo.rdf",
+        start_code_point=1000,
+        data_format=DataFormat.RDF_XML,
+        strategy=ProcessingStrategy.STANDARD_RDF,
+    )
+
+    @staticmethod
+    def _concepts(*names: str) -> list[Concept]:
+        return [Concept(f"http://example.org/{name}", name, "", "Class") for name in names]
+
+    def _write(self, assigner: KnownValueAssigner, *names: str) -> dict:
+        entries = assigner._assign_known_values(self._concepts(*names), self.CONFIG)
+        json_file, _ = assigner.write_registry(self.CONFIG, entries)
+        return json.loads(json_file.read_text())
+
+    def test_existing_codepoints_are_kept(self, tmp_path):
+        """New concepts are appended and removed ones become tombstones."""
+        assigner = KnownValueAssigner(output_dir=tmp_path, cache_dir=tmp_path / "cache", stable=True)
+        first = self._write(assigner, "Zebra", "Apple", "Mango")
+        assert [(e["codepoint"], e["name"]) for e in first["entries"]] == [
+            (1000, "zoo:Apple"), (1001, "zoo:Mango"), (1002, "zoo:Zebra"),
+        ]
+        assert "tombstones" not in first
+
+        second = self._write(assigner, "Zebra", "Apple", "Aardvark", "Kiwi")
+        assert [(e["codepoint"], e["name"]) for e in second["entries"]] == [
+            (1000, "zoo:Apple"), (1002, "zoo:Zebra"), (1003, "zoo:Aardvark"), (1004, "zoo:Kiwi"),
+        ]
+        assert [(t["codepoint"], t["uri"]) for t in second["tombstones"]] == [(1001, "http://example.org/Mango")]
+        markdown = (tmp_path / "markdown" / "1000_zoo_registry.md").read_text()
+        assert "## Retired Codepoints" in markdown
+        assert "| 1001 | `zoo:Mango` | http://example.org/Mango |" in markdown
+
+        # A returning concept gets its old codepoint back; retired codepoints are never reused
+        third = self._write(assigner, "Zebra", "Apple", "Aardvark", "Mango", "Banana")
+        assert {e["name"]: e["codepoint"] for e in third["entries"]} == {
+            "zoo:Apple": 1000, "zoo:Mango": 1001, "zoo:Zebra": 1002, "zoo:Aardvark": 1003, "zoo:Banana": 1005,
+        }
+        assert [t["codepoint"] for t in third["tombstones"]] == [1004]
+
+    def test_codepoint_of_a_uri_moved_to_core_stays_retired(self, tmp_path):
+        """A codepoint given up for a core override is retired, not reused, and returns with its URI."""
+        assigner = KnownValueAssigner(output_dir=tmp_path, cache_dir=tmp_path / "cache", stable=True)
+        self._write(assigner, "a", "b", "c")
+
+        assigner.bc_uri_to_codepoint["http://example.org/c"] = (5, "c")
+        second = self._write(assigner, "a", "b", "c")
+        assert [(e["codepoint"], e["name"]) for e in second["entries"]] == [(5, "c"), (1000, "zoo:a"), (1001, "zoo:b")]
+        assert [(t["codepoint"], t["uri"]) for t in second["tombstones"]] == [(1002, "http://example.org/c")]
+
+        third = self._write(assigner, "a", "b", "c", "d")
+        assert {e["name"]: e["codepoint"] for e in third["entries"]} == {
+            "c": 5, "zoo:a": 1000, "zoo:b": 1001, "zoo:d": 1003,
+        }
+        assert [t["codepoint"] for t in third["tombstones"]] == [1002]
+
+        # Core drops the URI again, and it takes back its own codepoint
+        del assigner.bc_uri_to_codepoint["http://example.org/c"]
+        fourth = self._write(assigner, "a", "b", "c", "d")
+        assert {e["name"]: e["codepoint"] for e in fourth["entries"]} == {
+            "zoo:a": 1000, "zoo:b": 1001, "zoo:c": 1002, "zoo:d": 1003,
+        }
+        assert "tombstones" not in fourth
+
+    def test_default_mode_renumbers(self, tmp_path):
+        """Without stable mode, assignment ignores the existing registry."""
+        stable = KnownValueAssigner(output_dir=tmp_path, cache_dir=tmp_path / "cache", stable=True)
+        self._write(stable, "Zebra", "Apple")
+
+        assigner = KnownValueAssigner(output_dir=tmp_path, cache_dir=tmp_path / "cache")
+        registry = self._write(assigner, "Zebra", "Apple", "Aardvark")
+        assert [e["codepoint"] for e in registry["entries"]] == [1000, 1001, 1002]
+        assert registry["entries"][0]["name"] == "zoo:Aardvark"
+
+    def test_unreadable_lockfile(self, tmp_path):
+        """A corrupt existing registry stops stable assignment instead of renumbering."""
+        assigner = KnownValueAssigner(output_dir=tmp_path, cache_dir=tmp_path / "cache", stable=True)
+        json_file, _ = assigner._registry_paths(self.CONFIG)
+        json_file.parent.mkdir(parents=True)
+        json_file.write_text("{not json")
+        with pytest.raises(ValueError, match="stable assignment"):
+            assigner._assign_known_values(self._concepts("Apple"), self.CONFIG)
+
+
+class TestCodepointRanges:
+    """Tests for the codepoint range map across registries."""
+
+    @staticmethod
+    def _registry(json_dir: Path, start: int, name: str, codepoints: list[int]) -> None:
+        json_dir.mkdir(parents=True, exist_ok=True)
+        data = {
+            "ontology": {"name": name, "start_code_point": start},
+            "entries": [{"codepoint": c, "name": f"{name}:{c}", "uri": f"http://example.org/{name}/{c}"}
+                        for c in codepoints],
+        }
+        (json_dir / f"{start}_{name}_registry.json").write_text(json.dumps(data))
+
+    def test_ranges_overlaps_headroom_and_gaps(self, tmp_path):
+        """Ranges come from the entries, excluding codepoints reused from below the start."""
+        self._registry(tmp_path, 0, "core", [0, 1, 2, 50])
+        self._registry(tmp_path, 100, "a", [1, 100, 101, 150])
+        self._registry(tmp_path, 140, "b", [140, 141])
+        self._registry(tmp_path, 300, "c", [])
+
+        range_map = CodepointRangeMap.from_directory(tmp_path)
+
+        assert [(r.registry, r.start, r.end, r.used) for r in range_map.ranges] == [
+            ("0_core_registry", 0, 50, 4),
+            ("100_a_registry", 100, 150, 3),
+            ("140_b_registry", 140, 141, 2),
+            ("300_c_registry", 300, 300, 0),
+        ]
+        assert [(a.registry, b.registry) for a, b in range_map.overlaps()] == [("100_a_registry", "140_b_registry")]
+        assert range_map.headroom() == {
+            "0_core_registry": 49,
+            "100_a_registry": 0,
+            "140_b_registry": 158,
+            "300_c_registry": None,
+        }
+        assert range_map.gaps(limit=2) == [(151, 299), (51, 99)]
+
+    def test_headroom_skips_ranges_with_the_same_start(self):
+        """Headroom runs to the next range that starts later, not to one sharing the start."""
+        range_map = CodepointRangeMap([
+            CodepointRange("b", 100, 120, 21),
+            CodepointRange("a", 100, 110, 11),
+            CodepointRange("c", 200, 205, 6),
+            CodepointRange("d", 200, 250, 51),
+        ])
+        assert range_map.headroom() == {"a": 89, "b": 79, "c": None, "d": None}
+
+    def test_conflicts(self):
+        """Only ranges of other registries that intersect are conflicts."""
+        range_map = CodepointRangeMap([
+            CodepointRange("a", 100, 199, 100),
+            CodepointRange("b", 300, 399, 100),
+        ])
+        assert range_map.conflicts(CodepointRange("c", 200, 299, 100)) == []
+        assert [r.registry for r in range_map.conflicts(CodepointRange("c", 150, 320, 5))] == ["a", "b"]
+        assert range_map.conflicts(CodepointRange("a", 100, 250, 151)) == []
+
+        range_map.add(CodepointRange("a", 100, 250, 151))
+        assert [r.end for r in range_map.ranges] == [250, 399]
+
+    def test_range_end_excludes_core_overrides(self, tmp_path):
+        """The written range ends at the last codepoint assigned from the ontology's own range."""
+        self._write_core_registry(tmp_path)
+        assigner = KnownValueAssigner(output_dir=tmp_path, cache_dir=tmp_path / "cache")
+        config = OntologyConfig(
+            name="rng",
+            source_url="http://example.org/rng.rdf",
+            start_code_point=1000,
+            data_format=DataFormat.RDF_XML,
+            strategy=ProcessingStrategy.STANDARD_RDF,
+        )
+        concepts = [Concept(f"http://example.org/{n}", n, "", "Class") for n in ["a", "b", "core"]]
+        entries = assigner._assign_known_values(concepts, config)
+        assert sorted(e.codepoint for e in entries) == [5, 1000, 1001]
+
+        json_file, _ = assigner.write_registry(config, entries)
+        registry = json.loads(json_file.read_text())
+        assert registry["statistics"]["code_point_range"] == {"start": 1000, "end": 1001}
+
+    def test_overlapping_registry_is_refused(self, tmp_path):
+        """A registry that would run into the next range is not written."""
+        self._registry(tmp_path / "json", 1002, "next", [1002])
+        assigner = KnownValueAssigner(output_dir=tmp_path, cache_dir=tmp_path / "cache")
+        config = OntologyConfig(
+            name="grow",
+            source_url="http://example.org/grow.rdf",
+            start_code_point=1000,
+            data_format=DataFormat.RDF_XML,
+            strategy=ProcessingStrategy.STANDARD_RDF,
+        )
+        concepts = [Concept(f"http://example.org/{n}", n, "", "Class") for n in ["a", "b", "c"]]
+        entries = assigner._assign_known_values(concepts, config)
+
+        with pytest.raises(CodepointOverlapError, match="1002_next_registry"):
+            assigner.write_registry(config, entries)
+        assert not (tmp_path / "json" / "1000_grow_registry.json").exists()
+
+        # Rewriting a registry never conflicts with its own previous range
+        json_file, _ = assigner.write_registry(config, entries[:2])
+        assert assigner.write_registry(config, entries[:2])[0] == json_file
+
+    @staticmethod
+    def _write_core_registry(output_dir: Path) -> None:
+        json_dir = output_dir / "json"
+        json_dir.mkdir(parents=True)
+        (json_dir / "0_blockchain_commons_registry.json").write_text(json.dumps({
+            "ontology": {"name": "blockchain_commons", "start_code_point": 0},
+            "entries": [{"codepoint": 5, "name": "core", "uri": "http://example.org/core"}],
+        }))
+
+
+class TestKnownValueIndex:
+    """Tests for the Known Value index shared by the assigner and the community scripts."""
+
+    @staticmethod
+    def _registries(json_dir: Path) -> None:
+        json_dir.mkdir(parents=True, exist_ok=True)
+        (json_dir / "0_core_registry.json").write_text(json.dumps({
+            "ontology": {"name": "core", "start_code_point": 0},
+            "entries": [{"codepoint": 1, "name": "isA", "type": "property", "uri": "http://example.org/type"}],
+        }))
+        (json_dir / "100_a_registry.json").write_text(json.dumps({
+            "ontology": {"name": "a", "start_code_point": 100},
+            "entries": [
+                {"codepoint": 1, "name": "isA", "type": "property", "uri": "http://example.org/type"},
+                {"codepoint": 100, "name": "a:Thing", "type": "class", "uri": "http://example.org/a/Thing"},
+                {"codepoint": 101, "name": "a:local", "type": "constant"},
+            ],
+            "tombstones": [{"codepoint": 102, "name": "a:Gone"}],
+        }))
+        (json_dir / "1000_broken_registry.json").write_text("{")
+
+    def test_lookups_resolve_reused_values_to_their_owner(self, tmp_path):
+        """Values reused from a lower registry are reported as that registry's."""
+        self._registries(tmp_path)
+        index = KnownValueIndex.from_directory(tmp_path)
+
+        assert list(index.registries) == ["0_core_registry", "100_a_registry"]
+        assert len(index) == 3
+        assert index.by_codepoint[1].registry == "0_core_registry"
+        assert index.by_uri["http://example.org/type"].name == "isA"
+        assert index.by_name["a:Thing"].type == "class"
+        assert index.lookup_codepoints([100, 102, 5]).keys() == {100}
+        assert index.lookup_names(["a:local", "missing"])["a:local"].uri == ""
+        assert index.lookup_uris(["http://example.org/a/Thing"])["http://example.org/a/Thing"].codepoint == 100
+        assert [v.codepoint for v in index.values("100_a_registry")] == [1, 100, 101]
+        assert index.registries["100_a_registry"].tombstones == (102,)
+
+    def test_subset_keeps_only_the_given_registries(self, tmp_path):
+        """A subset sees a registry's own values, reused ones included, and nothing from the others."""
+        self._registries(tmp_path)
+        subset = KnownValueIndex.from_directory(tmp_path).subset("100_a_registry", "missing")
+        assert list(subset.registries) == ["100_a_registry"]
+        assert subset.by_codepoint[1].registry == "100_a_registry"
+        assert subset.lookup_names(["a:Thing", "isA"]).keys() == {"a:Thing", "isA"}
+
+    def test_add_registry_replaces_previous_content(self, tmp_path):
+        self._registries(tmp_path)
+        index = KnownValueIndex.from_directory(tmp_path)
+        index.add_registry("100_a_registry", {
+            "ontology": {"name": "a", "start_code_point": 100},
+            "entries": [{"codepoint": 103, "name": "a:New"}],
+        })
+        assert 100 not in index.by_codepoint
+        assert index.by_name["a:New"].codepoint == 103
+        assert index.by_codepoint[1].registry == "0_core_registry"
+
+    def test_snapshot_is_reused_until_a_registry_changes(self, tmp_path):
+        json_dir = tmp_path / "json"
+        snapshot = tmp_path / "cache" / KnownValueIndex.SNAPSHOT_FILENAME
+        self._registries(json_dir)
+        index = KnownValueIndex.from_directory(json_dir, snapshot=snapshot)
+        assert snapshot.exists()
+
+        with patch("known_value_index.IndexedRegistry.of_registry") as of_registry:
+            reloaded = KnownValueIndex.from_directory(json_dir, snapshot=snapshot)
+        of_registry.assert_not_called()
+        assert reloaded.by_codepoint == index.by_codepoint
+        assert reloaded.registries == index.registries
+
+        (json_dir / "0_core_registry.json").write_text(json.dumps({
+            "ontology": {"name": "core", "start_code_point": 0},
+            "entries": [{"codepoint": 2, "name": "id"}],
+        }))
+        rebuilt = KnownValueIndex.from_directory(json_dir, snapshot=snapshot)
+        assert rebuilt.by_codepoint[2].name == "id"
+        assert rebuilt.by_codepoint[1].registry == "100_a_registry"
+
+    def test_binary_registry_matches_index(self, tmp_path):
+        """Every codepoint reads back from the binary registry as the index holds it."""
+        self._registries(tmp_path / "json")
+        index = KnownValueIndex.from_directory(tmp_path / "json")
+        index.add_registry("50_text_registry", {
+            "ontology": {"name": "text", "start_code_point": 50},
+            "entries": [{"codepoint": 50, "name": "café", "type": "class", "description": "Ünïcode | text"},
+                        {"codepoint": 51, "name": "a:Thing2", "type": "class", "description": "Ünïcode | text"}],
+        })
+        path = tmp_path / "binary" / BinaryRegistry.FILENAME
+        index.save_binary(path)
+
+        with BinaryRegistry(path) as binary:
+            assert len(binary) == len(index) == 5
+            for codepoint, value in index.by_codepoint.items():
+                assert binary.lookup(codepoint) == value
+            assert binary.name(50) == "café"
+            assert binary.find(2) == -1 and 102 not in binary
+            assert binary.lookup(10 ** 18) is None
+            assert binary.registries() == [
+                ("0_core_registry", "core", 0, 1, 1),
+                ("50_text_registry", "text", 50, 51, 2),
+                ("100_a_registry", "a", 100, 102, 3),
+            ]
+
+    def test_binary_registry_rejects_other_files(self, tmp_path):
+        path = tmp_path / "registry.json"
+        path.write_text(json.dumps({"entries": []}) * 10)
+        with pytest.raises(ValueError, match="not a version 1 binary Known Value registry"):
+            BinaryRegistry(path)
+        path.write_bytes(b"KNOWNVAL")
+        with pytest.raises(ValueError, match="not a binary Known Value registry"):
+            BinaryRegistry(path)
+
+
 class TestCollisionDetection:
     """Tests for semantic collision detection with core Known Values."""
 
@@ -527,10 +1994,10 @@ class TestSchemaOrgParser:
         ]
     })
 
-    @patch.object(OntologyFetcher, 'fetch')
+    @patch.object(OntologyFetcher, 'fetch_source')
     def test_parse_schema_org(self, mock_fetch):
         """Test parsing Schema.org JSON-LD."""
-        mock_fetch.return_value = self.SAMPLE_SCHEMA_ORG
+        mock_fetch.return_value = SourceDocument.from_text("http://example.org/", self.SAMPLE_SCHEMA_ORG)
 
         with tempfile.TemporaryDirectory() as tmpdir:
             fetcher = OntologyFetcher(Path(tmpdir), use_cache=False)
@@ -549,6 +2016,56 @@ class TestSchemaOrgParser:
             # Should find Person, name, and OldThing
             assert len(concepts) >= 2
 
+    def _parse_both(self, document: dict):
+        config = get_ontology_by_id("schema")
+        source = SourceDocument.from_text(config.source_url, json.dumps(document))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            parser = SchemaOrgParser(OntologyFetcher(Path(tmpdir), use_cache=False))
+            return parser._extract_json(json.loads(source.read_text()), config), \
+                parser._extract_rdflib(source, config)
+
+    def test_fast_path_matches_rdflib(self):
+        """The JSON fast path yields the same concepts as rdflib JSON-LD parsing."""
+        document = json.loads(self.SAMPLE_SCHEMA_ORG)
+        document["@graph"] += [
+            {"@id": "schema:Text", "@type": ["schema:DataType", "rdfs:Class"],
+             "rdfs:label": [{"@language": "en", "@value": "Text"}, "Texte"]},
+            {"@id": "schema:url", "@type": "rdf:Property", "rdfs:comment": None,
+             "schema:domainIncludes": [{"@id": "schema:Thing"}, {"@id": "schema:Person"}]},
+            {"@id": "schema:Person", "rdfs:comment": "Duplicate node, later comment"},
+            {"@id": "_:b0", "@type": "rdfs:Class", "rdfs:label": "Anonymous"},
+            {"@id": "http://example.org/Other", "@type": "rdfs:Class", "rdfs:label": "Filtered"},
+        ]
+        fast, slow = self._parse_both(document)
+        assert fast is not None
+        assert fast == slow
+        assert [c.label for c in fast][:2] == ["Person", "OldThing"]
+
+    def test_fast_path_used_for_plain_dump(self):
+        """A plain dump is never handed to rdflib."""
+        config = get_ontology_by_id("schema")
+        source = SourceDocument.from_text(config.source_url, self.SAMPLE_SCHEMA_ORG)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            parser = SchemaOrgParser(OntologyFetcher(Path(tmpdir), use_cache=False))
+            with patch.object(SchemaOrgParser, "_extract_rdflib", side_effect=AssertionError("rdflib used")):
+                assert len(parser.extract(source, config)) == 3
+
+    def test_unrecognised_json_ld_falls_back_to_rdflib(self):
+        """Documents using other JSON-LD features are parsed by rdflib."""
+        document = json.loads(self.SAMPLE_SCHEMA_ORG)
+        document["@context"]["@vocab"] = "https://schema.org/"
+        fast, slow = self._parse_both(document)
+        assert fast is None
+        assert {c.uri for c in slow} == {
+            "https://schema.org/Person", "https://schema.org/name", "https://schema.org/OldThing",
+        }
+
+        nested = json.loads(self.SAMPLE_SCHEMA_ORG)
+        nested["@graph"][0]["schema:hasPart"] = {"@id": "schema:Part", "@type": "rdfs:Class"}
+        fast, slow = self._parse_both(nested)
+        assert fast is None
+        assert "https://schema.org/Part" in {c.uri for c in slow}
+
 
 class TestJSONOutputSchema:
     """Tests to validate JSON output matches expected schema."""